@@ -49,6 +49,7 @@ class Settings(BaseSettings):
     qdrant_api_key: Optional[str] = Field(default=None, alias="QDRANT_API_KEY")
     qdrant_collection_name: str = Field(default="documents", alias="QDRANT_COLLECTION_NAME")
     qdrant_vector_size: int = Field(default=1536, alias="QDRANT_VECTOR_SIZE")
+    qdrant_int8_quantization: bool = Field(default=True, alias="QDRANT_INT8_QUANTIZATION")
     
     # Kafka Settings
     kafka_bootstrap_servers: str = Field(alias="KAFKA_BOOTSTRAP_SERVERS")
@@ -414,6 +414,15 @@ def get_motor_database():
     return mock_db
 
 
+def _get_shared_qdrant_client():
+    """qdrant_manager 가 관리하는 공유 Qdrant 클라이언트 반환 (첫 요청 시 초기화)"""
+    from src.core.config import get_settings
+    from src.infrastructure.vectordb.qdrant_client import qdrant_manager
+    
+    qdrant_manager.initialize(get_settings())
+    return qdrant_manager.client
+
+
 def setup_dependencies():
     """의존성 설정"""
     from src.core.config import get_settings
@@ -424,7 +433,7 @@ def setup_dependencies():
     # 기본 인프라 등록
     _container.register_factory(get_settings, lambda: get_settings())
     _container.register_factory(MongoDBClient, lambda: MongoDBClient(get_settings()))
-    _container.register_factory(QdrantClient, lambda: QdrantClient(get_settings()))
+    _container.register_factory(QdrantClient, _get_shared_qdrant_client)
     _container.register_factory(KafkaManager, lambda: KafkaManager())
     
     # Monitor 모듈 의존성 등록
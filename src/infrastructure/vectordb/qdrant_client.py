@@ -86,9 +86,15 @@ class QdrantClient(LoggerMixin):
         collection_name: str,
         vector_size: int,
         distance: Distance = Distance.COSINE,
-        force_recreate: bool = False
+        force_recreate: bool = False,
+        quantization_config: Optional[models.QuantizationConfig] = None,
+        on_disk: Optional[bool] = None
     ) -> bool:
-        """컬렉션 생성"""
+        """컬렉션 생성
+
+        quantization_config 를 지정하면 양자화된 벡터로 검색하고,
+        on_disk=True 이면 원본 float32 벡터는 디스크에 둡니다.
+        """
         try:
             # 기존 컬렉션 확인
             collections = await asyncio.to_thread(self.client.get_collections)
@@ -117,15 +123,18 @@ class QdrantClient(LoggerMixin):
                 collection_name=collection_name,
                 vectors_config=VectorParams(
                     size=vector_size,
-                    distance=distance
-                )
+                    distance=distance,
+                    on_disk=on_disk
+                ),
+                quantization_config=quantization_config
             )
             
             self.logger.info(
                 "컬렉션 생성 완료",
                 collection=collection_name,
                 vector_size=vector_size,
-                distance=distance.value
+                distance=distance.value,
+                quantized=quantization_config is not None
             )
             return True
             
@@ -402,11 +411,14 @@ async def initialize_qdrant_collections(settings: Settings) -> None:
     try:
         client = qdrant_manager.client
         
-        # 기본 컬렉션 생성
+        # 기본 컬렉션 생성 (int8 양자화 시 원본 벡터는 디스크, 양자화 벡터는 RAM)
+        quantize = settings.qdrant_int8_quantization
         await client.create_collection(
             collection_name=settings.qdrant_collection_name,
             vector_size=settings.qdrant_vector_size,
-            distance=Distance.COSINE
+            distance=Distance.COSINE,
+            quantization_config=create_int8_quantization_config() if quantize else None,
+            on_disk=True if quantize else None
         )
         
         logger.info("Qdrant 컬렉션 초기화 완료")
@@ -430,6 +442,17 @@ async def get_qdrant_client() -> QdrantClient:
     return qdrant_manager.client
 
 
+def create_int8_quantization_config(quantile: float = 0.99) -> models.ScalarQuantization:
+    """int8 스칼라 양자화 설정 생성 (양자화 벡터는 항상 RAM 에 유지)"""
+    return models.ScalarQuantization(
+        scalar=models.ScalarQuantizationConfig(
+            type=models.ScalarType.INT8,
+            quantile=quantile,
+            always_ram=True
+        )
+    )
+
+
 def create_point_struct(
     point_id: Union[str, int],
     vector: List[float],
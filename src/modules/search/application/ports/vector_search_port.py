@@ -5,7 +5,7 @@ Vector Search Port
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
 from uuid import UUID
 
 from src.modules.search.domain.entities import SearchQuery, SearchResult
@@ -108,6 +108,24 @@ class VectorSearchPort(ABC):
         """
         pass
     
+    @abstractmethod
+    async def get_chunks_by_ids(
+        self,
+        chunk_ids: Sequence[UUID],
+        user_id: Optional[UUID] = None
+    ) -> List[SearchResult]:
+        """
+        여러 청크를 한 번의 요청으로 조회
+        
+        Args:
+            chunk_ids: 청크 ID 목록
+            user_id: 사용자 ID (권한 확인용)
+            
+        Returns:
+            조회된 청크 리스트 (존재하지 않는 ID 는 제외)
+        """
+        pass
+    
     @abstractmethod
     async def get_chunks_by_document(
         self,
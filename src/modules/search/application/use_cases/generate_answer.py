@@ -6,6 +6,7 @@ Generate Answer Use Case
 
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 
@@ -15,6 +16,39 @@ from src.modules.search.domain.entities import (
 )
 from src.modules.search.application.ports.llm_port import LLMPort
 
+# 사용자 프롬프트의 고정 접두부 (LLM 제공자 프롬프트 캐시가 적중하도록 가변 내용보다 앞에 둠)
+_USER_PROMPT_PREFIX = "다음 문서들을 참고하여 질문에 답변해 주세요:\n\n=== 참고 문서 ===\n"
+
+# 답변 제안 규칙: (질문 유형 트리거, 제안 템플릿)
+_SUGGESTION_RULES = (
+    (("어떻게", "방법"), ("{query}에 대한 단계별 가이드", "{query}의 모범 사례")),
+    (("무엇", "뭐"), ("{query}의 정의와 개념", "{query}의 종류와 특징")),
+    (("왜", "이유"), ("{query}의 배경과 원인", "{query}의 장단점")),
+)
+_MAX_SUGGESTIONS = 3
+
+
+@lru_cache(maxsize=32)
+def _default_system_prompt(language: str, include_sources: bool) -> str:
+    """기본 시스템 프롬프트 (언어/출처 표시 여부별로 한 번만 생성)"""
+    base_prompt = """당신은 문서 검색 시스템의 AI 어시스턴트입니다. 
+주어진 문서 내용을 바탕으로 사용자의 질문에 정확하고 도움이 되는 답변을 제공해야 합니다.
+
+지침:
+1. 제공된 문서 내용만을 기반으로 답변하세요
+2. 문서에 없는 정보는 추측하지 마세요
+3. 답변이 불확실한 경우 그렇다고 명시하세요
+4. 가능한 한 구체적이고 상세한 답변을 제공하세요
+5. 답변은 한국어로 작성하세요"""
+    
+    if include_sources:
+        base_prompt += "\n6. 답변 끝에 참고한 문서 출처를 명시하세요"
+    
+    if language != "ko":
+        base_prompt = base_prompt.replace("한국어", language)
+    
+    return base_prompt
+
 
 @dataclass
 class GenerateAnswerCommand:
@@ -29,6 +63,33 @@ class GenerateAnswerCommand:
     system_prompt: Optional[str] = None
     include_sources: bool = True
     language: str = "ko"
+    
+    def __post_init__(self):
+        """생성 시점 검증 (잘못된 명령은 비동기 실행 경로에 들어가기 전에 거부)"""
+        self.validate()
+    
+    def validate(self) -> None:
+        """명령 검증"""
+        if not self.user_id:
+            raise ValidationError("User ID is required")
+        
+        if not self.query_text or not self.query_text.strip():
+            raise ValidationError("Query text is required")
+        
+        if len(self.query_text) > 1000:
+            raise ValidationError("Query text is too long (max 1000 characters)")
+        
+        if not self.context_chunks:
+            raise ValidationError("Context chunks are required")
+        
+        if len(self.context_chunks) > 20:
+            raise ValidationError("Too many context chunks (max 20)")
+        
+        if self.max_tokens <= 0 or self.max_tokens > 4000:
+            raise ValidationError("Max tokens must be between 1 and 4000")
+        
+        if not 0.0 <= self.temperature <= 2.0:
+            raise ValidationError("Temperature must be between 0.0 and 2.0")
 
 
 @dataclass
@@ -53,8 +114,8 @@ class GenerateAnswerUseCase:
         start_time = time.time()
         
         try:
-            # 1. 입력 검증
-            self._validate_command(command)
+            # 1. 입력 검증 (생성 후 변경된 명령도 LLM 호출 전에 거부)
+            command.validate()
             
             # 2. 답변 요청 생성
             answer_request = self._create_answer_request(command)
@@ -76,29 +137,6 @@ class GenerateAnswerUseCase:
         except Exception as e:
             raise SearchError(f"Answer generation failed: {str(e)}") from e
     
-    def _validate_command(self, command: GenerateAnswerCommand) -> None:
-        """명령 검증"""
-        if not command.user_id:
-            raise ValidationError("User ID is required")
-        
-        if not command.query_text or not command.query_text.strip():
-            raise ValidationError("Query text is required")
-        
-        if len(command.query_text) > 1000:
-            raise ValidationError("Query text is too long (max 1000 characters)")
-        
-        if not command.context_chunks:
-            raise ValidationError("Context chunks are required")
-        
-        if len(command.context_chunks) > 20:
-            raise ValidationError("Too many context chunks (max 20)")
-        
-        if command.max_tokens <= 0 or command.max_tokens > 4000:
-            raise ValidationError("Max tokens must be between 1 and 4000")
-        
-        if not 0.0 <= command.temperature <= 2.0:
-            raise ValidationError("Temperature must be between 0.0 and 2.0")
-    
     def _create_answer_request(self, command: GenerateAnswerCommand) -> AnswerRequest:
         """답변 요청 생성"""
         return AnswerRequest.create(
@@ -116,40 +154,19 @@ class GenerateAnswerUseCase:
         if command.system_prompt:
             return command.system_prompt
         
-        base_prompt = """당신은 문서 검색 시스템의 AI 어시스턴트입니다. 
-주어진 문서 내용을 바탕으로 사용자의 질문에 정확하고 도움이 되는 답변을 제공해야 합니다.
-
-지침:
-1. 제공된 문서 내용만을 기반으로 답변하세요
-2. 문서에 없는 정보는 추측하지 마세요
-3. 답변이 불확실한 경우 그렇다고 명시하세요
-4. 가능한 한 구체적이고 상세한 답변을 제공하세요
-5. 답변은 한국어로 작성하세요"""
-        
-        if command.include_sources:
-            base_prompt += "\n6. 답변 끝에 참고한 문서 출처를 명시하세요"
-        
-        if command.language != "ko":
-            base_prompt = base_prompt.replace("한국어", command.language)
-        
-        return base_prompt
+        return _default_system_prompt(command.language, command.include_sources)
     
     def _build_user_prompt(self, command: GenerateAnswerCommand) -> str:
-        """사용자 프롬프트 생성"""
+        """사용자 프롬프트 생성 (고정 접두부 → 참고 문서 → 질문 순)"""
         # 컨텍스트 문서 정리
         context_text = self._format_context_chunks(command.context_chunks)
         
-        prompt = f"""다음 문서들을 참고하여 질문에 답변해 주세요:
-
-=== 참고 문서 ===
-{context_text}
+        return f"""{_USER_PROMPT_PREFIX}{context_text}
 
 === 질문 ===
 {command.query_text}
 
 === 답변 ==="""
-        
-        return prompt
     
     def _format_context_chunks(self, chunks: List[SearchResult]) -> str:
         """컨텍스트 청크 포맷팅"""
@@ -184,7 +201,8 @@ class GenerateAnswerUseCase:
         if not context_chunks:
             return 0.0
         
-        avg_chunk_score = sum(chunk.score for chunk in context_chunks) / len(context_chunks)
+        # 청크 수가 최대 20개이므로 NumPy 보다 리스트 합산이 빠름
+        avg_chunk_score = sum([chunk.score for chunk in context_chunks]) / len(context_chunks)
         
         # 컨텍스트 청크 수에 따른 보정
         chunk_count_factor = min(len(context_chunks) / 5, 1.0)  # 5개 기준으로 정규화
@@ -199,24 +217,17 @@ class GenerateAnswerUseCase:
         user_id: UUID, 
         query_text: str
     ) -> List[str]:
-        """답변 제안 생성"""
-        # 간단한 제안 생성 로직
+        """답변 제안 생성 (LLM 호출 없이 질문 유형 규칙만 사용)"""
         suggestions = []
         
-        # 질문 유형에 따른 제안
-        if "어떻게" in query_text or "방법" in query_text:
-            suggestions.append(f"{query_text}에 대한 단계별 가이드")
-            suggestions.append(f"{query_text}의 모범 사례")
+        # 질문 유형에 따른 제안 (최대 개수에 도달하면 중단)
+        for triggers, templates in _SUGGESTION_RULES:
+            if any(trigger in query_text for trigger in triggers):
+                suggestions.extend(template.format(query=query_text) for template in templates)
+                if len(suggestions) >= _MAX_SUGGESTIONS:
+                    break
         
-        if "무엇" in query_text or "뭐" in query_text:
-            suggestions.append(f"{query_text}의 정의와 개념")
-            suggestions.append(f"{query_text}의 종류와 특징")
-        
-        if "왜" in query_text or "이유" in query_text:
-            suggestions.append(f"{query_text}의 배경과 원인")
-            suggestions.append(f"{query_text}의 장단점")
-        
-        return suggestions[:3]  # 최대 3개 제안
+        return suggestions[:_MAX_SUGGESTIONS]
     
     async def regenerate_answer(
         self,
@@ -226,19 +237,22 @@ class GenerateAnswerUseCase:
     ) -> GenerateAnswerResult:
         """답변 재생성"""
         # 새로운 명령 생성
-        new_command = GenerateAnswerCommand(
-            user_id=original_command.user_id,
-            query_text=original_command.query_text,
-            context_chunks=original_command.context_chunks,
-            model_name=original_command.model_name,
-            max_tokens=original_command.max_tokens,
-            temperature=new_temperature or original_command.temperature + 0.1,
-            system_prompt=self._build_regeneration_prompt(
-                original_command.system_prompt, feedback
-            ),
-            include_sources=original_command.include_sources,
-            language=original_command.language
-        )
+        try:
+            new_command = GenerateAnswerCommand(
+                user_id=original_command.user_id,
+                query_text=original_command.query_text,
+                context_chunks=original_command.context_chunks,
+                model_name=original_command.model_name,
+                max_tokens=original_command.max_tokens,
+                temperature=new_temperature or original_command.temperature + 0.1,
+                system_prompt=self._build_regeneration_prompt(
+                    original_command.system_prompt, feedback
+                ),
+                include_sources=original_command.include_sources,
+                language=original_command.language
+            )
+        except ValidationError as e:
+            raise SearchError(f"Answer generation failed: {str(e)}") from e
         
         return await self.execute(new_command)
     
@@ -248,13 +262,7 @@ class GenerateAnswerUseCase:
         feedback: str
     ) -> str:
         """재생성용 프롬프트 생성"""
-        base_prompt = original_prompt or self._build_system_prompt(
-            GenerateAnswerCommand(
-                user_id=UUID("00000000-0000-0000-0000-000000000000"),
-                query_text="",
-                context_chunks=[]
-            )
-        )
+        base_prompt = original_prompt or _default_system_prompt("ko", True)
         
         regeneration_instruction = f"""
 
@@ -284,9 +292,11 @@ class GenerateAnswerUseCase:
         
         # 관련성 평가 (키워드 매칭)
         if expected_keywords:
+            # 답변 소문자 변환은 키워드마다 반복하지 않고 한 번만 수행
+            normalized_answer = answer.answer_text.lower()
             matched_keywords = sum(
                 1 for keyword in expected_keywords 
-                if keyword.lower() in answer.answer_text.lower()
+                if keyword.lower() in normalized_answer
             )
             evaluation["relevance"] = matched_keywords / len(expected_keywords)
         else:
@@ -79,9 +79,9 @@ class SearchQuery:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
-    """검색 결과 항목"""
+    """검색 결과 항목 (병합/재랭킹 시 대량 생성되므로 __slots__ 사용)"""
     
     chunk_id: UUID
     document_id: UUID
@@ -4,10 +4,17 @@ Vector Database Implementation
 Qdrant를 활용한 벡터 검색 구현
 """
 
+import asyncio
+import copy
 import logging
-from typing import List, Optional, Dict, Any
+import time
+from functools import wraps
+from typing import Awaitable, Callable, List, Optional, Dict, Any, Sequence, TypeVar, Union
 from uuid import UUID
 
+import numpy as np
+from qdrant_client.http.models import ScalarQuantization
+
 from src.infrastructure.vectordb.qdrant_client import QdrantClient
 from src.modules.search.application.ports.vector_search_port import VectorSearchPort
 from src.modules.search.domain.entities import SearchResult
@@ -15,6 +22,120 @@ from src.core.exceptions import SearchError
 
 logger = logging.getLogger(__name__)
 
+FilterBuilder = Callable[[str, Any], Dict[str, Any]]
+
+SelfT = TypeVar("SelfT")
+CachedMethod = Callable[[SelfT], Awaitable[Dict[str, Any]]]
+
+# 검색 필터로 자주 쓰이며 Qdrant payload 인덱스가 있어야 하는 필드
+_INDEXED_FILTER_FIELDS = ("source", "page")
+
+# 페이지 범위 검색에서 허용하는 연산자
+_RANGE_OPERATORS = ("gte", "lte", "gt", "lt")
+
+
+def _match_condition(key: str, value: Any) -> Dict[str, Any]:
+    """정확한 값 매칭 조건"""
+    return {"key": key, "match": {"value": value}}
+
+
+def _page_condition(key: str, value: Any) -> Dict[str, Any]:
+    """페이지 조건 (범위 dict 예: {"gte": 1, "lte": 10} 또는 정확한 값)"""
+    if isinstance(value, dict):
+        return {
+            "key": "page",
+            "range": {op: value[op] for op in _RANGE_OPERATORS if op in value}
+        }
+    return _match_condition("page", value)
+
+
+# 필터 키 → 조건 빌더 디스패치 테이블
+_FILTER_BUILDERS: Dict[str, FilterBuilder] = {
+    "document_id": lambda key, value: _match_condition("document_id", str(value)),
+    "source": _match_condition,
+    "page": _page_condition,
+    "created_after": lambda key, value: {"key": "created_at", "range": {"gte": value}},
+    "created_before": lambda key, value: {"key": "created_at", "range": {"lte": value}},
+}
+
+
+def _describe_quantization(quantization_config: Any) -> Optional[str]:
+    """컬렉션 양자화 설정 요약 (예: "int8"), 미설정 시 None"""
+    if isinstance(quantization_config, ScalarQuantization):
+        scalar_type = quantization_config.scalar.type
+        return getattr(scalar_type, "value", scalar_type)
+    return None
+
+
+def _point_to_search_result(point: Any, score: float) -> SearchResult:
+    """Qdrant 포인트(ScoredPoint/Record) payload 를 SearchResult 로 변환"""
+    payload = point.payload
+    return SearchResult(
+        chunk_id=UUID(point.id),
+        document_id=UUID(payload.get("document_id")),
+        content=payload.get("content", ""),
+        score=score,
+        metadata={
+            "source": payload.get("source", ""),
+            "page": payload.get("page"),
+            "chunk_index": payload.get("chunk_index"),
+            "created_at": payload.get("created_at"),
+            **payload.get("metadata", {})
+        }
+    )
+
+
+def _get_filter_builder(key: str) -> Optional[FilterBuilder]:
+    """필터 키에 해당하는 조건 빌더 조회 (metadata.* 는 정확한 값 매칭, 그 외는 무시)"""
+    builder = _FILTER_BUILDERS.get(key)
+    if builder is None and key.startswith("metadata."):
+        return _match_condition
+    return builder
+
+
+# 컬렉션 상태 조회 결과 캐시 유지 시간 (초)
+_HEALTH_CACHE_TTL_SECONDS = 30.0
+
+
+class _TTLCacheEntry:
+    """인스턴스별 비동기 TTL 캐시 상태"""
+    
+    __slots__ = ("lock", "value", "expires_at")
+    
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.value: Dict[str, Any] = {}
+        self.expires_at = 0.0
+
+
+def _async_ttl_cache(
+    ttl: float,
+) -> Callable[[CachedMethod[SelfT]], CachedMethod[SelfT]]:
+    """인자 없는 async 메서드의 dict 결과를 인스턴스별로 ttl 초 동안 캐시
+
+    동시에 들어온 호출은 하나의 Lock 으로 묶여 원본 메서드를 한 번만 실행합니다.
+    예외가 발생한 호출은 캐시하지 않습니다. 호출자가 결과를 수정해도 캐시가
+    오염되지 않도록 매 호출마다 깊은 복사본을 반환합니다.
+    """
+    def decorator(method: CachedMethod[SelfT]) -> CachedMethod[SelfT]:
+        cache_attr = f"_{method.__name__}_cache"
+        
+        @wraps(method)
+        async def wrapper(self: SelfT) -> Dict[str, Any]:
+            entry: Optional[_TTLCacheEntry] = self.__dict__.get(cache_attr)
+            if entry is None:
+                entry = self.__dict__[cache_attr] = _TTLCacheEntry()
+            
+            async with entry.lock:
+                if time.monotonic() >= entry.expires_at:
+                    entry.value = await method(self)
+                    entry.expires_at = time.monotonic() + ttl
+                return copy.deepcopy(entry.value)
+        
+        return wrapper
+    
+    return decorator
+
 
 class VectorDatabase(VectorSearchPort):
     """Qdrant 벡터 데이터베이스 구현"""
@@ -22,10 +143,11 @@ class VectorDatabase(VectorSearchPort):
     def __init__(self, qdrant_client: QdrantClient):
         self.client = qdrant_client
         self.collection_name = "document_chunks"
+        self._payload_index_notice_logged = False
     
     async def search_similar_chunks(
         self,
-        query_embedding: List[float],
+        query_embedding: Union[np.ndarray, List[float]],
         limit: int = 10,
         threshold: float = 0.7,
         filters: Optional[Dict[str, Any]] = None,
@@ -35,7 +157,7 @@ class VectorDatabase(VectorSearchPort):
         try:
             logger.info(f"Searching similar vectors with limit: {limit}")
             
-            # Qdrant 검색 수행
+            # Qdrant 검색 수행 (float32 ndarray 는 리스트 변환 없이 그대로 전달)
             search_results = await self.client.search(
                 collection_name=self.collection_name,
                 query_vector=query_embedding,
@@ -45,22 +167,10 @@ class VectorDatabase(VectorSearchPort):
             )
             
             # SearchResult 객체로 변환
-            results = []
-            for result in search_results:
-                search_result = SearchResult(
-                    chunk_id=UUID(result.id),
-                    document_id=UUID(result.payload.get("document_id")),
-                    content=result.payload.get("content", ""),
-                    score=float(result.score),
-                    metadata={
-                        "source": result.payload.get("source", ""),
-                        "page": result.payload.get("page"),
-                        "chunk_index": result.payload.get("chunk_index"),
-                        "created_at": result.payload.get("created_at"),
-                        **result.payload.get("metadata", {})
-                    }
-                )
-                results.append(search_result)
+            results = [
+                _point_to_search_result(result, float(result.score))
+                for result in search_results
+            ]
             
             logger.info(f"Found {len(results)} similar chunks")
             return results
@@ -80,6 +190,11 @@ class VectorDatabase(VectorSearchPort):
         try:
             logger.info(f"Searching by keywords: {keywords}")
             
+            # 키워드 소문자 변환은 청크마다가 아니라 호출당 한 번만 수행 (빈 키워드 제외)
+            lowered_keywords = [keyword.lower() for keyword in keywords if keyword]
+            if not lowered_keywords:
+                return []
+            
             # 키워드를 포함하는 청크 검색
             # 실제로는 Elasticsearch나 전문 검색 엔진을 사용하는 것이 좋지만
             # 여기서는 간단한 텍스트 매칭으로 구현
@@ -98,25 +213,10 @@ class VectorDatabase(VectorSearchPort):
                 content = point.payload.get("content", "").lower()
                 
                 # 키워드 매칭 점수 계산
-                score = 0.0
-                for keyword in keywords:
-                    if keyword.lower() in content:
-                        score += content.count(keyword.lower()) / len(content.split())
+                score = self._score_keywords(content, lowered_keywords)
                 
                 if score > 0:
-                    search_result = SearchResult(
-                        chunk_id=UUID(point.id),
-                        document_id=UUID(point.payload.get("document_id")),
-                        content=point.payload.get("content", ""),
-                        score=score,
-                        metadata={
-                            "source": point.payload.get("source", ""),
-                            "page": point.payload.get("page"),
-                            "chunk_index": point.payload.get("chunk_index"),
-                            "created_at": point.payload.get("created_at"),
-                            **point.payload.get("metadata", {})
-                        }
-                    )
+                    search_result = _point_to_search_result(point, score)
                     results.append(search_result)
             
             # 점수 순으로 정렬
@@ -129,7 +229,7 @@ class VectorDatabase(VectorSearchPort):
     
     async def hybrid_search(
         self,
-        query_embedding: List[float],
+        query_embedding: Union[np.ndarray, List[float]],
         keywords: List[str],
         semantic_weight: float = 0.7,
         keyword_weight: float = 0.3,
@@ -142,14 +242,14 @@ class VectorDatabase(VectorSearchPort):
         try:
             logger.info(f"Performing hybrid search with limit: {limit}")
             
-            # 벡터 검색 결과
-            vector_results = await self.search_similar_chunks(
-                query_embedding, limit, threshold, filters, user_id
-            )
-            
-            # 키워드 검색 결과 (텍스트 매칭)
-            keyword_results = await self.search_by_keywords(
-                keywords, limit, filters, user_id
+            # 벡터 검색과 키워드 검색(텍스트 매칭)을 동시에 수행
+            vector_results, keyword_results = await asyncio.gather(
+                self.search_similar_chunks(
+                    query_embedding, limit, threshold, filters, user_id
+                ),
+                self.search_by_keywords(
+                    keywords, limit, filters, user_id
+                )
             )
             
             # 결과 병합 및 재순위화
@@ -157,11 +257,11 @@ class VectorDatabase(VectorSearchPort):
                 vector_results, 
                 keyword_results,
                 vector_weight=semantic_weight,
-                keyword_weight=keyword_weight
+                keyword_weight=keyword_weight,
+                limit=limit
             )
             
-            # 제한된 수만큼 반환
-            return merged_results[:limit]
+            return merged_results
             
         except Exception as e:
             logger.error(f"Hybrid search failed: {str(e)}")
@@ -173,35 +273,34 @@ class VectorDatabase(VectorSearchPort):
         user_id: Optional[UUID] = None
     ) -> Optional[SearchResult]:
         """ID로 특정 청크 조회"""
+        results = await self.get_chunks_by_ids([chunk_id], user_id)
+        return results[0] if results else None
+    
+    async def get_chunks_by_ids(
+        self,
+        chunk_ids: Sequence[UUID],
+        user_id: Optional[UUID] = None
+    ) -> List[SearchResult]:
+        """여러 청크를 한 번의 retrieve 요청으로 조회"""
+        if not chunk_ids:
+            return []
+        
         try:
-            result = await self.client.retrieve(
+            points = await self.client.retrieve(
                 collection_name=self.collection_name,
-                ids=[str(chunk_id)],
+                ids=[str(chunk_id) for chunk_id in chunk_ids],
                 with_payload=True,
                 with_vectors=False
             )
             
-            if not result:
-                return None
-            
-            point = result[0]
-            return SearchResult(
-                chunk_id=UUID(point.id),
-                document_id=UUID(point.payload.get("document_id")),
-                content=point.payload.get("content", ""),
-                score=1.0,
-                metadata={
-                    "source": point.payload.get("source", ""),
-                    "page": point.payload.get("page"),
-                    "chunk_index": point.payload.get("chunk_index"),
-                    "created_at": point.payload.get("created_at"),
-                    **point.payload.get("metadata", {})
-                }
-            )
+            return [
+                _point_to_search_result(point, 1.0)
+                for point in points
+            ]
             
         except Exception as e:
-            logger.error(f"Failed to get chunk by ID {chunk_id}: {str(e)}")
-            raise SearchError(f"Failed to get chunk by ID: {str(e)}")
+            logger.error(f"Failed to get chunks by IDs {list(chunk_ids)}: {str(e)}")
+            raise SearchError(f"Failed to get chunks by IDs: {str(e)}")
     
     async def get_chunks_by_document(
         self,
@@ -221,22 +320,8 @@ class VectorDatabase(VectorSearchPort):
                 with_vectors=False
             )
             
-            results = []
-            for result in search_results[0]:  # scroll returns (points, next_page_offset)
-                search_result = SearchResult(
-                    chunk_id=UUID(result.id),
-                    document_id=UUID(result.payload.get("document_id")),
-                    content=result.payload.get("content", ""),
-                    score=1.0,  # 문서별 조회는 스코어 없음
-                    metadata={
-                        "source": result.payload.get("source", ""),
-                        "page": result.payload.get("page"),
-                        "chunk_index": result.payload.get("chunk_index"),
-                        "created_at": result.payload.get("created_at"),
-                        **result.payload.get("metadata", {})
-                    }
-                )
-                results.append(search_result)
+            # scroll returns (points, next_page_offset), 문서별 조회는 스코어 없음
+            results = [_point_to_search_result(result, 1.0) for result in search_results[0]]
             
             # 청크 인덱스 순으로 정렬
             results.sort(key=lambda x: x.metadata.get("chunk_index", 0))
@@ -251,16 +336,7 @@ class VectorDatabase(VectorSearchPort):
     async def check_collection_health(self) -> Dict[str, Any]:
         """벡터 컬렉션 상태 확인"""
         try:
-            info = await self.client.get_collection(self.collection_name)
-            return {
-                "name": info.config.name,
-                "vector_size": info.config.params.vectors.size,
-                "distance": info.config.params.vectors.distance.name,
-                "points_count": info.points_count,
-                "indexed_vectors_count": info.indexed_vectors_count,
-                "status": info.status.name,
-                "health": "healthy" if info.status.name == "GREEN" else "unhealthy"
-            }
+            return await self._fetch_collection_health()
         except Exception as e:
             logger.error(f"Failed to check collection health: {str(e)}")
             return {
@@ -268,6 +344,39 @@ class VectorDatabase(VectorSearchPort):
                 "error": str(e)
             }
     
+    @_async_ttl_cache(ttl=_HEALTH_CACHE_TTL_SECONDS)
+    async def _fetch_collection_health(self) -> Dict[str, Any]:
+        """Qdrant 에서 컬렉션 상태 조회 (성공한 결과만 TTL 동안 캐시)"""
+        info = await self.client.get_collection(self.collection_name)
+        missing_indexes = [
+            field_name for field_name in _INDEXED_FILTER_FIELDS
+            if field_name not in (info.payload_schema or {})
+        ]
+        self._log_missing_payload_indexes(missing_indexes)
+        return {
+            "name": info.config.name,
+            "vector_size": info.config.params.vectors.size,
+            "distance": info.config.params.vectors.distance.name,
+            "points_count": info.points_count,
+            "indexed_vectors_count": info.indexed_vectors_count,
+            "status": info.status.name,
+            "missing_payload_indexes": missing_indexes,
+            "quantization": _describe_quantization(info.config.quantization_config),
+            "health": "healthy" if info.status.name == "GREEN" else "unhealthy"
+        }
+    
+    def _log_missing_payload_indexes(self, missing_indexes: List[str]) -> None:
+        """필터 필드의 payload 인덱스 누락을 인스턴스당 한 번만 안내"""
+        if not missing_indexes or self._payload_index_notice_logged:
+            return
+        
+        self._payload_index_notice_logged = True
+        logger.info(
+            f"Collection {self.collection_name} has no payload index for "
+            f"{', '.join(missing_indexes)}; filtered searches will fall back to "
+            f"post-filtering instead of index-pushed filtering"
+        )
+    
     async def search_by_metadata(
         self,
         filters: Dict[str, Any],
@@ -285,22 +394,8 @@ class VectorDatabase(VectorSearchPort):
                 with_vectors=False
             )
             
-            results = []
-            for result in search_results[0]:  # scroll returns (points, next_page_offset)
-                search_result = SearchResult(
-                    chunk_id=UUID(result.id),
-                    document_id=UUID(result.payload.get("document_id")),
-                    content=result.payload.get("content", ""),
-                    score=1.0,  # 메타데이터 검색은 스코어 없음
-                    metadata={
-                        "source": result.payload.get("source", ""),
-                        "page": result.payload.get("page"),
-                        "chunk_index": result.payload.get("chunk_index"),
-                        "created_at": result.payload.get("created_at"),
-                        **result.payload.get("metadata", {})
-                    }
-                )
-                results.append(search_result)
+            # scroll returns (points, next_page_offset), 메타데이터 검색은 스코어 없음
+            results = [_point_to_search_result(result, 1.0) for result in search_results[0]]
             
             logger.info(f"Found {len(results)} chunks by metadata")
             return results
@@ -330,104 +425,77 @@ class VectorDatabase(VectorSearchPort):
         if not filters:
             return None
         
-        must_conditions = []
+        # 단일 키 필터 (예: document_id 조회) 는 루프 없이 바로 구성
+        if len(filters) == 1:
+            (key, value), = filters.items()
+            builder = _get_filter_builder(key)
+            return {"must": [builder(key, value)]} if builder is not None else None
         
-        for key, value in filters.items():
-            if key == "document_id":
-                must_conditions.append({
-                    "key": "document_id",
-                    "match": {"value": str(value)}
-                })
-            elif key == "source":
-                must_conditions.append({
-                    "key": "source",
-                    "match": {"value": value}
-                })
-            elif key == "page":
-                if isinstance(value, dict):
-                    # 범위 검색 (예: {"gte": 1, "lte": 10})
-                    range_filter = {"key": "page", "range": {}}
-                    if "gte" in value:
-                        range_filter["range"]["gte"] = value["gte"]
-                    if "lte" in value:
-                        range_filter["range"]["lte"] = value["lte"]
-                    if "gt" in value:
-                        range_filter["range"]["gt"] = value["gt"]
-                    if "lt" in value:
-                        range_filter["range"]["lt"] = value["lt"]
-                    must_conditions.append(range_filter)
-                else:
-                    # 정확한 값 매칭
-                    must_conditions.append({
-                        "key": "page",
-                        "match": {"value": value}
-                    })
-            elif key == "created_after":
-                must_conditions.append({
-                    "key": "created_at",
-                    "range": {"gte": value}
-                })
-            elif key == "created_before":
-                must_conditions.append({
-                    "key": "created_at",
-                    "range": {"lte": value}
-                })
-            elif key.startswith("metadata."):
-                # 메타데이터 필터
-                metadata_key = key[9:]  # "metadata." 제거
-                must_conditions.append({
-                    "key": f"metadata.{metadata_key}",
-                    "match": {"value": value}
-                })
+        must_conditions = [
+            builder(key, value)
+            for key, value in filters.items()
+            if (builder := _get_filter_builder(key)) is not None
+        ]
         
         if not must_conditions:
             return None
         
         return {"must": must_conditions}
     
+    @staticmethod
+    def _score_keywords(content: str, lowered_keywords: List[str]) -> float:
+        """소문자 본문에 대한 키워드 출현 빈도 점수 (키워드별 출현 횟수 합 / 단어 수)"""
+        word_count = len(content.split())
+        if word_count == 0:
+            return 0.0
+        
+        hits = sum(content.count(keyword) for keyword in lowered_keywords)
+        return hits / word_count
+    
     def _merge_and_rerank(
         self,
         vector_results: List[SearchResult],
         keyword_results: List[SearchResult],
         vector_weight: float = 0.7,
-        keyword_weight: float = 0.3
+        keyword_weight: float = 0.3,
+        limit: Optional[int] = None
     ) -> List[SearchResult]:
         """벡터 검색과 키워드 검색 결과 병합 및 재순위화"""
+        combined = vector_results + keyword_results
+        if not combined:
+            return []
         
-        # 결과를 chunk_id로 그룹화
-        merged_scores = {}
+        # chunk_id(UUID 128bit)를 두 개의 uint64 로 보고 고유 인덱스 부여
+        keys = np.frombuffer(
+            b"".join(result.chunk_id.bytes for result in combined), dtype="<u8"
+        ).reshape(-1, 2)
+        _, first_index, inverse = np.unique(
+            keys, axis=0, return_index=True, return_inverse=True
+        )
+        inverse = inverse.reshape(-1)
         
-        # 벡터 검색 결과 처리
-        for result in vector_results:
-            chunk_id = result.chunk_id
-            merged_scores[chunk_id] = {
-                "result": result,
-                "vector_score": result.score * vector_weight,
-                "keyword_score": 0.0
-            }
+        # 고유 청크별 벡터/키워드 점수 배치 (중복 시 마지막 값 사용)
+        num_vector = len(vector_results)
+        vector_scores = np.zeros(len(first_index), dtype=np.float64)
+        keyword_scores = np.zeros(len(first_index), dtype=np.float64)
+        vector_scores[inverse[:num_vector]] = [result.score for result in vector_results]
+        keyword_scores[inverse[num_vector:]] = [result.score for result in keyword_results]
+        
+        # 최종 점수 계산 (임시 배열 없이 제자리 연산)
+        final_scores = np.multiply(vector_scores, vector_weight, out=vector_scores)
+        final_scores += np.multiply(keyword_scores, keyword_weight, out=keyword_scores)
         
-        # 키워드 검색 결과 처리
-        for result in keyword_results:
-            chunk_id = result.chunk_id
-            if chunk_id in merged_scores:
-                # 이미 벡터 검색에서 찾은 결과
-                merged_scores[chunk_id]["keyword_score"] = result.score * keyword_weight
-            else:
-                # 키워드 검색에서만 찾은 결과
-                merged_scores[chunk_id] = {
-                    "result": result,
-                    "vector_score": 0.0,
-                    "keyword_score": result.score * keyword_weight
-                }
+        # 동점일 때 입력 순서(벡터 결과 → 키워드 결과)를 유지하도록 안정 정렬
+        insertion_order = np.argsort(first_index, kind="stable")
+        ranked = insertion_order[np.argsort(-final_scores[insertion_order], kind="stable")]
+        if limit is not None:
+            ranked = ranked[:limit]
         
-        # 최종 점수 계산 및 정렬
+        # 상위 결과에 대해서만 SearchResult 점수 갱신
         final_results = []
-        for chunk_data in merged_scores.values():
-            final_score = chunk_data["vector_score"] + chunk_data["keyword_score"]
-            result = chunk_data["result"]
-            result.score = final_score
+        for slot in ranked:
+            result = combined[first_index[slot]]
+            result.score = float(final_scores[slot])
             final_results.append(result)
         
-        # 점수 순으로 정렬
-        final_results.sort(key=lambda x: x.score, reverse=True)
         return final_results
@@ -5,9 +5,48 @@
 """
 
 from datetime import datetime, timezone, timedelta
-from typing import Optional, Union, Generator
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Union, Iterator, Sequence
 import pytz
 import calendar
+import sys
+
+if TYPE_CHECKING:
+    # 도메인 엔티티가 utc_now() 때문에 이 모듈을 import 하므로 NumPy 는 배열 함수에서만 지연 import
+    import numpy as np
+
+# 자주 사용하는 고정 오프셋 시간대 (호출마다 새로 생성하지 않도록 모듈 상수로 공유)
+UTC = timezone.utc
+KST = timezone(timedelta(hours=9))
+
+# get_date_range 간격별 증가량
+_DATE_RANGE_INTERVALS = {
+    'days': timedelta(days=1),
+    'hours': timedelta(hours=1),
+    'minutes': timedelta(minutes=1),
+    'seconds': timedelta(seconds=1),
+}
+
+# calculate_duration 단위별 초 환산값
+_DURATION_UNIT_SECONDS = {
+    'seconds': 1,
+    'minutes': 60,
+    'hours': 3600,
+    'days': 86400,
+}
+
+# 주 시작(월요일 00:00:00)부터 주 끝(일요일 23:59:59.999999)까지의 간격
+_WEEK_END_OFFSET = timedelta(days=7, microseconds=-1)
+
+# ISO 파서가 거부하는 0 채움 없는 숫자·연속 공백 표기를 순서대로 시도하는 strptime 형식
+# (0 채움된 표기는 Python 3.11+ 의 fromisoformat 이 먼저 처리)
+_FALLBACK_DATETIME_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%d",
+)
 
 
 def utc_now() -> datetime:
@@ -17,7 +56,7 @@ def utc_now() -> datetime:
     Returns:
         datetime: UTC 시간대의 현재 시간
     """
-    return datetime.now(timezone.utc)
+    return datetime.now(UTC)
 
 
 def get_current_utc_datetime() -> datetime:
@@ -27,7 +66,7 @@ def get_current_utc_datetime() -> datetime:
     Returns:
         datetime: UTC 시간대의 현재 시간
     """
-    return datetime.now(timezone.utc)
+    return datetime.now(UTC)
 
 
 def get_current_utc_time() -> datetime:
@@ -37,7 +76,7 @@ def get_current_utc_time() -> datetime:
     Returns:
         datetime: UTC 시간대의 현재 시간
     """
-    return datetime.now(timezone.utc)
+    return datetime.now(UTC)
 
 
 def get_current_kst_datetime() -> datetime:
@@ -47,8 +86,7 @@ def get_current_kst_datetime() -> datetime:
     Returns:
         datetime: KST 시간대의 현재 시간
     """
-    kst = timezone(timedelta(hours=9))
-    return datetime.now(kst)
+    return datetime.now(KST)
 
 
 def format_datetime(dt: datetime, format_str: Optional[str] = None) -> str:
@@ -62,11 +100,30 @@ def format_datetime(dt: datetime, format_str: Optional[str] = None) -> str:
     Returns:
         str: 포맷된 날짜/시간 문자열
     """
+    # 같은 시각이라도 시간대(오프셋/이름)가 다르면 결과가 다르므로 캐시 키에 포함
+    return _format_datetime_cached(dt, dt.utcoffset(), dt.tzname(), format_str)
+
+
+@lru_cache(maxsize=1024)
+def _format_datetime_cached(
+    dt: datetime,
+    utcoffset: Optional[timedelta],
+    tzname: Optional[str],
+    format_str: Optional[str]
+) -> str:
+    """반복되는 (datetime, 포맷) 조합의 포맷 결과를 캐시합니다."""
     if format_str is None:
         return dt.isoformat()
     return dt.strftime(format_str)
 
 
+def clear_format_datetime_cache() -> None:
+    """
+    format_datetime 의 포맷 결과 캐시를 비웁니다.
+    """
+    _format_datetime_cached.cache_clear()
+
+
 def format_datetime_iso(dt: datetime) -> str:
     """
     datetime 객체를 ISO 8601 형식으로 포맷합니다.
@@ -97,20 +154,12 @@ def parse_datetime(date_str: str, format_str: Optional[str] = None) -> datetime:
     if format_str:
         return datetime.strptime(date_str, format_str)
     else:
-        # ISO 형식으로 파싱 시도
+        # ISO 형식으로 파싱 시도 (Python 3.11+ 는 'Z' 접미사와 공백 구분자도 지원)
         try:
-            return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+            return datetime.fromisoformat(date_str)
         except ValueError:
-            # 일반적인 형식들로 시도
-            formats = [
-                "%Y-%m-%d %H:%M:%S",
-                "%Y-%m-%d %H:%M:%S.%f",
-                "%Y-%m-%dT%H:%M:%S",
-                "%Y-%m-%dT%H:%M:%S.%f",
-                "%Y-%m-%d",
-            ]
-            
-            for fmt in formats:
+            # 0 채움이 없는 날짜 등 ISO 파서가 거부하는 일반 형식들로 시도
+            for fmt in _FALLBACK_DATETIME_FORMATS:
                 try:
                     return datetime.strptime(date_str, fmt)
                 except ValueError:
@@ -131,9 +180,9 @@ def to_utc(dt: datetime) -> datetime:
     """
     if dt.tzinfo is None:
         # naive datetime은 UTC로 가정
-        return dt.replace(tzinfo=timezone.utc)
+        return dt.replace(tzinfo=UTC)
     else:
-        return dt.astimezone(timezone.utc)
+        return dt.astimezone(UTC)
 
 
 def to_timezone(dt: datetime, tz: Union[str, timezone]) -> datetime:
@@ -152,7 +201,7 @@ def to_timezone(dt: datetime, tz: Union[str, timezone]) -> datetime:
     
     if dt.tzinfo is None:
         # naive datetime은 UTC로 가정
-        dt = dt.replace(tzinfo=timezone.utc)
+        dt = dt.replace(tzinfo=UTC)
     
     return dt.astimezone(tz)
 
@@ -309,7 +358,7 @@ def get_age_in_seconds(dt: datetime) -> float:
     """
     now = utc_now()
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
+        dt = dt.replace(tzinfo=UTC)
     
     return (now - dt).total_seconds()
 
@@ -357,7 +406,7 @@ def from_timestamp(timestamp: Union[int, float]) -> datetime:
     Returns:
         datetime: UTC 시간대의 datetime 객체
     """
-    return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+    return datetime.fromtimestamp(timestamp, tz=UTC)
 
 
 def datetime_to_timestamp(dt: datetime) -> float:
@@ -383,52 +432,96 @@ def timestamp_to_datetime(timestamp: Union[int, float]) -> datetime:
     Returns:
         datetime: UTC 시간대의 datetime 객체
     """
-    return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+    return datetime.fromtimestamp(timestamp, tz=UTC)
 
 
-def get_date_range(start_date: datetime, end_date: datetime, interval: str) -> Generator[datetime, None, None]:
+class DateRange:
+    """
+    시작부터 종료까지(종료 포함) 일정 간격으로 나열되는 날짜/시간 시퀀스
+    
+    내장 range 와 같이 길이와 인덱스 접근을 전체 목록 생성 없이 계산합니다.
+    """
+    
+    __slots__ = ("start", "end", "step", "_length")
+    
+    def __init__(self, start: datetime, end: datetime, step: timedelta):
+        self.start = start
+        self.end = end
+        self.step = step
+        self._length = (end - start) // step + 1 if start <= end else 0
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def __iter__(self) -> Iterator[datetime]:
+        current = self.start
+        for _ in range(self._length):
+            yield current
+            current += self.step
+    
+    def __getitem__(self, index: int) -> datetime:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("날짜 범위 인덱스가 범위를 벗어났습니다")
+        return self.start + self.step * index
+
+
+def get_date_range(start_date: datetime, end_date: datetime, interval: str) -> DateRange:
     """
     날짜 범위를 생성합니다.
     
     Args:
         start_date: 시작 날짜
         end_date: 종료 날짜
-        interval: 간격 ('days', 'hours', 'minutes')
+        interval: 간격 ('days', 'hours', 'minutes', 'seconds')
         
-    Yields:
-        datetime: 범위 내의 각 날짜/시간
+    Returns:
+        DateRange: 범위 내의 각 날짜/시간 시퀀스
         
     Raises:
         ValueError: 잘못된 간격인 경우
     """
-    if interval == 'days':
-        delta = timedelta(days=1)
-    elif interval == 'hours':
-        delta = timedelta(hours=1)
-    elif interval == 'minutes':
-        delta = timedelta(minutes=1)
-    else:
-        raise ValueError(f"지원하지 않는 간격입니다: {interval}")
+    try:
+        delta = _DATE_RANGE_INTERVALS[interval]
+    except KeyError:
+        raise ValueError(f"지원하지 않는 간격입니다: {interval}") from None
     
-    current = start_date
-    while current <= end_date:
-        yield current
-        current += delta
+    return DateRange(start_date, end_date, delta)
 
 
-def is_business_day(dt: datetime) -> bool:
+def is_business_day(dt: Union[datetime, "np.ndarray"]) -> Union[bool, "np.ndarray"]:
     """
     영업일인지 확인합니다 (월-금).
     
     Args:
-        dt: 확인할 datetime 객체
+        dt: 확인할 datetime 객체 (datetime64 배열인 경우 일괄 처리)
         
     Returns:
-        bool: 영업일인 경우 True
+        Union[bool, np.ndarray]: 영업일인 경우 True (배열 입력 시 bool 배열)
     """
+    # NumPy 가 아직 로드되지 않았다면 입력이 ndarray 일 수 없으므로 import 하지 않음
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(dt, numpy.ndarray):
+        return is_business_day_array(dt)
     return dt.weekday() < 5  # 0-4: 월-금, 5-6: 토-일
 
 
+def is_business_day_array(dates: "np.ndarray") -> "np.ndarray":
+    """
+    datetime64 배열의 각 날짜가 영업일(월-금)인지 일괄 확인합니다.
+    
+    Args:
+        dates: 확인할 datetime64 배열
+        
+    Returns:
+        np.ndarray: 날짜별 영업일 여부 (bool 배열)
+    """
+    import numpy as np
+    
+    return np.is_busday(dates.astype('datetime64[D]'))
+
+
 def add_business_days(dt: datetime, days: int) -> datetime:
     """
     영업일을 더합니다.
@@ -440,16 +533,47 @@ def add_business_days(dt: datetime, days: int) -> datetime:
     Returns:
         datetime: 계산된 datetime 객체
     """
-    current = dt
-    remaining_days = abs(days)
-    direction = 1 if days >= 0 else -1
+    if days == 0:
+        return dt
+    
+    # 주말 시작일은 이동 방향의 반대쪽 영업일(금요일/월요일)을 기준으로 계산
+    weekday = dt.weekday()
+    offset = 0
+    if weekday >= 5:
+        offset = 4 - weekday if days > 0 else 7 - weekday
+        weekday = 4 if days > 0 else 0
+    
+    # 영업일 5일 = 달력 7일 이므로 주 단위와 나머지 영업일로 나누어 한 번에 계산
+    weeks, remainder = divmod(weekday + days, 5)
+    offset += weeks * 7 + remainder - weekday
+    return dt + timedelta(days=offset)
+
+
+def add_business_days_array(dates: Sequence[datetime], days: int) -> "np.ndarray":
+    """
+    여러 날짜에 영업일을 일괄로 더합니다.
+    
+    NumPy 의 영업일 연산(busday_offset)으로 처리하며 결과는 날짜별
+    add_business_days 호출과 같습니다.
+    
+    Args:
+        dates: 기준 날짜 목록 (naive datetime 또는 datetime64 배열)
+        days: 더할 영업일 수 (음수 가능)
+        
+    Returns:
+        np.ndarray: 계산된 날짜 배열 (datetime64[us], 시각 유지)
+    """
+    import numpy as np
     
-    while remaining_days > 0:
-        current += timedelta(days=direction)
-        if is_business_day(current):
-            remaining_days -= 1
+    dates = np.asarray(dates, dtype='datetime64[us]')
+    if days == 0:
+        return dates
     
-    return current
+    day_part = dates.astype('datetime64[D]')
+    time_of_day = dates - day_part
+    # 주말 시작일은 이동 방향의 반대쪽 영업일을 기준으로 세어야 단건 계산과 일치
+    roll = 'backward' if days > 0 else 'forward'
+    return np.busday_offset(day_part, days, roll=roll) + time_of_day
 
 
 def get_timezone_offset(dt: datetime) -> float:
@@ -485,7 +609,7 @@ def convert_timezone(dt: datetime, target_tz: timezone) -> datetime:
     """
     if dt.tzinfo is None:
         # naive datetime은 UTC로 가정
-        dt = dt.replace(tzinfo=timezone.utc)
+        dt = dt.replace(tzinfo=UTC)
     
     return dt.astimezone(target_tz)
 
@@ -502,7 +626,7 @@ def get_relative_time_string(dt: datetime) -> str:
     """
     now = get_current_utc_datetime()
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
+        dt = dt.replace(tzinfo=UTC)
     
     diff = now - dt
     total_seconds = diff.total_seconds()
@@ -560,12 +684,9 @@ def get_week_range(dt: datetime) -> tuple[datetime, datetime]:
     Returns:
         tuple[datetime, datetime]: (주 시작, 주 끝)
     """
-    # 월요일을 주의 시작으로 설정
-    days_since_monday = dt.weekday()
-    week_start = dt - timedelta(days=days_since_monday)
-    week_end = week_start + timedelta(days=6)
-    
-    return get_start_of_day(week_start), get_end_of_day(week_end)
+    # 월요일을 주의 시작으로 설정 (시각 초기화와 요일 이동을 한 번씩만 수행)
+    week_start = get_start_of_day(dt) - timedelta(days=dt.weekday())
+    return week_start, week_start + _WEEK_END_OFFSET
 
 
 def get_month_range(dt: datetime) -> tuple[datetime, datetime]:
@@ -578,14 +699,14 @@ def get_month_range(dt: datetime) -> tuple[datetime, datetime]:
     Returns:
         tuple[datetime, datetime]: (월 시작, 월 끝)
     """
-    # 월의 첫 날
-    month_start = dt.replace(day=1)
-    
-    # 월의 마지막 날
+    # 월의 첫 날 / 마지막 날 (날짜와 시각을 한 번의 replace 로 설정)
     last_day = calendar.monthrange(dt.year, dt.month)[1]
-    month_end = dt.replace(day=last_day)
+    month_start = dt.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    month_end = dt.replace(
+        day=last_day, hour=23, minute=59, second=59, microsecond=999999
+    )
     
-    return get_start_of_day(month_start), get_end_of_day(month_end)
+    return month_start, month_end
 
 
 def calculate_duration(start_dt: datetime, end_dt: datetime, unit: str) -> float:
@@ -603,19 +724,12 @@ def calculate_duration(start_dt: datetime, end_dt: datetime, unit: str) -> float
     Raises:
         ValueError: 잘못된 단위인 경우
     """
-    diff = end_dt - start_dt
-    total_seconds = diff.total_seconds()
+    try:
+        unit_seconds = _DURATION_UNIT_SECONDS[unit]
+    except KeyError:
+        raise ValueError(f"지원하지 않는 단위입니다: {unit}") from None
     
-    if unit == 'seconds':
-        return total_seconds
-    elif unit == 'minutes':
-        return total_seconds / 60
-    elif unit == 'hours':
-        return total_seconds / 3600
-    elif unit == 'days':
-        return total_seconds / 86400
-    else:
-        raise ValueError(f"지원하지 않는 단위입니다: {unit}")
+    return (end_dt - start_dt).total_seconds() / unit_seconds
 
 
 def is_datetime_in_range(check_dt: datetime, start_dt: datetime, end_dt: datetime, 
@@ -633,14 +747,11 @@ def is_datetime_in_range(check_dt: datetime, start_dt: datetime, end_dt: datetim
     Returns:
         bool: 범위 내에 있는 경우 True
     """
+    # 연쇄 비교로 datetime 을 직접 비교 (시작 조건이 거짓이면 종료 비교는 생략)
     if start_inclusive:
-        start_check = check_dt >= start_dt
-    else:
-        start_check = check_dt > start_dt
-    
+        if end_inclusive:
+            return start_dt <= check_dt <= end_dt
+        return start_dt <= check_dt < end_dt
     if end_inclusive:
-        end_check = check_dt <= end_dt
-    else:
-        end_check = check_dt < end_dt
-    
-    return start_check and end_check
+        return start_dt < check_dt <= end_dt
+    return start_dt < check_dt < end_dt
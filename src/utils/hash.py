@@ -9,6 +9,9 @@ import hmac
 from pathlib import Path
 from typing import Union, BinaryIO
 
+# 파일/스트림 해싱 시 한 번에 읽는 바이트 수
+HASH_CHUNK_SIZE = 8192
+
 
 def hash_text(text: str, algorithm: str = "sha256") -> str:
     """
@@ -57,7 +60,7 @@ def hash_file(file_path: Union[str, Path], algorithm: str = "sha256") -> str:
         
         with open(file_path, 'rb') as f:
             # 큰 파일을 위해 청크 단위로 읽기
-            for chunk in iter(lambda: f.read(8192), b""):
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
                 hasher.update(chunk)
                 
         return hasher.hexdigest()
@@ -89,7 +92,7 @@ def hash_file_stream(file_stream: BinaryIO, algorithm: str = "sha256") -> str:
         file_stream.seek(0)
         
         # 청크 단위로 읽어서 해싱
-        for chunk in iter(lambda: file_stream.read(8192), b""):
+        for chunk in iter(lambda: file_stream.read(HASH_CHUNK_SIZE), b""):
             hasher.update(chunk)
         
         # 원래 위치로 복원
@@ -0,0 +1,46 @@
+"""
+Qdrant 관련 단위 테스트 공용 헬퍼 (테스트 더블과 payload 생성 함수)
+"""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Mapping
+from uuid import UUID
+
+
+# Qdrant payload 공용 값 (읽기 전용으로 공유)
+PAYLOAD_CREATED_AT = "2024-01-01T00:00:00Z"
+EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
+JOHN_DOE_METADATA: Mapping[str, Any] = MappingProxyType({"author": "John Doe"})
+
+
+@dataclass(slots=True, frozen=True)
+class QPoint:
+    """Qdrant ScoredPoint/Record 를 흉내내는 경량 테스트 더블
+
+    VectorDatabase 는 id/score/payload 속성만 읽으므로 Mock 대신 사용합니다.
+    """
+
+    id: str
+    payload: Mapping[str, Any]
+    score: float = 0.0
+
+
+def qdrant_payload(
+    document_id: UUID,
+    content: str,
+    source: str = "test.pdf",
+    page: int = 1,
+    chunk_index: int = 0,
+    metadata: Mapping[str, Any] = EMPTY_METADATA,
+) -> Mapping[str, Any]:
+    """VectorDatabase 가 읽는 청크 payload 를 읽기 전용 매핑으로 생성"""
+    return MappingProxyType({
+        "document_id": str(document_id),
+        "content": content,
+        "source": source,
+        "page": page,
+        "chunk_index": chunk_index,
+        "created_at": PAYLOAD_CREATED_AT,
+        "metadata": metadata,
+    })
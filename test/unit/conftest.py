@@ -0,0 +1,61 @@
+"""
+단위 테스트 공용 픽스처
+"""
+
+from datetime import datetime, timezone
+from itertools import cycle
+from typing import Callable
+from uuid import UUID, uuid4
+
+import pytest
+
+
+FROZEN_UTC_NOW = datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+
+# 테스트용 UUID 풀 (연속 1024 개까지는 서로 다른 값이 보장됨)
+_UUID_POOL = cycle([uuid4() for _ in range(1024)])
+
+
+def _frozen_datetime(frozen_at: datetime) -> type:
+    """now()/utcnow() 가 frozen_at 을 반환하는 datetime 스텁 클래스 생성"""
+
+    class _FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            if tz is None:
+                return frozen_at.replace(tzinfo=None)
+            return frozen_at.astimezone(tz)
+
+        @classmethod
+        def utcnow(cls):
+            return frozen_at.replace(tzinfo=None)
+
+    return _FrozenDatetime
+
+
+@pytest.fixture(scope="module")
+def frozen_utc_now():
+    """src.utils.datetime 의 현재 시각을 모듈 단위로 고정
+
+    도메인 엔티티는 utc_now() 를 통해 시각을 얻으므로 src.utils.datetime.datetime
+    하나만 교체하면 create()/상태 전이 전체가 고정된 시각을 사용합니다.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("src.utils.datetime.datetime", _frozen_datetime(FROZEN_UTC_NOW))
+        yield FROZEN_UTC_NOW
+
+
+@pytest.fixture
+def freeze_utc_now(monkeypatch) -> Callable[[datetime], datetime]:
+    """src.utils.datetime 의 현재 시각을 주어진 시각으로 고정하는 함수 (테스트 단위)"""
+    def freeze(frozen_at: datetime) -> datetime:
+        monkeypatch.setattr("src.utils.datetime.datetime", _frozen_datetime(frozen_at))
+        return frozen_at
+
+    return freeze
+
+
+@pytest.fixture(scope="session")
+def next_uuid() -> Callable[[], UUID]:
+    """미리 생성해 둔 UUID 풀에서 다음 값을 꺼내는 함수"""
+    return lambda: next(_UUID_POOL)
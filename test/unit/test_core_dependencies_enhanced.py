@@ -27,7 +27,8 @@ from src.core.dependencies import (
     get_qdrant_client,
     get_monitor_service,
     get_database,
-    get_vector_db
+    get_vector_db,
+    _get_shared_qdrant_client
 )
 
 # 기존 테스트 파일에서 클래스들을 직접 정의
@@ -308,6 +309,25 @@ class TestFastAPIDependencyFunctions:
         with pytest.raises(ValueError, match="Service not registered"):
             get_qdrant_client()
     
+    def test_qdrant_client_injections_share_one_client(self, monkeypatch):
+        """QdrantClient 주입은 첫 요청 시 초기화된 qdrant_manager 의 같은 클라이언트를 반환"""
+        from src.infrastructure.vectordb.qdrant_client import QdrantClient, qdrant_manager
+        
+        # Given
+        container = DependencyContainer()
+        monkeypatch.setattr("src.core.dependencies._container", container)
+        monkeypatch.setattr(qdrant_manager, "_client", None)
+        container.register_factory(QdrantClient, _get_shared_qdrant_client)
+        
+        # When
+        first = inject(QdrantClient)
+        second = inject(QdrantClient)
+        
+        # Then
+        assert isinstance(first, QdrantClient)
+        assert first is second
+        assert first is qdrant_manager.client
+    
     def test_get_monitor_service_without_registration(self):
         """등록되지 않은 Monitor Service 의존성 테스트"""
         with pytest.raises(ValueError, match="Service not registered"):
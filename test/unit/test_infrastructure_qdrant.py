@@ -16,7 +16,8 @@ from src.infrastructure.vectordb.qdrant_client import (
     initialize_qdrant_collections,
     qdrant_health_check,
     create_point_struct,
-    create_filter_condition
+    create_filter_condition,
+    create_int8_quantization_config
 )
 
 
@@ -584,7 +585,9 @@ class TestUtilityFunctions:
                 mock_client.create_collection.assert_called_once_with(
                     collection_name="test_collection",
                     vector_size=1536,
-                    distance=Distance.COSINE
+                    distance=Distance.COSINE,
+                    quantization_config=create_int8_quantization_config(),
+                    on_disk=True
                 )
         finally:
             # 환경 변수 정리
@@ -649,6 +652,14 @@ class TestUtilityFunctions:
         assert point.vector == [0.1, 0.2, 0.3]
         assert point.payload == {"text": "test"}
     
+    def test_create_int8_quantization_config(self):
+        """int8 스칼라 양자화 설정 생성 테스트"""
+        config = create_int8_quantization_config()
+        
+        assert config.scalar.type == "int8"
+        assert config.scalar.quantile == 0.99
+        assert config.scalar.always_ram is True
+    
     def test_create_point_struct_no_payload(self):
         """페이로드 없는 PointStruct 생성 테스트"""
         point = create_point_struct(
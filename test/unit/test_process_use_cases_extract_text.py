@@ -3,9 +3,9 @@ Extract Text Use Case 단위 테스트
 """
 
 import pytest
-from unittest.mock import AsyncMock, Mock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 from uuid import uuid4
-from datetime import datetime
 
 from src.core.exceptions import ValidationError, DocumentProcessingError, UnsupportedFileTypeError
 from src.modules.process.domain.entities import (
@@ -19,33 +19,34 @@ from src.modules.process.application.use_cases.extract_text import (
     ExtractTextResult
 )
 
+# 엔티티 생성 시각을 고정해 테스트마다 시스템 시계를 읽지 않도록 함
+pytestmark = pytest.mark.usefixtures("frozen_utc_now")
+
 
 class TestExtractTextUseCase:
     """Extract Text Use Case 테스트"""
     
-    @pytest.fixture
-    def mock_job_repository(self):
-        """Mock ProcessingJobRepository"""
-        return AsyncMock()
-    
-    @pytest.fixture
-    def mock_text_extraction_service(self):
-        """Mock TextExtractionService"""
-        return AsyncMock()
-    
-    @pytest.fixture
-    def mock_event_publisher(self):
-        """Mock EventPublisher"""
-        return AsyncMock()
+    @pytest.fixture(scope="module")
+    def ports(self):
+        """모듈 범위 Mock 포트 (jobs, text, events)"""
+        return SimpleNamespace(jobs=AsyncMock(), text=AsyncMock(), events=AsyncMock())
     
     @pytest.fixture
-    def use_case(self, mock_job_repository, mock_text_extraction_service, mock_event_publisher):
-        """ExtractTextUseCase 인스턴스"""
-        return ExtractTextUseCase(
-            job_repository=mock_job_repository,
-            text_extraction_service=mock_text_extraction_service,
-            event_publisher=mock_event_publisher
+    def ctx(self, ports):
+        """ExtractTextUseCase 와 Mock 포트 묶음"""
+        yield SimpleNamespace(
+            use_case=ExtractTextUseCase(
+                job_repository=ports.jobs,
+                text_extraction_service=ports.text,
+                event_publisher=ports.events
+            ),
+            jobs=ports.jobs,
+            text=ports.text,
+            events=ports.events
         )
+        # 모듈 범위 Mock 은 테스트마다 초기화
+        for mock in (ports.jobs, ports.text, ports.events):
+            mock.reset_mock(return_value=True, side_effect=True)
     
     @pytest.fixture
     def sample_job(self):
@@ -86,21 +87,18 @@ class TestExtractTextUseCase:
     @pytest.mark.asyncio
     async def test_execute_success(
         self,
-        use_case,
-        mock_job_repository,
-        mock_text_extraction_service,
-        mock_event_publisher,
+        ctx,
         sample_job,
         sample_command,
         sample_extraction_data
     ):
         """정상적인 텍스트 추출 테스트"""
         # Given
-        mock_job_repository.find_by_id.return_value = sample_job
-        mock_text_extraction_service.extract_text.return_value = sample_extraction_data
+        ctx.jobs.find_by_id.return_value = sample_job
+        ctx.text.extract_text.return_value = sample_extraction_data
         
         # When
-        result = await use_case.execute(sample_command)
+        result = await ctx.use_case.execute(sample_command)
         
         # Then
         assert isinstance(result, ExtractTextResult)
@@ -111,7 +109,7 @@ class TestExtractTextUseCase:
         assert "successfully" in result.message
         
         # 서비스 호출 확인
-        mock_text_extraction_service.extract_text.assert_called_once_with(
+        ctx.text.extract_text.assert_called_once_with(
             document_id=sample_job.document_id,
             file_path=sample_command.file_path,
             file_type=sample_command.file_type,
@@ -119,13 +117,13 @@ class TestExtractTextUseCase:
         )
         
         # 작업 저장 확인 (시작 시와 완료 시 2번)
-        assert mock_job_repository.save.call_count == 2
+        assert ctx.jobs.save.call_count == 2
         
         # 이벤트 발행 확인
-        mock_event_publisher.publish_processing_completed.assert_called_once()
+        ctx.events.publish_processing_completed.assert_called_once()
     
     @pytest.mark.asyncio
-    async def test_execute_missing_job_id(self, use_case):
+    async def test_execute_missing_job_id(self, ctx):
         """Job ID 누락 테스트"""
         # Given
         command = ExtractTextCommand(
@@ -136,10 +134,10 @@ class TestExtractTextUseCase:
         
         # When & Then
         with pytest.raises(ValidationError, match="Job ID is required"):
-            await use_case.execute(command)
+            await ctx.use_case.execute(command)
     
     @pytest.mark.asyncio
-    async def test_execute_missing_file_path(self, use_case, sample_job):
+    async def test_execute_missing_file_path(self, ctx, sample_job):
         """파일 경로 누락 테스트"""
         # Given
         command = ExtractTextCommand(
@@ -150,10 +148,10 @@ class TestExtractTextUseCase:
         
         # When & Then
         with pytest.raises(ValidationError, match="File path is required"):
-            await use_case.execute(command)
+            await ctx.use_case.execute(command)
     
     @pytest.mark.asyncio
-    async def test_execute_missing_file_type(self, use_case, sample_job):
+    async def test_execute_missing_file_type(self, ctx, sample_job):
         """파일 타입 누락 테스트"""
         # Given
         command = ExtractTextCommand(
@@ -164,10 +162,10 @@ class TestExtractTextUseCase:
         
         # When & Then
         with pytest.raises(ValidationError, match="File type is required"):
-            await use_case.execute(command)
+            await ctx.use_case.execute(command)
     
     @pytest.mark.asyncio
-    async def test_execute_unsupported_file_type(self, use_case, sample_job):
+    async def test_execute_unsupported_file_type(self, ctx, sample_job):
         """지원하지 않는 파일 타입 테스트"""
         # Given
         command = ExtractTextCommand(
@@ -178,28 +176,26 @@ class TestExtractTextUseCase:
         
         # When & Then
         with pytest.raises(UnsupportedFileTypeError, match="not supported"):
-            await use_case.execute(command)
+            await ctx.use_case.execute(command)
     
     @pytest.mark.asyncio
     async def test_execute_job_not_found(
         self,
-        use_case,
-        mock_job_repository,
+        ctx,
         sample_command
     ):
         """작업을 찾을 수 없는 경우 테스트"""
         # Given
-        mock_job_repository.find_by_id.return_value = None
+        ctx.jobs.find_by_id.return_value = None
         
         # When & Then
         with pytest.raises(ValidationError, match="not found"):
-            await use_case.execute(sample_command)
+            await ctx.use_case.execute(sample_command)
     
     @pytest.mark.asyncio
     async def test_execute_wrong_processing_type(
         self,
-        use_case,
-        mock_job_repository,
+        ctx,
         sample_command
     ):
         """잘못된 처리 타입 테스트"""
@@ -212,68 +208,62 @@ class TestExtractTextUseCase:
             parameters={},
             max_retries=3
         )
-        mock_job_repository.find_by_id.return_value = job
+        ctx.jobs.find_by_id.return_value = job
         
         # When & Then
         with pytest.raises(ValidationError, match="not a text extraction job"):
-            await use_case.execute(sample_command)
+            await ctx.use_case.execute(sample_command)
     
     @pytest.mark.asyncio
     async def test_execute_job_not_pending(
         self,
-        use_case,
-        mock_job_repository,
+        ctx,
         sample_job,
         sample_command
     ):
         """대기 상태가 아닌 작업 테스트"""
         # Given
         sample_job.start_processing()  # 상태를 PROCESSING으로 변경
-        mock_job_repository.find_by_id.return_value = sample_job
+        ctx.jobs.find_by_id.return_value = sample_job
         
         # When & Then
         with pytest.raises(ValidationError, match="not in pending status"):
-            await use_case.execute(sample_command)
+            await ctx.use_case.execute(sample_command)
     
     @pytest.mark.asyncio
     async def test_execute_empty_text_extracted(
         self,
-        use_case,
-        mock_job_repository,
-        mock_text_extraction_service,
+        ctx,
         sample_job,
         sample_command
     ):
         """빈 텍스트 추출 결과 테스트"""
         # Given
-        mock_job_repository.find_by_id.return_value = sample_job
-        mock_text_extraction_service.extract_text.return_value = {
+        ctx.jobs.find_by_id.return_value = sample_job
+        ctx.text.extract_text.return_value = {
             "text_content": "",  # 빈 텍스트
             "metadata": {"page_count": 1}
         }
         
         # When & Then
         with pytest.raises(DocumentProcessingError, match="No text could be extracted"):
-            await use_case.execute(sample_command)
+            await ctx.use_case.execute(sample_command)
     
     @pytest.mark.asyncio
     async def test_execute_extraction_service_error_retryable(
         self,
-        use_case,
-        mock_job_repository,
-        mock_text_extraction_service,
-        mock_event_publisher,
+        ctx,
         sample_job,
         sample_command
     ):
         """재시도 가능한 추출 서비스 오류 테스트"""
         # Given
-        mock_job_repository.find_by_id.return_value = sample_job
-        mock_text_extraction_service.extract_text.side_effect = Exception("Temporary error")
+        ctx.jobs.find_by_id.return_value = sample_job
+        ctx.text.extract_text.side_effect = Exception("Temporary error")
         
         # When & Then
         with pytest.raises(Exception, match="Temporary error"):
-            await use_case.execute(sample_command)
+            await ctx.use_case.execute(sample_command)
         
         # 작업이 재시도 상태로 변경되었는지 확인
         assert sample_job.status == ProcessingStatus.FAILED
@@ -281,41 +271,35 @@ class TestExtractTextUseCase:
         assert sample_job.retry_count > 0
         
         # 실패 이벤트 발행 확인 (최대 재시도 횟수 도달로 영구 실패)
-        mock_event_publisher.publish_processing_failed.assert_called_once()
+        ctx.events.publish_processing_failed.assert_called_once()
     
     @pytest.mark.asyncio
     async def test_execute_extraction_service_error_non_retryable(
         self,
-        use_case,
-        mock_job_repository,
-        mock_text_extraction_service,
-        mock_event_publisher,
+        ctx,
         sample_job,
         sample_command
     ):
         """재시도 불가능한 추출 서비스 오류 테스트"""
         # Given
-        mock_job_repository.find_by_id.return_value = sample_job
-        mock_text_extraction_service.extract_text.side_effect = UnsupportedFileTypeError("Unsupported format")
+        ctx.jobs.find_by_id.return_value = sample_job
+        ctx.text.extract_text.side_effect = UnsupportedFileTypeError("Unsupported format")
         
         # When & Then
         with pytest.raises(UnsupportedFileTypeError):
-            await use_case.execute(sample_command)
+            await ctx.use_case.execute(sample_command)
         
         # 작업이 영구 실패 상태로 변경되었는지 확인
         assert sample_job.status == ProcessingStatus.FAILED
         assert sample_job.retry_count == sample_job.max_retries  # 최대 재시도 횟수로 설정됨
         
         # 실패 이벤트 발행 확인
-        mock_event_publisher.publish_processing_failed.assert_called_once()
+        ctx.events.publish_processing_failed.assert_called_once()
     
     @pytest.mark.asyncio
     async def test_execute_max_retries_exceeded(
         self,
-        use_case,
-        mock_job_repository,
-        mock_text_extraction_service,
-        mock_event_publisher,
+        ctx,
         sample_command
     ):
         """최대 재시도 횟수 초과 테스트"""
@@ -331,25 +315,23 @@ class TestExtractTextUseCase:
         # 이미 최대 재시도 횟수에 도달
         job.retry_count = 1
         
-        mock_job_repository.find_by_id.return_value = job
-        mock_text_extraction_service.extract_text.side_effect = Exception("Persistent error")
+        ctx.jobs.find_by_id.return_value = job
+        ctx.text.extract_text.side_effect = Exception("Persistent error")
         
         # When & Then
         with pytest.raises(Exception, match="Persistent error"):
-            await use_case.execute(sample_command)
+            await ctx.use_case.execute(sample_command)
         
         # 영구 실패로 처리되었는지 확인
         assert job.status == ProcessingStatus.FAILED
         
         # 실패 이벤트 발행 확인
-        mock_event_publisher.publish_processing_failed.assert_called_once()
+        ctx.events.publish_processing_failed.assert_called_once()
     
     @pytest.mark.asyncio
     async def test_execute_with_default_extraction_options(
         self,
-        use_case,
-        mock_job_repository,
-        mock_text_extraction_service,
+        ctx,
         sample_job,
         sample_extraction_data
     ):
@@ -362,39 +344,39 @@ class TestExtractTextUseCase:
             # extraction_options 없음
         )
         
-        mock_job_repository.find_by_id.return_value = sample_job
-        mock_text_extraction_service.extract_text.return_value = sample_extraction_data
+        ctx.jobs.find_by_id.return_value = sample_job
+        ctx.text.extract_text.return_value = sample_extraction_data
         
         # When
-        result = await use_case.execute(command)
+        result = await ctx.use_case.execute(command)
         
         # Then
         assert result.status == ProcessingStatus.COMPLETED
         
         # 빈 딕셔너리가 파라미터로 전달되었는지 확인
-        mock_text_extraction_service.extract_text.assert_called_once_with(
+        ctx.text.extract_text.assert_called_once_with(
             document_id=sample_job.document_id,
             file_path=command.file_path,
             file_type=command.file_type,
             parameters={}
         )
     
-    def test_is_retryable_error_validation_error(self, use_case):
+    def test_is_retryable_error_validation_error(self, ctx):
         """ValidationError는 재시도 불가능"""
         error = ValidationError("Invalid input")
-        assert not use_case._is_retryable_error(error)
+        assert not ctx.use_case._is_retryable_error(error)
     
-    def test_is_retryable_error_unsupported_file_type(self, use_case):
+    def test_is_retryable_error_unsupported_file_type(self, ctx):
         """UnsupportedFileTypeError는 재시도 불가능"""
         error = UnsupportedFileTypeError("Unsupported format")
-        assert not use_case._is_retryable_error(error)
+        assert not ctx.use_case._is_retryable_error(error)
     
-    def test_is_retryable_error_generic_exception(self, use_case):
+    def test_is_retryable_error_generic_exception(self, ctx):
         """일반 예외는 재시도 가능"""
         error = Exception("Temporary failure")
-        assert use_case._is_retryable_error(error)
+        assert ctx.use_case._is_retryable_error(error)
     
-    def test_is_retryable_error_document_processing_error(self, use_case):
+    def test_is_retryable_error_document_processing_error(self, ctx):
         """DocumentProcessingError는 재시도 가능"""
         error = DocumentProcessingError("Processing failed")
-        assert use_case._is_retryable_error(error)
+        assert ctx.use_case._is_retryable_error(error)
@@ -3,9 +3,9 @@ Generate Embeddings Use Case 단위 테스트
 """
 
 import pytest
-from unittest.mock import AsyncMock, Mock
-from uuid import uuid4, UUID
-from typing import List, Dict, Any
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
 
 from src.core.exceptions import ValidationError, DocumentProcessingError
 from src.modules.process.domain.entities import (
@@ -23,45 +23,41 @@ from src.modules.process.application.use_cases.generate_embeddings import (
     EmbeddingResult
 )
 
+# 엔티티 생성 시각을 고정해 테스트마다 시스템 시계를 읽지 않도록 함
+pytestmark = pytest.mark.usefixtures("frozen_utc_now")
+
 
 class TestGenerateEmbeddingsUseCase:
     """임베딩 생성 유즈케이스 테스트"""
     
-    @pytest.fixture
-    def mock_job_repository(self):
-        """Mock 작업 리포지토리"""
-        return AsyncMock()
-    
-    @pytest.fixture
-    def mock_chunk_repository(self):
-        """Mock 청크 리포지토리"""
-        return AsyncMock()
-    
-    @pytest.fixture
-    def mock_embedding_service(self):
-        """Mock 임베딩 서비스"""
-        return AsyncMock()
-    
-    @pytest.fixture
-    def mock_event_publisher(self):
-        """Mock 이벤트 발행자"""
-        return AsyncMock()
+    @pytest.fixture(scope="module")
+    def ports(self):
+        """모듈 범위 Mock 포트 (jobs, chunks, embedder, events)"""
+        return SimpleNamespace(
+            jobs=AsyncMock(),
+            chunks=AsyncMock(),
+            embedder=AsyncMock(),
+            events=AsyncMock()
+        )
     
     @pytest.fixture
-    def use_case(
-        self,
-        mock_job_repository,
-        mock_chunk_repository,
-        mock_embedding_service,
-        mock_event_publisher
-    ):
-        """임베딩 생성 유즈케이스 인스턴스"""
-        return GenerateEmbeddingsUseCase(
-            job_repository=mock_job_repository,
-            chunk_repository=mock_chunk_repository,
-            embedding_service=mock_embedding_service,
-            event_publisher=mock_event_publisher
+    def ctx(self, ports):
+        """임베딩 생성 유즈케이스와 Mock 포트 묶음"""
+        yield SimpleNamespace(
+            use_case=GenerateEmbeddingsUseCase(
+                job_repository=ports.jobs,
+                chunk_repository=ports.chunks,
+                embedding_service=ports.embedder,
+                event_publisher=ports.events
+            ),
+            jobs=ports.jobs,
+            chunks=ports.chunks,
+            embedder=ports.embedder,
+            events=ports.events
         )
+        # 모듈 범위 Mock 은 테스트마다 초기화
+        for mock in (ports.jobs, ports.chunks, ports.embedder, ports.events):
+            mock.reset_mock(return_value=True, side_effect=True)
     
     @pytest.fixture
     def sample_job(self):
@@ -117,24 +113,20 @@ class TestGenerateEmbeddingsUseCase:
     
     async def test_execute_success(
         self,
-        use_case,
+        ctx,
         sample_command,
         sample_job,
         sample_chunks,
-        sample_embedding_results,
-        mock_job_repository,
-        mock_chunk_repository,
-        mock_embedding_service,
-        mock_event_publisher
+        sample_embedding_results
     ):
         """정상적인 임베딩 생성 테스트"""
         # Given
-        mock_job_repository.find_by_id.return_value = sample_job
-        mock_chunk_repository.find_by_ids.return_value = sample_chunks
-        mock_embedding_service.generate_embeddings.return_value = sample_embedding_results
+        ctx.jobs.find_by_id.return_value = sample_job
+        ctx.chunks.find_by_ids.return_value = sample_chunks
+        ctx.embedder.generate_embeddings.return_value = sample_embedding_results
         
         # When
-        result = await use_case.execute(sample_command)
+        result = await ctx.use_case.execute(sample_command)
         
         # Then
         assert isinstance(result, GenerateEmbeddingsResult)
@@ -144,20 +136,20 @@ class TestGenerateEmbeddingsUseCase:
         assert len(result.embeddings) == len(sample_chunks)
         
         # 리포지토리 호출 검증
-        mock_job_repository.find_by_id.assert_called_once_with(sample_command.job_id)
-        mock_chunk_repository.find_by_ids.assert_called_once_with(sample_command.chunk_ids)
-        mock_job_repository.save.assert_called()
+        ctx.jobs.find_by_id.assert_called_once_with(sample_command.job_id)
+        ctx.chunks.find_by_ids.assert_called_once_with(sample_command.chunk_ids)
+        ctx.jobs.save.assert_called()
         
         # 임베딩 서비스 호출 검증
-        mock_embedding_service.generate_embeddings.assert_called_once()
+        ctx.embedder.generate_embeddings.assert_called_once()
         
         # 이벤트 발행 검증
-        mock_event_publisher.publish_processing_completed.assert_called_once()
-        mock_event_publisher.publish_embeddings_created.assert_called_once()
+        ctx.events.publish_processing_completed.assert_called_once()
+        ctx.events.publish_embeddings_created.assert_called_once()
     
     async def test_execute_with_invalid_job_id(
         self,
-        use_case,
+        ctx,
         sample_command
     ):
         """잘못된 작업 ID로 실행 시 오류 테스트"""
@@ -170,11 +162,11 @@ class TestGenerateEmbeddingsUseCase:
         
         # When & Then
         with pytest.raises(ValidationError, match="Job ID is required"):
-            await use_case.execute(command)
+            await ctx.use_case.execute(command)
     
     async def test_execute_with_empty_chunk_ids(
         self,
-        use_case,
+        ctx,
         sample_command
     ):
         """빈 청크 ID 목록으로 실행 시 오류 테스트"""
@@ -187,11 +179,11 @@ class TestGenerateEmbeddingsUseCase:
         
         # When & Then
         with pytest.raises(ValidationError, match="Chunk IDs are required"):
-            await use_case.execute(command)
+            await ctx.use_case.execute(command)
     
     async def test_execute_with_too_many_chunks(
         self,
-        use_case
+        ctx
     ):
         """너무 많은 청크로 실행 시 오류 테스트"""
         # Given
@@ -203,11 +195,11 @@ class TestGenerateEmbeddingsUseCase:
         
         # When & Then
         with pytest.raises(ValidationError, match="Too many chunks in single batch"):
-            await use_case.execute(command)
+            await ctx.use_case.execute(command)
     
     async def test_execute_with_duplicate_chunk_ids(
         self,
-        use_case
+        ctx
     ):
         """중복 청크 ID로 실행 시 오류 테스트"""
         # Given
@@ -220,27 +212,25 @@ class TestGenerateEmbeddingsUseCase:
         
         # When & Then
         with pytest.raises(ValidationError, match="Duplicate chunk IDs found"):
-            await use_case.execute(command)
+            await ctx.use_case.execute(command)
     
     async def test_execute_with_job_not_found(
         self,
-        use_case,
-        sample_command,
-        mock_job_repository
+        ctx,
+        sample_command
     ):
         """존재하지 않는 작업으로 실행 시 오류 테스트"""
         # Given
-        mock_job_repository.find_by_id.return_value = None
+        ctx.jobs.find_by_id.return_value = None
         
         # When & Then
         with pytest.raises(ValidationError, match="Job .* not found"):
-            await use_case.execute(sample_command)
+            await ctx.use_case.execute(sample_command)
     
     async def test_execute_with_wrong_job_type(
         self,
-        use_case,
-        sample_command,
-        mock_job_repository
+        ctx,
+        sample_command
     ):
         """잘못된 작업 유형으로 실행 시 오류 테스트"""
         # Given
@@ -250,115 +240,99 @@ class TestGenerateEmbeddingsUseCase:
             processing_type=ProcessingType.TEXT_EXTRACTION,  # 잘못된 유형
             priority=1
         )
-        mock_job_repository.find_by_id.return_value = wrong_job
+        ctx.jobs.find_by_id.return_value = wrong_job
         
         # When & Then
         with pytest.raises(ValidationError, match="is not an embedding job"):
-            await use_case.execute(sample_command)
+            await ctx.use_case.execute(sample_command)
     
     async def test_execute_with_wrong_job_status(
         self,
-        use_case,
+        ctx,
         sample_command,
-        sample_job,
-        mock_job_repository
+        sample_job
     ):
         """잘못된 작업 상태로 실행 시 오류 테스트"""
         # Given
         sample_job.start_processing()  # 상태를 PROCESSING으로 변경
-        mock_job_repository.find_by_id.return_value = sample_job
+        ctx.jobs.find_by_id.return_value = sample_job
         
         # When & Then
         with pytest.raises(ValidationError, match="is not in pending status"):
-            await use_case.execute(sample_command)
+            await ctx.use_case.execute(sample_command)
     
     async def test_execute_with_chunks_not_found(
         self,
-        use_case,
+        ctx,
         sample_command,
-        sample_job,
-        mock_job_repository,
-        mock_chunk_repository
+        sample_job
     ):
         """청크를 찾을 수 없을 때 오류 테스트"""
         # Given
-        mock_job_repository.find_by_id.return_value = sample_job
-        mock_chunk_repository.find_by_ids.return_value = []  # 빈 결과
+        ctx.jobs.find_by_id.return_value = sample_job
+        ctx.chunks.find_by_ids.return_value = []  # 빈 결과
         
         # When & Then
         with pytest.raises(ValidationError, match="No chunks found"):
-            await use_case.execute(sample_command)
+            await ctx.use_case.execute(sample_command)
     
     async def test_execute_with_missing_chunks(
         self,
-        use_case,
+        ctx,
         sample_command,
         sample_job,
-        sample_chunks,
-        mock_job_repository,
-        mock_chunk_repository
+        sample_chunks
     ):
         """일부 청크가 누락된 경우 오류 테스트"""
         # Given
-        mock_job_repository.find_by_id.return_value = sample_job
-        mock_chunk_repository.find_by_ids.return_value = sample_chunks[:2]  # 일부만 반환
+        ctx.jobs.find_by_id.return_value = sample_job
+        ctx.chunks.find_by_ids.return_value = sample_chunks[:2]  # 일부만 반환
         
         # When & Then
         with pytest.raises(ValidationError, match="Chunks not found"):
-            await use_case.execute(sample_command)
+            await ctx.use_case.execute(sample_command)
     
     async def test_execute_with_no_embeddings_generated(
         self,
-        use_case,
+        ctx,
         sample_command,
         sample_job,
-        sample_chunks,
-        mock_job_repository,
-        mock_chunk_repository,
-        mock_embedding_service
+        sample_chunks
     ):
         """임베딩 생성 실패 시 오류 테스트"""
         # Given
-        mock_job_repository.find_by_id.return_value = sample_job
-        mock_chunk_repository.find_by_ids.return_value = sample_chunks
-        mock_embedding_service.generate_embeddings.return_value = []  # 빈 결과
+        ctx.jobs.find_by_id.return_value = sample_job
+        ctx.chunks.find_by_ids.return_value = sample_chunks
+        ctx.embedder.generate_embeddings.return_value = []  # 빈 결과
         
         # When & Then
         with pytest.raises(DocumentProcessingError, match="No embeddings could be generated"):
-            await use_case.execute(sample_command)
+            await ctx.use_case.execute(sample_command)
     
     async def test_execute_with_embedding_service_error(
         self,
-        use_case,
+        ctx,
         sample_command,
         sample_job,
-        sample_chunks,
-        mock_job_repository,
-        mock_chunk_repository,
-        mock_embedding_service,
-        mock_event_publisher
+        sample_chunks
     ):
         """임베딩 서비스 오류 시 처리 테스트"""
         # Given
-        mock_job_repository.find_by_id.return_value = sample_job
-        mock_chunk_repository.find_by_ids.return_value = sample_chunks
-        mock_embedding_service.generate_embeddings.side_effect = Exception("API Error")
+        ctx.jobs.find_by_id.return_value = sample_job
+        ctx.chunks.find_by_ids.return_value = sample_chunks
+        ctx.embedder.generate_embeddings.side_effect = Exception("API Error")
         
         # When & Then
         with pytest.raises(Exception, match="API Error"):
-            await use_case.execute(sample_command)
+            await ctx.use_case.execute(sample_command)
         
         # 실패 이벤트 발행 검증
-        mock_event_publisher.publish_processing_failed.assert_called_once()
+        ctx.events.publish_processing_failed.assert_called_once()
     
     async def test_execute_with_batch_processing(
         self,
-        use_case,
-        sample_job,
-        mock_job_repository,
-        mock_chunk_repository,
-        mock_embedding_service,
-        mock_event_publisher
+        ctx,
+        sample_job
     ):
         """배치 처리 테스트"""
         # Given
@@ -403,21 +377,21 @@ class TestGenerateEmbeddingsUseCase:
                 "dimensions": 1536
             })
         
-        mock_job_repository.find_by_id.return_value = sample_job
-        mock_chunk_repository.find_by_ids.return_value = chunks
-        mock_embedding_service.generate_embeddings.side_effect = [batch1_results, batch2_results]
+        ctx.jobs.find_by_id.return_value = sample_job
+        ctx.chunks.find_by_ids.return_value = chunks
+        ctx.embedder.generate_embeddings.side_effect = [batch1_results, batch2_results]
         
         # When
-        result = await use_case.execute(command)
+        result = await ctx.use_case.execute(command)
         
         # Then
         assert result.total_embeddings == 60
         assert len(result.embeddings) == 60
         
         # 임베딩 서비스가 2번 호출되었는지 확인 (배치 처리)
-        assert mock_embedding_service.generate_embeddings.call_count == 2
+        assert ctx.embedder.generate_embeddings.call_count == 2
     
-    async def test_prepare_embedding_options(self, use_case):
+    async def test_prepare_embedding_options(self, ctx):
         """임베딩 옵션 준비 테스트"""
         # Given
         custom_options = {
@@ -426,7 +400,7 @@ class TestGenerateEmbeddingsUseCase:
         }
         
         # When
-        options = use_case._prepare_embedding_options(custom_options)
+        options = ctx.use_case._prepare_embedding_options(custom_options)
         
         # Then
         assert options["model_name"] == "custom-model"
@@ -434,10 +408,10 @@ class TestGenerateEmbeddingsUseCase:
         assert options["max_retries"] == 3  # 기본값
         assert options["timeout"] == 30.0  # 기본값
     
-    async def test_prepare_embedding_options_with_none(self, use_case):
+    async def test_prepare_embedding_options_with_none(self, ctx):
         """None 옵션으로 임베딩 옵션 준비 테스트"""
         # When
-        options = use_case._prepare_embedding_options(None)
+        options = ctx.use_case._prepare_embedding_options(None)
         
         # Then
         assert options["model_name"] == "text-embedding-ada-002"
@@ -445,7 +419,7 @@ class TestGenerateEmbeddingsUseCase:
         assert options["max_retries"] == 3
         assert options["timeout"] == 30.0
     
-    def test_create_processing_metadata(self, use_case, sample_chunks):
+    def test_create_processing_metadata(self, ctx, sample_chunks):
         """처리 메타데이터 생성 테스트"""
         # Given
         embeddings = []
@@ -464,7 +438,7 @@ class TestGenerateEmbeddingsUseCase:
         }
         
         # When
-        metadata = use_case._create_processing_metadata(embeddings, options)
+        metadata = ctx.use_case._create_processing_metadata(embeddings, options)
         
         # Then
         assert isinstance(metadata, ProcessingMetadata)
@@ -473,36 +447,32 @@ class TestGenerateEmbeddingsUseCase:
         assert metadata.parameters["dimensions"] == 1536
         assert metadata.parameters["batch_size"] == 50
     
-    def test_is_retryable_error(self, use_case):
+    def test_is_retryable_error(self, ctx):
         """재시도 가능한 오류 판단 테스트"""
         # Given & When & Then
-        assert not use_case._is_retryable_error(ValidationError("Invalid input"))
-        assert use_case._is_retryable_error(Exception("Network error"))
-        assert use_case._is_retryable_error(RuntimeError("API timeout"))
+        assert not ctx.use_case._is_retryable_error(ValidationError("Invalid input"))
+        assert ctx.use_case._is_retryable_error(Exception("Network error"))
+        assert ctx.use_case._is_retryable_error(RuntimeError("API timeout"))
     
     async def test_execute_with_chunks_already_having_embeddings(
         self,
-        use_case,
+        ctx,
         sample_command,
         sample_job,
         sample_chunks,
-        sample_embedding_results,
-        mock_job_repository,
-        mock_chunk_repository,
-        mock_embedding_service,
-        mock_event_publisher
+        sample_embedding_results
     ):
         """이미 임베딩이 있는 청크 처리 테스트"""
         # Given
         # 첫 번째 청크에 이미 임베딩 ID 설정
         sample_chunks[0].set_embedding_id(uuid4())
         
-        mock_job_repository.find_by_id.return_value = sample_job
-        mock_chunk_repository.find_by_ids.return_value = sample_chunks
-        mock_embedding_service.generate_embeddings.return_value = sample_embedding_results
+        ctx.jobs.find_by_id.return_value = sample_job
+        ctx.chunks.find_by_ids.return_value = sample_chunks
+        ctx.embedder.generate_embeddings.return_value = sample_embedding_results
         
         # When
-        result = await use_case.execute(sample_command)
+        result = await ctx.use_case.execute(sample_command)
         
         # Then
         # 경고 로그가 출력되지만 처리는 계속됨
@@ -2,6 +2,7 @@
 Vector Database 테스트
 """
 
+import numpy as np
 import pytest
 from unittest.mock import Mock, AsyncMock
 from uuid import UUID, uuid4
@@ -10,6 +11,25 @@ from datetime import datetime
 from src.modules.search.infrastructure.vector_db import VectorDatabase
 from src.modules.search.domain.entities import SearchResult
 from src.core.exceptions import SearchError
+from src.infrastructure.vectordb.qdrant_client import create_int8_quantization_config
+from test.unit._qdrant_helpers import JOHN_DOE_METADATA, QPoint, qdrant_payload
+
+
+class ArrayEqual:
+    """ndarray 인자를 np.testing.assert_array_equal 로 비교하는 Mock 매처"""
+
+    def __init__(self, expected: np.ndarray):
+        self.expected = expected
+
+    def __eq__(self, actual) -> bool:
+        try:
+            np.testing.assert_array_equal(actual, self.expected)
+        except AssertionError:
+            return False
+        return True
+
+    def __repr__(self) -> str:
+        return f"ArrayEqual({self.expected!r})"
 
 
 class TestVectorDatabase:
@@ -28,37 +48,33 @@ class TestVectorDatabase:
     @pytest.fixture
     def sample_embedding(self):
         """샘플 임베딩 벡터"""
-        return [0.1, 0.2, 0.3, 0.4, 0.5] * 100  # 500차원 벡터
+        return np.tile(np.array([0.1, 0.2, 0.3, 0.4, 0.5], dtype=np.float32), 100)  # 500차원 벡터
     
     @pytest.fixture
-    def mock_search_results(self):
+    def mock_search_results(self, next_uuid):
         """Mock Qdrant 검색 결과"""
         return [
-            Mock(
-                id=str(uuid4()),
+            QPoint(
+                id=str(next_uuid()),
                 score=0.95,
-                payload={
-                    "document_id": str(uuid4()),
-                    "content": "Python은 프로그래밍 언어입니다.",
-                    "source": "python_guide.pdf",
-                    "page": 1,
-                    "chunk_index": 0,
-                    "created_at": "2024-01-01T00:00:00Z",
-                    "metadata": {"author": "John Doe"}
-                }
+                payload=qdrant_payload(
+                    next_uuid(),
+                    "Python은 프로그래밍 언어입니다.",
+                    source="python_guide.pdf",
+                    metadata=JOHN_DOE_METADATA
+                )
             ),
-            Mock(
-                id=str(uuid4()),
+            QPoint(
+                id=str(next_uuid()),
                 score=0.87,
-                payload={
-                    "document_id": str(uuid4()),
-                    "content": "Python은 간단하고 읽기 쉬운 문법을 가지고 있습니다.",
-                    "source": "python_guide.pdf",
-                    "page": 2,
-                    "chunk_index": 1,
-                    "created_at": "2024-01-01T00:00:00Z",
-                    "metadata": {"author": "John Doe"}
-                }
+                payload=qdrant_payload(
+                    next_uuid(),
+                    "Python은 간단하고 읽기 쉬운 문법을 가지고 있습니다.",
+                    source="python_guide.pdf",
+                    page=2,
+                    chunk_index=1,
+                    metadata=JOHN_DOE_METADATA
+                )
             )
         ]
     
@@ -85,7 +101,7 @@ class TestVectorDatabase:
         # Qdrant 클라이언트가 올바른 파라미터로 호출되었는지 확인
         mock_qdrant_client.search.assert_called_once_with(
             collection_name="document_chunks",
-            query_vector=sample_embedding,
+            query_vector=ArrayEqual(sample_embedding),
             limit=5,
             score_threshold=0.7,
             query_filter=None
@@ -129,34 +145,26 @@ class TestVectorDatabase:
         assert "Vector search failed" in str(exc_info.value)
     
     @pytest.mark.asyncio
-    async def test_search_by_keywords_success(self, vector_db, mock_qdrant_client):
+    async def test_search_by_keywords_success(self, vector_db, mock_qdrant_client, next_uuid):
         """키워드 검색 테스트"""
         # Given
         keywords = ["Python", "프로그래밍"]
         mock_chunks = [
-            Mock(
-                id=str(uuid4()),
-                payload={
-                    "document_id": str(uuid4()),
-                    "content": "Python은 프로그래밍 언어입니다. Python을 배우면 좋습니다.",
-                    "source": "python_guide.pdf",
-                    "page": 1,
-                    "chunk_index": 0,
-                    "created_at": "2024-01-01T00:00:00Z",
-                    "metadata": {}
-                }
+            QPoint(
+                id=str(next_uuid()),
+                payload=qdrant_payload(
+                    next_uuid(),
+                    "Python은 프로그래밍 언어입니다. Python을 배우면 좋습니다.",
+                    source="python_guide.pdf"
+                )
             ),
-            Mock(
-                id=str(uuid4()),
-                payload={
-                    "document_id": str(uuid4()),
-                    "content": "Java는 다른 프로그래밍 언어입니다.",
-                    "source": "java_guide.pdf",
-                    "page": 1,
-                    "chunk_index": 0,
-                    "created_at": "2024-01-01T00:00:00Z",
-                    "metadata": {}
-                }
+            QPoint(
+                id=str(next_uuid()),
+                payload=qdrant_payload(
+                    next_uuid(),
+                    "Java는 다른 프로그래밍 언어입니다.",
+                    source="java_guide.pdf"
+                )
             )
         ]
         mock_qdrant_client.scroll = AsyncMock(return_value=(mock_chunks, None))
@@ -170,6 +178,51 @@ class TestVectorDatabase:
         assert results[0].score > 0
         assert "Python" in results[0].content
     
+    def test_score_keywords(self, vector_db):
+        """키워드 점수 계산 테스트"""
+        # Given
+        content = "python은 프로그래밍 언어입니다. python을 배우면 좋습니다."
+        
+        # When
+        score = vector_db._score_keywords(content, ["python", "프로그래밍"])
+        
+        # Then
+        assert score == 3 / 6
+        assert vector_db._score_keywords(content, ["java"]) == 0.0
+        assert vector_db._score_keywords("", ["python"]) == 0.0
+    
+    @pytest.mark.parametrize("keywords, content, expected_score", [
+        # 겹치는 키워드는 각각 따로 센다
+        pytest.param(["Python", "Py"], "Python 언어 소개", 2 / 3, id="overlapping"),
+        # 중복·대소문자 변형 키워드도 키워드마다 센다
+        pytest.param(["python", "Python"], "Python 언어 소개", 2 / 3, id="case-variants"),
+        pytest.param(
+            ["Python", "python을"], "Python을 배우면 정말 좋습니다", 2 / 4, id="particle-suffix"
+        ),
+    ])
+    @pytest.mark.asyncio
+    async def test_search_by_keywords_counts_per_keyword(
+        self, vector_db, mock_qdrant_client, next_uuid, keywords, content, expected_score
+    ):
+        """키워드별 출현 횟수를 합산해 점수를 매기는지 테스트"""
+        # Given
+        point = QPoint(id=str(next_uuid()), payload=qdrant_payload(next_uuid(), content))
+        mock_qdrant_client.scroll = AsyncMock(return_value=([point], None))
+        
+        # When
+        results = await vector_db.search_by_keywords(keywords)
+        
+        # Then
+        assert [result.score for result in results] == [pytest.approx(expected_score)]
+    
+    @pytest.mark.asyncio
+    async def test_search_by_keywords_empty_keywords(self, vector_db, mock_qdrant_client):
+        """빈 키워드만 있으면 청크를 조회하지 않음"""
+        mock_qdrant_client.scroll = AsyncMock()
+        
+        assert await vector_db.search_by_keywords(["", ""]) == []
+        mock_qdrant_client.scroll.assert_not_awaited()
+    
     @pytest.mark.asyncio
     async def test_hybrid_search_success(self, vector_db, mock_qdrant_client, sample_embedding, mock_search_results):
         """하이브리드 검색 테스트"""
@@ -193,22 +246,35 @@ class TestVectorDatabase:
         mock_qdrant_client.search.assert_called_once()
         mock_qdrant_client.scroll.assert_called_once()
     
+    @pytest.mark.asyncio
+    async def test_hybrid_search_keyword_failure_returns_vector_results(
+        self, vector_db, mock_qdrant_client, sample_embedding, mock_search_results
+    ):
+        """키워드 검색이 실패해도 벡터 검색 결과는 반환되는지 테스트"""
+        # Given
+        mock_qdrant_client.search = AsyncMock(return_value=mock_search_results)
+        mock_qdrant_client.scroll = AsyncMock(side_effect=Exception("Scroll failed"))
+        
+        # When
+        results = await vector_db.hybrid_search(
+            query_embedding=sample_embedding,
+            keywords=["Python"],
+            limit=5
+        )
+        
+        # Then
+        assert len(results) == len(mock_search_results)
+        mock_qdrant_client.search.assert_called_once()
+        mock_qdrant_client.scroll.assert_called_once()
+    
     @pytest.mark.asyncio
     async def test_get_chunk_by_id_success(self, vector_db, mock_qdrant_client):
         """ID로 청크 조회 성공 테스트"""
         # Given
         chunk_id = uuid4()
-        mock_point = Mock(
+        mock_point = QPoint(
             id=str(chunk_id),
-            payload={
-                "document_id": str(uuid4()),
-                "content": "Test content",
-                "source": "test.pdf",
-                "page": 1,
-                "chunk_index": 0,
-                "created_at": "2024-01-01T00:00:00Z",
-                "metadata": {}
-            }
+            payload=qdrant_payload(uuid4(), "Test content")
         )
         mock_qdrant_client.retrieve = AsyncMock(return_value=[mock_point])
         
@@ -241,6 +307,32 @@ class TestVectorDatabase:
         # Then
         assert result is None
     
+    @pytest.mark.asyncio
+    async def test_get_chunks_by_ids_single_retrieve(self, vector_db, mock_qdrant_client):
+        """여러 청크 ID 를 한 번의 retrieve 로 조회하는 테스트"""
+        # Given
+        chunk_ids = [uuid4(), uuid4(), uuid4()]
+        mock_points = [
+            QPoint(
+                id=str(chunk_id),
+                payload=qdrant_payload(uuid4(), f"Test content {i}", chunk_index=i)
+            )
+            for i, chunk_id in enumerate(chunk_ids)
+        ]
+        mock_qdrant_client.retrieve = AsyncMock(return_value=mock_points)
+        
+        # When
+        results = await vector_db.get_chunks_by_ids(chunk_ids)
+        
+        # Then
+        assert [result.chunk_id for result in results] == chunk_ids
+        mock_qdrant_client.retrieve.assert_called_once_with(
+            collection_name="document_chunks",
+            ids=[str(chunk_id) for chunk_id in chunk_ids],
+            with_payload=True,
+            with_vectors=False
+        )
+    
     @pytest.mark.asyncio
     async def test_get_chunks_by_document_success(self, vector_db, mock_qdrant_client, mock_search_results):
         """문서별 청크 조회 테스트"""
@@ -273,6 +365,7 @@ class TestVectorDatabase:
         mock_collection_info.points_count = 1000
         mock_collection_info.indexed_vectors_count = 1000
         mock_collection_info.status.name = "GREEN"
+        mock_collection_info.payload_schema = {"source": Mock(), "page": Mock()}
         mock_qdrant_client.get_collection = AsyncMock(return_value=mock_collection_info)
         
         # When
@@ -280,12 +373,95 @@ class TestVectorDatabase:
         
         # Then
         assert health["name"] == "document_chunks"
+        assert health["missing_payload_indexes"] == []
+        assert health["quantization"] is None
         assert health["vector_size"] == 512
         assert health["distance"] == "COSINE"
         assert health["points_count"] == 1000
         assert health["status"] == "GREEN"
         assert health["health"] == "healthy"
     
+    @pytest.mark.asyncio
+    async def test_check_collection_health_quantization(self, vector_db, mock_qdrant_client):
+        """int8 양자화가 설정된 컬렉션의 상태 확인 테스트"""
+        # Given
+        mock_collection_info = Mock()
+        mock_collection_info.status.name = "GREEN"
+        mock_collection_info.payload_schema = {}
+        mock_collection_info.config.quantization_config = create_int8_quantization_config()
+        mock_qdrant_client.get_collection = AsyncMock(return_value=mock_collection_info)
+        
+        # When
+        health = await vector_db.check_collection_health()
+        
+        # Then
+        assert health["quantization"] == "int8"
+    
+    @pytest.fixture
+    def green_collection_info(self):
+        """payload 인덱스가 모두 있는 정상 컬렉션 정보"""
+        collection_info = Mock()
+        collection_info.config.name = "document_chunks"
+        collection_info.config.params.vectors.size = 512
+        collection_info.config.params.vectors.distance.name = "COSINE"
+        collection_info.points_count = 1000
+        collection_info.indexed_vectors_count = 1000
+        collection_info.status.name = "GREEN"
+        collection_info.payload_schema = {"source": Mock(), "page": Mock()}
+        return collection_info
+    
+    @pytest.mark.asyncio
+    async def test_check_collection_health_cached(self, vector_db, mock_qdrant_client, green_collection_info):
+        """TTL 내 반복 상태 확인은 캐시된 결과를 사용하는지 테스트"""
+        # Given
+        mock_qdrant_client.get_collection = AsyncMock(return_value=green_collection_info)
+        
+        # When
+        first = await vector_db.check_collection_health()
+        second = await vector_db.check_collection_health()
+        
+        # Then
+        assert first == second
+        assert mock_qdrant_client.get_collection.call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_check_collection_health_cached_result_isolated(
+        self, vector_db, mock_qdrant_client, green_collection_info
+    ):
+        """반환된 상태 결과를 수정해도 다음 캐시 응답이 바뀌지 않는지 테스트"""
+        # Given
+        mock_qdrant_client.get_collection = AsyncMock(return_value=green_collection_info)
+        first = await vector_db.check_collection_health()
+        
+        # When
+        first["health"] = "unhealthy"
+        first["missing_payload_indexes"].append("source")
+        second = await vector_db.check_collection_health()
+        
+        # Then
+        assert second["health"] == "healthy"
+        assert second["missing_payload_indexes"] == []
+        assert mock_qdrant_client.get_collection.call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_check_collection_health_missing_payload_index(self, vector_db, mock_qdrant_client, caplog):
+        """payload 인덱스 누락 시 한 번만 안내 로그를 남기는지 테스트"""
+        # Given
+        mock_collection_info = Mock()
+        mock_collection_info.status.name = "GREEN"
+        mock_collection_info.payload_schema = {"source": Mock()}
+        mock_qdrant_client.get_collection = AsyncMock(return_value=mock_collection_info)
+        
+        # When
+        with caplog.at_level("INFO", logger="src.modules.search.infrastructure.vector_db"):
+            health = await vector_db.check_collection_health()
+            # 두 번째 상태 확인은 TTL 캐시가 응답하므로 안내 로그 경로를 직접 다시 호출
+            vector_db._log_missing_payload_indexes(health["missing_payload_indexes"])
+        
+        # Then
+        assert health["missing_payload_indexes"] == ["page"]
+        assert len([r for r in caplog.records if "payload index" in r.getMessage()]) == 1
+    
     @pytest.mark.asyncio
     async def test_check_collection_health_error(self, vector_db, mock_qdrant_client):
         """컬렉션 상태 확인 오류 테스트"""
@@ -307,6 +483,14 @@ class TestVectorDatabase:
         # Then
         assert result is None
     
+    def test_build_filter_unknown_key(self, vector_db):
+        """지원하지 않는 필터 키는 무시"""
+        # When
+        result = vector_db._build_filter({"unknown": "value"})
+        
+        # Then
+        assert result is None
+    
     def test_build_filter_document_id(self, vector_db):
         """문서 ID 필터 테스트"""
         # Given
@@ -322,7 +506,18 @@ class TestVectorDatabase:
         assert len(result["must"]) == 1
         assert result["must"][0]["key"] == "document_id"
         assert result["must"][0]["match"]["value"] == str(document_id)
-    
+
+    def test_build_filter_document_id_unhashable_value(self, vector_db):
+        """해시 불가능한 문서 ID 필터 값도 문자열로 변환되는지 테스트"""
+        # Given
+        document_ids = [str(uuid4()), str(uuid4())]
+
+        # When
+        result = vector_db._build_filter({"document_id": document_ids})
+
+        # Then
+        assert result["must"][0]["match"]["value"] == str(document_ids)
+
     def test_build_filter_source(self, vector_db):
         """소스 필터 테스트"""
         # Given
@@ -421,24 +616,24 @@ class TestVectorDatabase:
         assert result is not None
         assert len(result["must"]) == 3
     
-    def test_merge_and_rerank(self, vector_db):
+    def test_merge_and_rerank(self, vector_db, next_uuid):
         """검색 결과 병합 및 재순위화 테스트"""
         # Given
-        chunk_id_1 = uuid4()
-        chunk_id_2 = uuid4()
-        chunk_id_3 = uuid4()
+        chunk_id_1 = next_uuid()
+        chunk_id_2 = next_uuid()
+        chunk_id_3 = next_uuid()
         
         vector_results = [
             SearchResult(
                 chunk_id=chunk_id_1,
-                document_id=uuid4(),
+                document_id=next_uuid(),
                 content="Vector result 1",
                 score=0.9,
                 metadata={}
             ),
             SearchResult(
                 chunk_id=chunk_id_2,
-                document_id=uuid4(),
+                document_id=next_uuid(),
                 content="Vector result 2",
                 score=0.8,
                 metadata={}
@@ -448,14 +643,14 @@ class TestVectorDatabase:
         keyword_results = [
             SearchResult(
                 chunk_id=chunk_id_1,  # 벡터 검색과 중복
-                document_id=uuid4(),
+                document_id=next_uuid(),
                 content="Keyword result 1",
                 score=0.7,
                 metadata={}
             ),
             SearchResult(
                 chunk_id=chunk_id_3,  # 키워드 검색에서만 발견
-                document_id=uuid4(),
+                document_id=next_uuid(),
                 content="Keyword result 3",
                 score=0.6,
                 metadata={}
@@ -474,17 +669,33 @@ class TestVectorDatabase:
         # chunk_id_1은 벡터 + 키워드 점수를 가져야 함
         chunk_1_result = next(r for r in merged_results if r.chunk_id == chunk_id_1)
         expected_score_1 = 0.9 * 0.7 + 0.7 * 0.3  # 0.63 + 0.21 = 0.84
-        assert abs(chunk_1_result.score - expected_score_1) < 0.01
+        assert chunk_1_result.score == pytest.approx(expected_score_1, abs=1e-6)
         
         # chunk_id_2는 벡터 점수만 가져야 함
         chunk_2_result = next(r for r in merged_results if r.chunk_id == chunk_id_2)
         expected_score_2 = 0.8 * 0.7  # 0.56
-        assert abs(chunk_2_result.score - expected_score_2) < 0.01
+        assert chunk_2_result.score == pytest.approx(expected_score_2, abs=1e-6)
         
         # chunk_id_3은 키워드 점수만 가져야 함
         chunk_3_result = next(r for r in merged_results if r.chunk_id == chunk_id_3)
         expected_score_3 = 0.6 * 0.3  # 0.18
-        assert abs(chunk_3_result.score - expected_score_3) < 0.01
+        assert chunk_3_result.score == pytest.approx(expected_score_3, abs=1e-6)
         
         # 점수 순으로 정렬되어 있어야 함
         assert merged_results[0].score >= merged_results[1].score >= merged_results[2].score
+    
+    def test_merge_and_rerank_with_limit(self, vector_db):
+        """상위 limit 개만 반환하는 병합 테스트"""
+        # Given
+        vector_results = [
+            SearchResult(chunk_id=uuid4(), document_id=uuid4(), content=f"Vector {i}", score=score, metadata={})
+            for i, score in enumerate([0.5, 0.9, 0.7])
+        ]
+        
+        # When
+        merged_results = vector_db._merge_and_rerank(
+            vector_results, [], vector_weight=1.0, keyword_weight=0.0, limit=2
+        )
+        
+        # Then
+        assert [r.content for r in merged_results] == ["Vector 1", "Vector 2"]
@@ -3,8 +3,9 @@ Generate Answer Use Case 테스트
 """
 
 import pytest
-from unittest.mock import Mock, AsyncMock
-from uuid import UUID, uuid4
+from dataclasses import replace
+from functools import partial
+from unittest.mock import create_autospec
 from datetime import datetime
 
 from src.modules.search.application.use_cases.generate_answer import (
@@ -15,47 +16,58 @@ from src.modules.search.application.use_cases.generate_answer import (
 from src.modules.search.domain.entities import (
     SearchResult, Answer, AnswerRequest
 )
+from src.modules.search.application.ports.llm_port import LLMPort
 from src.core.exceptions import ValidationError, SearchError
 
 
+# LLM 포트 장애를 나타내는 공용 예외
+_LLM_FAILURE = RuntimeError("LLM service error")
+
+
 class TestGenerateAnswerUseCase:
     """Generate Answer Use Case 테스트"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_llm_port(self):
-        """Mock LLM Port"""
-        return Mock()
+        """Mock LLM Port (모듈 범위, LLMPort 시그니처로 autospec)"""
+        return create_autospec(LLMPort, instance=True, spec_set=True)
+    
+    @pytest.fixture(autouse=True)
+    def reset_llm(self, mock_llm_port):
+        """모듈 범위 generate_answer Mock 을 테스트마다 초기화"""
+        yield
+        mock_llm_port.generate_answer.reset_mock(return_value=True, side_effect=True)
     
     @pytest.fixture
     def use_case(self, mock_llm_port):
         """Use Case 인스턴스"""
         return GenerateAnswerUseCase(mock_llm_port)
     
-    @pytest.fixture
-    def sample_context_chunks(self):
-        """샘플 컨텍스트 청크"""
+    @pytest.fixture(scope="module")
+    def sample_context_chunks(self, next_uuid):
+        """샘플 컨텍스트 청크 (읽기 전용, 모듈 단위 공유)"""
         return [
             SearchResult(
-                chunk_id=uuid4(),
-                document_id=uuid4(),
+                chunk_id=next_uuid(),
+                document_id=next_uuid(),
                 content="Python은 프로그래밍 언어입니다.",
                 score=0.9,
                 metadata={"source": "python_guide.pdf", "page": 1}
             ),
             SearchResult(
-                chunk_id=uuid4(),
-                document_id=uuid4(),
+                chunk_id=next_uuid(),
+                document_id=next_uuid(),
                 content="Python은 간단하고 읽기 쉬운 문법을 가지고 있습니다.",
                 score=0.8,
                 metadata={"source": "python_guide.pdf", "page": 2}
             )
         ]
     
-    @pytest.fixture
-    def sample_command(self, sample_context_chunks):
-        """샘플 명령"""
+    @pytest.fixture(scope="module")
+    def command_template(self, sample_context_chunks, next_uuid):
+        """샘플 명령 템플릿 (읽기 전용, 변경이 필요하면 dataclasses.replace 사용)"""
         return GenerateAnswerCommand(
-            user_id=uuid4(),
+            user_id=next_uuid(),
             query_text="Python이 무엇인가요?",
             context_chunks=sample_context_chunks,
             model_name="gpt-3.5-turbo",
@@ -65,27 +77,43 @@ class TestGenerateAnswerUseCase:
             language="ko"
         )
     
-    @pytest.mark.asyncio
-    async def test_execute_success(self, use_case, mock_llm_port, sample_command):
+    @pytest.fixture(scope="module")
+    def answer_template(self, command_template, next_uuid):
+        """LLM 응답 Answer 템플릿 (읽기 전용, 고정 생성 시각)"""
+        return Answer(
+            id=next_uuid(),
+            request_id=next_uuid(),
+            user_id=command_template.user_id,
+            query_text=command_template.query_text,
+            answer_text="",
+            confidence_score=0.0,
+            tokens_used=0,
+            generation_time_ms=0.0,
+            created_at=datetime(2024, 1, 1),
+            metadata={}
+        )
+    
+    @pytest.fixture(scope="module")
+    def make_answer(self, answer_template):
+        """테스트에서 확인하는 필드만 덮어써 Answer 생성"""
+        return partial(replace, answer_template)
+    
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_execute_success(self, use_case, mock_llm_port, command_template, make_answer):
         """정상적인 답변 생성 테스트"""
         # Given
-        mock_answer = Answer(
-            id=uuid4(),
-            request_id=uuid4(),
-            user_id=sample_command.user_id,
-            query_text=sample_command.query_text,
+        mock_answer = make_answer(
             answer_text="Python은 프로그래밍 언어입니다. 간단하고 읽기 쉬운 문법을 가지고 있습니다.",
             confidence_score=0.85,
             tokens_used=150,
             generation_time_ms=1200.0,
-            created_at=datetime.now(),
             metadata={"model_name": "gpt-3.5-turbo"}
         )
         
-        mock_llm_port.generate_answer = AsyncMock(return_value=mock_answer)
+        mock_llm_port.generate_answer.return_value = mock_answer
         
         # When
-        result = await use_case.execute(sample_command)
+        result = await use_case.execute(command_template)
         
         # Then
         assert isinstance(result, GenerateAnswerResult)
@@ -99,32 +127,26 @@ class TestGenerateAnswerUseCase:
         mock_llm_port.generate_answer.assert_called_once()
         call_args = mock_llm_port.generate_answer.call_args[0][0]
         assert isinstance(call_args, AnswerRequest)
-        assert call_args.user_id == sample_command.user_id
-        assert call_args.query_text == sample_command.query_text
+        assert call_args.user_id == command_template.user_id
+        assert call_args.query_text == command_template.query_text
     
-    @pytest.mark.asyncio
-    async def test_execute_with_custom_system_prompt(self, use_case, mock_llm_port, sample_command):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_execute_with_custom_system_prompt(self, use_case, mock_llm_port, command_template, make_answer):
         """커스텀 시스템 프롬프트 테스트"""
         # Given
-        sample_command.system_prompt = "당신은 Python 전문가입니다."
+        command = replace(command_template, system_prompt="당신은 Python 전문가입니다.")
         
-        mock_answer = Answer(
-            id=uuid4(),
-            request_id=uuid4(),
-            user_id=sample_command.user_id,
-            query_text=sample_command.query_text,
+        mock_answer = make_answer(
             answer_text="전문가 답변입니다.",
             confidence_score=0.9,
             tokens_used=100,
-            generation_time_ms=1000.0,
-            created_at=datetime.now(),
-            metadata={}
+            generation_time_ms=1000.0
         )
         
-        mock_llm_port.generate_answer = AsyncMock(return_value=mock_answer)
+        mock_llm_port.generate_answer.return_value = mock_answer
         
         # When
-        result = await use_case.execute(sample_command)
+        result = await use_case.execute(command)
         
         # Then
         assert result.answer.answer_text == "전문가 답변입니다."
@@ -133,109 +155,100 @@ class TestGenerateAnswerUseCase:
         call_args = mock_llm_port.generate_answer.call_args[0][0]
         assert call_args.system_prompt == "당신은 Python 전문가입니다."
     
-    @pytest.mark.asyncio
-    async def test_execute_with_invalid_user_id(self, use_case, sample_command):
+    def test_command_with_invalid_user_id(self, command_template):
         """잘못된 사용자 ID 테스트"""
-        # Given
-        sample_command.user_id = None
-        
         # When & Then
-        with pytest.raises(SearchError) as exc_info:
-            await use_case.execute(sample_command)
+        with pytest.raises(ValidationError) as exc_info:
+            replace(command_template, user_id=None)
         
         assert "User ID is required" in str(exc_info.value)
     
-    @pytest.mark.asyncio
-    async def test_execute_with_empty_query(self, use_case, sample_command):
+    def test_command_with_empty_query(self, command_template):
         """빈 쿼리 테스트"""
-        # Given
-        sample_command.query_text = ""
-        
         # When & Then
-        with pytest.raises(SearchError) as exc_info:
-            await use_case.execute(sample_command)
+        with pytest.raises(ValidationError) as exc_info:
+            replace(command_template, query_text="")
         
         assert "Query text is required" in str(exc_info.value)
     
-    @pytest.mark.asyncio
-    async def test_execute_with_too_long_query(self, use_case, sample_command):
+    def test_command_with_too_long_query(self, command_template):
         """너무 긴 쿼리 테스트"""
-        # Given
-        sample_command.query_text = "a" * 1001
-        
         # When & Then
-        with pytest.raises(SearchError) as exc_info:
-            await use_case.execute(sample_command)
+        with pytest.raises(ValidationError) as exc_info:
+            replace(command_template, query_text="a" * 1001)
         
         assert "Query text is too long" in str(exc_info.value)
     
-    @pytest.mark.asyncio
-    async def test_execute_with_empty_context_chunks(self, use_case, sample_command):
+    def test_command_with_empty_context_chunks(self, command_template):
         """빈 컨텍스트 청크 테스트"""
-        # Given
-        sample_command.context_chunks = []
-        
         # When & Then
-        with pytest.raises(SearchError) as exc_info:
-            await use_case.execute(sample_command)
+        with pytest.raises(ValidationError) as exc_info:
+            replace(command_template, context_chunks=[])
         
         assert "Context chunks are required" in str(exc_info.value)
     
-    @pytest.mark.asyncio
-    async def test_execute_with_too_many_context_chunks(self, use_case, sample_command):
+    def test_command_with_too_many_context_chunks(self, command_template, next_uuid):
         """너무 많은 컨텍스트 청크 테스트"""
         # Given
-        sample_command.context_chunks = [
-            SearchResult(
-                chunk_id=uuid4(),
-                document_id=uuid4(),
-                content=f"Content {i}",
-                score=0.8,
-                metadata={}
-            ) for i in range(21)
-        ]
+        # 검증은 개수만 확인하므로 하나의 청크를 반복 사용
+        chunk = SearchResult(
+            chunk_id=next_uuid(),
+            document_id=next_uuid(),
+            content="Content",
+            score=0.8,
+            metadata={}
+        )
         
         # When & Then
-        with pytest.raises(SearchError) as exc_info:
-            await use_case.execute(sample_command)
+        with pytest.raises(ValidationError) as exc_info:
+            replace(command_template, context_chunks=[chunk] * 21)
         
         assert "Too many context chunks" in str(exc_info.value)
     
-    @pytest.mark.asyncio
-    async def test_execute_with_invalid_max_tokens(self, use_case, sample_command):
+    def test_command_with_invalid_max_tokens(self, command_template):
         """잘못된 최대 토큰 수 테스트"""
-        # Given
-        sample_command.max_tokens = 5000
-        
         # When & Then
-        with pytest.raises(SearchError) as exc_info:
-            await use_case.execute(sample_command)
+        with pytest.raises(ValidationError) as exc_info:
+            replace(command_template, max_tokens=5000)
         
         assert "Max tokens must be between 1 and 4000" in str(exc_info.value)
     
-    @pytest.mark.asyncio
-    async def test_execute_with_invalid_temperature(self, use_case, sample_command):
+    def test_command_with_invalid_temperature(self, command_template):
         """잘못된 온도 값 테스트"""
+        # When & Then
+        with pytest.raises(ValidationError) as exc_info:
+            replace(command_template, temperature=3.0)
+        
+        assert "Temperature must be between 0.0 and 2.0" in str(exc_info.value)
+    
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_execute_with_command_mutated_after_construction(
+        self, use_case, mock_llm_port, command_template
+    ):
+        """생성 후 변경된 잘못된 명령은 LLM 호출 전에 거부되는지 테스트"""
         # Given
-        sample_command.temperature = 3.0
+        command = replace(command_template)
+        command.temperature = 3.0
         
         # When & Then
         with pytest.raises(SearchError) as exc_info:
-            await use_case.execute(sample_command)
+            await use_case.execute(command)
         
-        assert "Temperature must be between 0.0 and 2.0" in str(exc_info.value)
+        assert isinstance(exc_info.value.__cause__, ValidationError)
+        mock_llm_port.generate_answer.assert_not_awaited()
     
-    @pytest.mark.asyncio
-    async def test_execute_with_llm_error(self, use_case, mock_llm_port, sample_command):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_execute_with_llm_error(self, use_case, mock_llm_port, command_template):
         """LLM 오류 테스트"""
         # Given
-        mock_llm_port.generate_answer = AsyncMock(side_effect=Exception("LLM service error"))
+        mock_llm_port.generate_answer.side_effect = _LLM_FAILURE
         
         # When & Then
         with pytest.raises(SearchError) as exc_info:
-            await use_case.execute(sample_command)
+            await use_case.execute(command_template)
         
         assert "Answer generation failed" in str(exc_info.value)
+        assert exc_info.value.__cause__ is _LLM_FAILURE
     
     def test_calculate_confidence_score(self, use_case, sample_context_chunks):
         """신뢰도 점수 계산 테스트"""
@@ -266,89 +279,74 @@ class TestGenerateAnswerUseCase:
         assert "python_guide.pdf" in formatted
         assert "페이지: 1" in formatted
     
-    def test_build_system_prompt_default(self, use_case, sample_command):
+    def test_build_system_prompt_default(self, use_case, command_template):
         """기본 시스템 프롬프트 생성 테스트"""
         # When
-        prompt = use_case._build_system_prompt(sample_command)
+        prompt = use_case._build_system_prompt(command_template)
         
         # Then
         assert "AI 어시스턴트" in prompt
         assert "한국어" in prompt
         assert "참고한 문서 출처를 명시하세요" in prompt
+        
+        # 질문이 달라도 같은 설정이면 캐시된 동일 프롬프트 사용
+        other_command = replace(command_template, query_text="Java가 무엇인가요?")
+        assert use_case._build_system_prompt(other_command) is prompt
     
-    def test_build_user_prompt(self, use_case, sample_command):
+    def test_build_user_prompt(self, use_case, command_template):
         """사용자 프롬프트 생성 테스트"""
         # When
-        prompt = use_case._build_user_prompt(sample_command)
+        prompt = use_case._build_user_prompt(command_template)
         
         # Then
         assert "=== 참고 문서 ===" in prompt
         assert "=== 질문 ===" in prompt
         assert "=== 답변 ===" in prompt
-        assert sample_command.query_text in prompt
-    
-    @pytest.mark.asyncio
-    async def test_get_answer_suggestions_how_question(self, use_case):
-        """'어떻게' 질문에 대한 제안 테스트"""
-        # When
-        suggestions = await use_case.get_answer_suggestions(
-            uuid4(), "Python을 어떻게 설치하나요?"
-        )
+        assert command_template.query_text in prompt
         
-        # Then
-        assert len(suggestions) <= 3
-        assert any("단계별 가이드" in s for s in suggestions)
-        assert any("모범 사례" in s for s in suggestions)
-    
-    @pytest.mark.asyncio
-    async def test_get_answer_suggestions_what_question(self, use_case):
-        """'무엇' 질문에 대한 제안 테스트"""
-        # When
-        suggestions = await use_case.get_answer_suggestions(
-            uuid4(), "Python이 무엇인가요?"
+        # 질문은 마지막에 위치하여 앞부분(접두부 + 참고 문서)이 질문과 무관하게 동일
+        other_prompt = use_case._build_user_prompt(
+            replace(command_template, query_text="Python을 왜 사용하나요?")
         )
-        
-        # Then
-        assert len(suggestions) <= 3
-        assert any("정의와 개념" in s for s in suggestions)
-        assert any("종류와 특징" in s for s in suggestions)
+        prefix = prompt[:prompt.index("=== 질문 ===")]
+        assert other_prompt.startswith(prefix)
     
-    @pytest.mark.asyncio
-    async def test_get_answer_suggestions_why_question(self, use_case):
-        """'왜' 질문에 대한 제안 테스트"""
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize("query_text,expected_keywords", [
+        ("Python을 어떻게 설치하나요?", ["단계별 가이드", "모범 사례"]),
+        ("Python이 무엇인가요?", ["정의와 개념", "종류와 특징"]),
+        ("Python을 왜 사용하나요?", ["배경과 원인", "장단점"]),
+    ])
+    async def test_get_answer_suggestions(
+        self, use_case, mock_llm_port, next_uuid, query_text, expected_keywords
+    ):
+        """질문 유형('어떻게'/'무엇'/'왜')별 제안 테스트"""
         # When
-        suggestions = await use_case.get_answer_suggestions(
-            uuid4(), "Python을 왜 사용하나요?"
-        )
+        suggestions = await use_case.get_answer_suggestions(next_uuid(), query_text)
         
         # Then
         assert len(suggestions) <= 3
-        assert any("배경과 원인" in s for s in suggestions)
-        assert any("장단점" in s for s in suggestions)
+        for keyword in expected_keywords:
+            assert any(keyword in s for s in suggestions)
+        assert mock_llm_port.generate_answer.await_count == 0
     
-    @pytest.mark.asyncio
-    async def test_regenerate_answer(self, use_case, mock_llm_port, sample_command):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_regenerate_answer(self, use_case, mock_llm_port, command_template, make_answer):
         """답변 재생성 테스트"""
         # Given
         feedback = "더 자세한 설명이 필요합니다."
         
-        mock_answer = Answer(
-            id=uuid4(),
-            request_id=uuid4(),
-            user_id=sample_command.user_id,
-            query_text=sample_command.query_text,
+        mock_answer = make_answer(
             answer_text="재생성된 더 자세한 답변입니다.",
             confidence_score=0.9,
             tokens_used=200,
-            generation_time_ms=1500.0,
-            created_at=datetime.now(),
-            metadata={}
+            generation_time_ms=1500.0
         )
         
-        mock_llm_port.generate_answer = AsyncMock(return_value=mock_answer)
+        mock_llm_port.generate_answer.return_value = mock_answer
         
         # When
-        result = await use_case.regenerate_answer(sample_command, feedback, 0.8)
+        result = await use_case.regenerate_answer(command_template, feedback, 0.8)
         
         # Then
         assert result.answer.answer_text == "재생성된 더 자세한 답변입니다."
@@ -357,21 +355,25 @@ class TestGenerateAnswerUseCase:
         call_args = mock_llm_port.generate_answer.call_args[0][0]
         assert call_args.temperature == 0.8
     
-    @pytest.mark.asyncio
-    async def test_evaluate_answer_quality(self, use_case):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_regenerate_answer_with_invalid_temperature(self, use_case, mock_llm_port, command_template):
+        """잘못된 재생성 온도 값 테스트"""
+        # When & Then
+        with pytest.raises(SearchError) as exc_info:
+            await use_case.regenerate_answer(command_template, "피드백", 3.0)
+        
+        assert "Temperature must be between 0.0 and 2.0" in str(exc_info.value)
+        assert mock_llm_port.generate_answer.await_count == 0
+    
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_evaluate_answer_quality(self, use_case, make_answer):
         """답변 품질 평가 테스트"""
         # Given
-        answer = Answer(
-            id=uuid4(),
-            request_id=uuid4(),
-            user_id=uuid4(),
-            query_text="Python이 무엇인가요?",
+        answer = make_answer(
             answer_text="Python은 프로그래밍 언어입니다. 간단하고 읽기 쉬운 문법을 가지고 있어서 초보자도 쉽게 배울 수 있습니다. 데이터 분석, 웹 개발, 인공지능 등 다양한 분야에서 사용됩니다.",
             confidence_score=0.85,
             tokens_used=150,
-            generation_time_ms=1200.0,
-            created_at=datetime.now(),
-            metadata={}
+            generation_time_ms=1200.0
         )
         
         expected_keywords = ["Python", "프로그래밍", "언어", "문법"]
@@ -390,21 +392,15 @@ class TestGenerateAnswerUseCase:
         assert 0.0 <= evaluation["overall_quality"] <= 1.0
         assert evaluation["relevance"] > 0.5  # 키워드가 많이 매칭되므로
     
-    @pytest.mark.asyncio
-    async def test_evaluate_answer_quality_without_keywords(self, use_case):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_evaluate_answer_quality_without_keywords(self, use_case, make_answer):
         """키워드 없이 답변 품질 평가 테스트"""
         # Given
-        answer = Answer(
-            id=uuid4(),
-            request_id=uuid4(),
-            user_id=uuid4(),
-            query_text="Python이 무엇인가요?",
+        answer = make_answer(
             answer_text="짧은 답변입니다.",
             confidence_score=0.7,
             tokens_used=50,
-            generation_time_ms=800.0,
-            created_at=datetime.now(),
-            metadata={}
+            generation_time_ms=800.0
         )
         
         # When
@@ -5,9 +5,10 @@ Search Documents Use Case Tests
 """
 
 import pytest
+from dataclasses import replace
 from unittest.mock import AsyncMock, Mock
-from uuid import uuid4
 from typing import List
+from uuid import uuid4
 
 from src.core.exceptions import ValidationError, SearchError
 from src.modules.search.domain.entities import SearchType, SearchResult
@@ -16,22 +17,87 @@ from src.modules.search.application.use_cases.search_documents import (
     SearchDocumentsCommand,
     SearchDocumentsResult
 )
-from src.modules.search.application.ports.vector_search_port import VectorSearchPort
-from src.modules.search.application.ports.llm_port import EmbeddingPort
+
+# 테스트 간 공유하는 읽기 전용 쿼리 임베딩
+SAMPLE_EMBEDDING = (0.1, 0.2, 0.3)
+
+# 최대 길이(1000자)를 초과하는 쿼리
+_TOO_LONG_QUERY = "a" * 1001
+
+# 검증 단계에서 거부되는 명령과 기대 오류 메시지 (실행 전 검증되므로 공유 가능)
+_VALIDATION_USER_ID = uuid4()
+_VALIDATION_CASES = [
+    pytest.param(
+        SearchDocumentsCommand(user_id=None, query_text="x"),
+        "User ID is required",
+        id="missing-user-id"
+    ),
+    pytest.param(
+        SearchDocumentsCommand(user_id=_VALIDATION_USER_ID, query_text=""),
+        "Query text is required",
+        id="empty-query"
+    ),
+    pytest.param(
+        SearchDocumentsCommand(user_id=_VALIDATION_USER_ID, query_text="q", limit=0),
+        "Limit must be between 1 and 100",
+        id="limit-out-of-range"
+    ),
+    pytest.param(
+        SearchDocumentsCommand(user_id=_VALIDATION_USER_ID, query_text="q", threshold=1.5),
+        "Threshold must be between 0.0 and 1.0",
+        id="threshold-out-of-range"
+    ),
+    pytest.param(
+        SearchDocumentsCommand(user_id=_VALIDATION_USER_ID, query_text=_TOO_LONG_QUERY),
+        "Query text is too long",
+        id="query-too-long"
+    ),
+]
+
+
+class _StubVectorSearchPort:
+    """유즈케이스가 사용하는 검색 메서드만 가진 경량 벡터 검색 포트 스텁"""
+    
+    def __init__(self):
+        self.search_similar_chunks = AsyncMock()
+        self.search_by_keywords = AsyncMock()
+        self.hybrid_search = AsyncMock()
+    
+    def reset(self):
+        for method in (self.search_similar_chunks, self.search_by_keywords, self.hybrid_search):
+            method.reset_mock(return_value=True, side_effect=True)
+
+
+class _StubEmbeddingPort:
+    """임베딩 생성 메서드만 가진 경량 임베딩 포트 스텁 (기본 반환값: SAMPLE_EMBEDDING)"""
+    
+    def __init__(self):
+        self.create_embedding = AsyncMock(return_value=SAMPLE_EMBEDDING)
+    
+    def reset(self):
+        self.create_embedding.reset_mock(return_value=True, side_effect=True)
+        self.create_embedding.return_value = SAMPLE_EMBEDDING
 
 
 class TestSearchDocumentsUseCase:
     """문서 검색 유즈케이스 테스트"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_vector_search_port(self):
-        """벡터 검색 포트 모킹"""
-        return AsyncMock(spec=VectorSearchPort)
+        """벡터 검색 포트 스텁 (모듈 범위)"""
+        return _StubVectorSearchPort()
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_embedding_port(self):
-        """임베딩 포트 모킹"""
-        return AsyncMock(spec=EmbeddingPort)
+        """임베딩 포트 스텁 (모듈 범위)"""
+        return _StubEmbeddingPort()
+    
+    @pytest.fixture(autouse=True)
+    def reset_ports(self, mock_vector_search_port, mock_embedding_port):
+        """모듈 범위 포트 스텁을 테스트마다 초기화"""
+        yield
+        mock_vector_search_port.reset()
+        mock_embedding_port.reset()
     
     @pytest.fixture
     def use_case(self, mock_vector_search_port, mock_embedding_port):
@@ -42,132 +108,137 @@ class TestSearchDocumentsUseCase:
         )
     
     @pytest.fixture
-    def sample_command(self):
+    def use_case_lite(self):
+        """포트를 사용하지 않는 동기 헬퍼 테스트용 유즈케이스"""
+        return SearchDocumentsUseCase(vector_search_port=Mock(), embedding_port=Mock())
+    
+    @pytest.fixture
+    def sample_command(self, next_uuid):
         """샘플 검색 명령"""
         return SearchDocumentsCommand(
-            user_id=uuid4(),
+            user_id=next_uuid(),
             query_text="Python programming tutorial",
             search_type=SearchType.SEMANTIC,
             limit=10,
             threshold=0.7
         )
     
-    @pytest.fixture
-    def sample_search_results(self):
-        """샘플 검색 결과"""
+    @pytest.fixture(scope="module")
+    def sample_search_results(self, next_uuid):
+        """샘플 검색 결과 (모듈 범위, 읽기 전용)"""
         return [
             SearchResult(
-                chunk_id=uuid4(),
-                document_id=uuid4(),
+                chunk_id=next_uuid(),
+                document_id=next_uuid(),
                 content="Python is a programming language",
                 score=0.9,
                 metadata={"page": 1}
             ),
             SearchResult(
-                chunk_id=uuid4(),
-                document_id=uuid4(),
+                chunk_id=next_uuid(),
+                document_id=next_uuid(),
                 content="Tutorial for Python beginners",
                 score=0.8,
                 metadata={"page": 2}
             )
         ]
     
-    @pytest.mark.asyncio
-    async def test_execute_semantic_search_success(
-        self,
-        use_case,
-        mock_vector_search_port,
-        mock_embedding_port,
-        sample_command,
-        sample_search_results
-    ):
-        """의미 기반 검색 성공 테스트"""
-        # Given
-        sample_embedding = [0.1, 0.2, 0.3]
-        mock_embedding_port.create_embedding.return_value = sample_embedding
-        mock_vector_search_port.search_similar_chunks.return_value = sample_search_results
-        
-        # When
-        result = await use_case.execute(sample_command)
-        
-        # Then
-        assert isinstance(result, SearchDocumentsResult)
-        assert result.search_response.total_results == 2
-        assert result.search_response.status.value == "completed"
-        assert result.execution_time_ms > 0
-        assert result.total_results == 2
-        assert result.filtered_results == 2
-        
-        # 임베딩 생성 호출 확인
-        mock_embedding_port.create_embedding.assert_called_once_with(
-            text=sample_command.query_text
-        )
-        
-        # 벡터 검색 호출 확인
-        mock_vector_search_port.search_similar_chunks.assert_called_once_with(
-            query_embedding=sample_embedding,
-            limit=sample_command.limit,
-            threshold=sample_command.threshold,
-            filters={},
-            user_id=sample_command.user_id
-        )
-    
-    @pytest.mark.asyncio
-    async def test_execute_keyword_search_success(
-        self,
-        use_case,
-        mock_vector_search_port,
-        mock_embedding_port,
-        sample_search_results
-    ):
-        """키워드 기반 검색 성공 테스트"""
-        # Given
-        command = SearchDocumentsCommand(
-            user_id=uuid4(),
-            query_text="Python programming tutorial",
-            search_type=SearchType.KEYWORD,
-            limit=10,
-            threshold=0.7
-        )
-        mock_vector_search_port.search_by_keywords.return_value = sample_search_results
-        
-        # When
-        result = await use_case.execute(command)
-        
-        # Then
-        assert isinstance(result, SearchDocumentsResult)
-        assert result.search_response.total_results == 2
-        
-        # 키워드 검색 호출 확인
-        mock_vector_search_port.search_by_keywords.assert_called_once()
-        call_args = mock_vector_search_port.search_by_keywords.call_args
-        assert "python" in call_args.kwargs["keywords"]
-        assert "programming" in call_args.kwargs["keywords"]
-        assert "tutorial" in call_args.kwargs["keywords"]
-        
-        # 임베딩 생성이 호출되지 않았는지 확인
-        mock_embedding_port.create_embedding.assert_not_called()
+    @pytest.fixture(scope="module")
+    def make_result(self, next_uuid):
+        """SearchResult 팩토리 (지정하지 않은 ID 는 UUID 풀에서 할당)"""
+        def _make_result(content, score, document_id=None, metadata=None):
+            return SearchResult(
+                chunk_id=next_uuid(),
+                document_id=document_id or next_uuid(),
+                content=content,
+                score=score,
+                metadata=metadata if metadata is not None else {}
+            )
+        return _make_result
     
-    @pytest.mark.asyncio
-    async def test_execute_hybrid_search_success(
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize("search_type, variant, port_method, uses_embedding, expected_kwargs", [
+        pytest.param(
+            SearchType.SEMANTIC,
+            {},
+            "search_similar_chunks",
+            True,
+            {"query_embedding": SAMPLE_EMBEDDING, "limit": 10, "threshold": 0.7, "filters": {}},
+            id="semantic"
+        ),
+        pytest.param(
+            SearchType.SEMANTIC,
+            {"filters": {"document_type": "pdf", "language": "en"}},
+            "search_similar_chunks",
+            True,
+            {
+                "query_embedding": SAMPLE_EMBEDDING,
+                "limit": 10,
+                "threshold": 0.7,
+                "filters": {"document_type": "pdf", "language": "en"}
+            },
+            id="semantic-with-filters"
+        ),
+        pytest.param(
+            SearchType.SEMANTIC,
+            {"include_metadata": False},
+            "search_similar_chunks",
+            True,
+            {"query_embedding": SAMPLE_EMBEDDING, "limit": 10, "threshold": 0.7, "filters": {}},
+            id="semantic-without-metadata"
+        ),
+        pytest.param(
+            SearchType.KEYWORD,
+            {},
+            "search_by_keywords",
+            False,
+            {"keywords": ["python", "programming", "tutorial"], "limit": 10, "filters": {}},
+            id="keyword"
+        ),
+        pytest.param(
+            SearchType.HYBRID,
+            {},
+            "hybrid_search",
+            True,
+            {
+                "query_embedding": SAMPLE_EMBEDDING,
+                "keywords": ["python", "programming", "tutorial"],
+                "semantic_weight": 0.7,
+                "keyword_weight": 0.3,
+                "limit": 10,
+                "threshold": 0.7,
+                "filters": {}
+            },
+            id="hybrid"
+        ),
+    ])
+    async def test_execute_search_success(
         self,
         use_case,
         mock_vector_search_port,
         mock_embedding_port,
-        sample_search_results
+        sample_search_results,
+        search_type,
+        variant,
+        port_method,
+        uses_embedding,
+        expected_kwargs,
+        next_uuid
     ):
-        """하이브리드 검색 성공 테스트"""
         # Given
         command = SearchDocumentsCommand(
-            user_id=uuid4(),
+            user_id=next_uuid(),
             query_text="Python programming tutorial",
-            search_type=SearchType.HYBRID,
+            search_type=search_type,
             limit=10,
-            threshold=0.7
+            threshold=0.7,
+            **variant
         )
-        sample_embedding = [0.1, 0.2, 0.3]
-        mock_embedding_port.create_embedding.return_value = sample_embedding
-        mock_vector_search_port.hybrid_search.return_value = sample_search_results
+        search_port = getattr(mock_vector_search_port, port_method)
+        # 유즈케이스가 메타데이터를 비울 수 있으므로 공유 픽스처 대신 사본 사용
+        search_port.return_value = [
+            replace(search_result) for search_result in sample_search_results
+        ]
         
         # When
         result = await use_case.execute(command)
@@ -175,82 +246,50 @@ class TestSearchDocumentsUseCase:
         # Then
         assert isinstance(result, SearchDocumentsResult)
         assert result.search_response.total_results == 2
+        assert result.search_response.status.value == "completed"
+        assert result.execution_time_ms > 0
+        assert result.total_results == 2
+        assert result.filtered_results == 2
         
-        # 하이브리드 검색 호출 확인
-        mock_vector_search_port.hybrid_search.assert_called_once()
-        call_args = mock_vector_search_port.hybrid_search.call_args
-        assert call_args.kwargs["query_embedding"] == sample_embedding
-        assert "python" in call_args.kwargs["keywords"]
-        assert call_args.kwargs["semantic_weight"] == 0.7
-        assert call_args.kwargs["keyword_weight"] == 0.3
-    
-    @pytest.mark.asyncio
-    async def test_execute_with_filters(
-        self,
-        use_case,
-        mock_vector_search_port,
-        mock_embedding_port,
-        sample_search_results
-    ):
-        """필터가 있는 검색 테스트"""
-        # Given
-        filters = {"document_type": "pdf", "language": "en"}
-        command = SearchDocumentsCommand(
-            user_id=uuid4(),
-            query_text="Python programming",
-            search_type=SearchType.SEMANTIC,
-            filters=filters
-        )
-        sample_embedding = [0.1, 0.2, 0.3]
-        mock_embedding_port.create_embedding.return_value = sample_embedding
-        mock_vector_search_port.search_similar_chunks.return_value = sample_search_results
-        
-        # When
-        result = await use_case.execute(command)
+        # 검색 유형에 맞는 포트가 올바른 인자(필터 포함)로 호출되었는지 확인
+        search_port.assert_called_once_with(**expected_kwargs, user_id=command.user_id)
         
-        # Then
-        assert isinstance(result, SearchDocumentsResult)
+        # 임베딩 생성은 의미/하이브리드 검색에서만 호출
+        if uses_embedding:
+            mock_embedding_port.create_embedding.assert_called_once_with(
+                text=command.query_text
+            )
+        else:
+            mock_embedding_port.create_embedding.assert_not_called()
         
-        # 필터가 전달되었는지 확인
-        call_args = mock_vector_search_port.search_similar_chunks.call_args
-        assert call_args.kwargs["filters"] == filters
+        # 메타데이터 제외 시 결과의 메타데이터가 제거되어야 함
+        if "include_metadata" in variant:
+            for search_result in result.search_response.results:
+                assert search_result.metadata == {}
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_execute_with_threshold_filtering(
         self,
         use_case,
         mock_vector_search_port,
-        mock_embedding_port
+        make_result,
+        next_uuid
     ):
         """임계값 필터링 테스트"""
         # Given
         command = SearchDocumentsCommand(
-            user_id=uuid4(),
+            user_id=next_uuid(),
             query_text="Python programming",
             threshold=0.8  # 높은 임계값
         )
         
         # 임계값보다 낮은 점수의 결과 포함
         search_results = [
-            SearchResult(
-                chunk_id=uuid4(),
-                document_id=uuid4(),
-                content="High score content",
-                score=0.9,  # 임계값보다 높음
-                metadata={}
-            ),
-            SearchResult(
-                chunk_id=uuid4(),
-                document_id=uuid4(),
-                content="Low score content",
-                score=0.7,  # 임계값보다 낮음
-                metadata={}
-            )
+            make_result("High score content", 0.9),  # 임계값보다 높음
+            make_result("Low score content", 0.7)  # 임계값보다 낮음
         ]
         
-        sample_embedding = [0.1, 0.2, 0.3]
-        mock_embedding_port.create_embedding.return_value = sample_embedding
-        mock_vector_search_port.search_similar_chunks.return_value = search_results
+        mock_vector_search_port.search_similar_chunks.side_effect = lambda **kwargs: search_results
         
         # When
         result = await use_case.execute(command)
@@ -262,171 +301,74 @@ class TestSearchDocumentsUseCase:
         assert result.total_results == 2  # 원본 결과 수
         assert result.filtered_results == 1  # 필터링 후 결과 수
     
-    @pytest.mark.asyncio
-    async def test_execute_without_metadata(
-        self,
-        use_case,
-        mock_vector_search_port,
-        mock_embedding_port,
-        sample_search_results
-    ):
-        """메타데이터 제외 검색 테스트"""
-        # Given
-        command = SearchDocumentsCommand(
-            user_id=uuid4(),
-            query_text="Python programming",
-            include_metadata=False
-        )
-        sample_embedding = [0.1, 0.2, 0.3]
-        mock_embedding_port.create_embedding.return_value = sample_embedding
-        mock_vector_search_port.search_similar_chunks.return_value = sample_search_results
-        
-        # When
-        result = await use_case.execute(command)
-        
-        # Then
-        # 메타데이터가 제거되었는지 확인
-        for search_result in result.search_response.results:
-            assert search_result.metadata == {}
-    
-    @pytest.mark.asyncio
-    async def test_execute_with_invalid_user_id(self, use_case):
-        """잘못된 사용자 ID로 검색 테스트"""
-        # Given
-        command = SearchDocumentsCommand(
-            user_id=None,  # 잘못된 사용자 ID
-            query_text="Python programming"
-        )
-        
-        # When & Then
-        with pytest.raises(ValidationError, match="User ID is required"):
-            await use_case.execute(command)
-    
-    @pytest.mark.asyncio
-    async def test_execute_with_empty_query(self, use_case):
-        """빈 쿼리로 검색 테스트"""
-        # Given
-        command = SearchDocumentsCommand(
-            user_id=uuid4(),
-            query_text=""  # 빈 쿼리
-        )
-        
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize("command, message", _VALIDATION_CASES)
+    async def test_execute_with_invalid_command(self, use_case, command, message):
         # When & Then
-        with pytest.raises(ValidationError, match="Query text is required"):
+        with pytest.raises(ValidationError, match=message):
             await use_case.execute(command)
     
-    @pytest.mark.asyncio
-    async def test_execute_with_invalid_limit(self, use_case):
-        """잘못된 제한 수로 검색 테스트"""
-        # Given
-        command = SearchDocumentsCommand(
-            user_id=uuid4(),
-            query_text="Python programming",
-            limit=0  # 잘못된 제한 수
-        )
-        
-        # When & Then
-        with pytest.raises(ValidationError, match="Limit must be between 1 and 100"):
-            await use_case.execute(command)
-    
-    @pytest.mark.asyncio
-    async def test_execute_with_invalid_threshold(self, use_case):
-        """잘못된 임계값으로 검색 테스트"""
-        # Given
-        command = SearchDocumentsCommand(
-            user_id=uuid4(),
-            query_text="Python programming",
-            threshold=1.5  # 잘못된 임계값
-        )
-        
-        # When & Then
-        with pytest.raises(ValidationError, match="Threshold must be between 0.0 and 1.0"):
-            await use_case.execute(command)
-    
-    @pytest.mark.asyncio
-    async def test_execute_with_too_long_query(self, use_case):
-        """너무 긴 쿼리로 검색 테스트"""
-        # Given
-        command = SearchDocumentsCommand(
-            user_id=uuid4(),
-            query_text="a" * 1001  # 1000자 초과
-        )
-        
-        # When & Then
-        with pytest.raises(ValidationError, match="Query text is too long"):
-            await use_case.execute(command)
-    
-    @pytest.mark.asyncio
-    async def test_execute_with_embedding_error(
-        self,
-        use_case,
-        mock_embedding_port,
-        sample_command
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize("failing_port, method", [
+        pytest.param("mock_embedding_port", "create_embedding", id="embedding-error"),
+        pytest.param(
+            "mock_vector_search_port", "search_similar_chunks", id="vector-search-error"
+        ),
+    ])
+    async def test_execute_with_port_error(
+        self, request, use_case, sample_command, failing_port, method
     ):
-        """임베딩 생성 오류 테스트"""
+        """임베딩/벡터 검색 포트 오류 테스트"""
         # Given
-        mock_embedding_port.create_embedding.side_effect = Exception("Embedding service error")
+        port = request.getfixturevalue(failing_port)
+        getattr(port, method).side_effect = Exception(f"{method} error")
         
         # When & Then
         with pytest.raises(SearchError, match="Search execution failed"):
             await use_case.execute(sample_command)
     
-    @pytest.mark.asyncio
-    async def test_execute_with_vector_search_error(
-        self,
-        use_case,
-        mock_vector_search_port,
-        mock_embedding_port,
-        sample_command
-    ):
-        """벡터 검색 오류 테스트"""
-        # Given
-        mock_embedding_port.create_embedding.return_value = [0.1, 0.2, 0.3]
-        mock_vector_search_port.search_similar_chunks.side_effect = Exception("Vector search error")
-        
-        # When & Then
-        with pytest.raises(SearchError, match="Search execution failed"):
-            await use_case.execute(sample_command)
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_get_search_suggestions_with_short_query(self, use_case, next_uuid):
+        """짧은 쿼리로 검색 제안 테스트"""
+        # 2자 미만 쿼리는 제안 없음
+        assert await use_case.get_search_suggestions(next_uuid(), "p") == []
     
-    def test_extract_keywords(self, use_case):
-        """키워드 추출 테스트"""
-        # Given
-        query_text = "Python programming tutorial for beginners"
-        
-        # When
-        keywords = use_case._extract_keywords(query_text)
-        
-        # Then
-        assert "python" in keywords
-        assert "programming" in keywords
-        assert "tutorial" in keywords
-        assert "beginners" in keywords
-        assert len(keywords) <= 10
-        
-        # 불용어가 제거되었는지 확인
-        assert "for" not in keywords
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_get_search_history(self, use_case, next_uuid):
+        """검색 히스토리 조회 테스트"""
+        # 현재는 빈 리스트 반환
+        assert await use_case.get_search_history(next_uuid()) == []
     
-    def test_extract_keywords_with_special_characters(self, use_case):
-        """특수문자가 포함된 키워드 추출 테스트"""
-        # Given
-        query_text = "Python 3.9+ programming & tutorial!"
-        
+    @pytest.mark.parametrize("query_text, expected_in, expected_out", [
+        pytest.param(
+            "Python programming tutorial for beginners",
+            ["python", "programming", "tutorial", "beginners"],
+            ["for"],
+            id="stopwords"
+        ),
+        pytest.param(
+            "Python 3.9+ programming & tutorial!",
+            ["python", "programming", "tutorial"],
+            ["&", "!"],
+            id="special-characters"
+        ),
+    ])
+    def test_extract_keywords(self, use_case_lite, query_text, expected_in, expected_out):
         # When
-        keywords = use_case._extract_keywords(query_text)
+        keywords = use_case_lite._extract_keywords(query_text)
         
         # Then
-        assert "python" in keywords
-        assert "programming" in keywords
-        assert "tutorial" in keywords
-        # 특수문자가 제거되었는지 확인
-        assert any("&" in keyword for keyword in keywords) is False
-        assert any("!" in keyword for keyword in keywords) is False
+        assert len(keywords) <= 10
+        for keyword in expected_in:
+            assert keyword in keywords
+        for excluded in expected_out:
+            assert not any(excluded in keyword for keyword in keywords)
     
-    @pytest.mark.asyncio
-    async def test_get_search_suggestions(self, use_case):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_get_search_suggestions(self, use_case, next_uuid):
         """검색 제안 생성 테스트"""
         # Given
-        user_id = uuid4()
+        user_id = next_uuid()
         partial_query = "python"
         
         # When
@@ -439,77 +381,31 @@ class TestSearchDocumentsUseCase:
         for suggestion in suggestions:
             assert partial_query in suggestion.lower()
     
-    @pytest.mark.asyncio
-    async def test_get_search_suggestions_with_short_query(self, use_case):
-        """짧은 쿼리로 검색 제안 테스트"""
-        # Given
-        user_id = uuid4()
-        partial_query = "p"  # 2자 미만
-        
-        # When
-        suggestions = await use_case.get_search_suggestions(user_id, partial_query)
-        
-        # Then
-        assert suggestions == []
-    
-    @pytest.mark.asyncio
-    async def test_get_search_history(self, use_case):
-        """검색 히스토리 조회 테스트"""
-        # Given
-        user_id = uuid4()
-        
-        # When
-        history = await use_case.get_search_history(user_id)
-        
-        # Then
-        assert isinstance(history, list)
-        # 현재는 빈 리스트 반환
-        assert history == []
-    
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_post_process_results_deduplication(
         self,
         use_case,
         mock_vector_search_port,
-        mock_embedding_port
+        make_result,
+        next_uuid
     ):
         """결과 후처리 중복 제거 테스트"""
         # Given
-        document_id = uuid4()
+        document_id = next_uuid()
         command = SearchDocumentsCommand(
-            user_id=uuid4(),
+            user_id=next_uuid(),
             query_text="Python programming",
             limit=5
         )
         
         # 같은 문서의 여러 청크
         search_results = [
-            SearchResult(
-                chunk_id=uuid4(),
-                document_id=document_id,  # 같은 문서
-                content="First chunk",
-                score=0.9,
-                metadata={}
-            ),
-            SearchResult(
-                chunk_id=uuid4(),
-                document_id=document_id,  # 같은 문서
-                content="Second chunk",
-                score=0.8,
-                metadata={}
-            ),
-            SearchResult(
-                chunk_id=uuid4(),
-                document_id=uuid4(),  # 다른 문서
-                content="Different document",
-                score=0.7,
-                metadata={}
-            )
+            make_result("First chunk", 0.9, document_id=document_id),  # 같은 문서
+            make_result("Second chunk", 0.8, document_id=document_id),  # 같은 문서
+            make_result("Different document", 0.7)  # 다른 문서
         ]
         
-        sample_embedding = [0.1, 0.2, 0.3]
-        mock_embedding_port.create_embedding.return_value = sample_embedding
-        mock_vector_search_port.search_similar_chunks.return_value = search_results
+        mock_vector_search_port.search_similar_chunks.side_effect = lambda **kwargs: search_results
         
         # When
         result = await use_case.execute(command)
@@ -2,20 +2,30 @@
 날짜/시간 유틸리티 단위 테스트
 """
 
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
+import numpy as np
 from datetime import datetime, timezone, timedelta
-from freezegun import freeze_time
+import time_machine
 
 from src.utils.datetime import (
+    KST,
+    UTC,
     get_current_utc_datetime,
     get_current_kst_datetime,
     format_datetime,
+    clear_format_datetime_cache,
     parse_datetime,
     datetime_to_timestamp,
     timestamp_to_datetime,
     get_date_range,
     is_business_day,
+    is_business_day_array,
     add_business_days,
+    add_business_days_array,
     get_timezone_offset,
     convert_timezone,
     get_relative_time_string,
@@ -28,42 +38,103 @@ from src.utils.datetime import (
     is_datetime_in_range
 )
 
+# 자주 쓰는 2024년 1월 날짜 (datetime 은 불변이므로 테스트 간 공유)
+SAT_JAN13 = datetime(2024, 1, 13)
+SUN_JAN14 = datetime(2024, 1, 14)
+MON_JAN15 = datetime(2024, 1, 15)
+TUE_JAN16 = datetime(2024, 1, 16)
+THU_JAN18 = datetime(2024, 1, 18)
+FRI_JAN19 = datetime(2024, 1, 19)
+SAT_JAN20 = datetime(2024, 1, 20)
+
+# 동일한 날짜(2024-01-15)를 서로 다른 포맷으로 표현한 파싱 케이스
+PARSE_FORMAT_CASES = [
+    ("2024-01-15", "%Y-%m-%d"),
+    ("2024/01/15", "%Y/%m/%d"),
+    ("15-01-2024", "%d-%m-%Y"),
+]
+
+# 평일(월/화) / 주말(토/일)
+WEEKDAYS = [MON_JAN15, TUE_JAN16]
+WEEKEND_DAYS = [SAT_JAN13, SUN_JAN14]
+
+# (시작, 종료, 단위, 기대 기간)
+DURATION_CASES = [
+    (datetime(2024, 1, 15, 12, 0, 0), datetime(2024, 1, 15, 12, 0, 30), 'seconds', 30),
+    (datetime(2024, 1, 15, 12, 0, 0), datetime(2024, 1, 15, 12, 30, 0), 'minutes', 30),
+    (datetime(2024, 1, 15, 12, 0, 0), datetime(2024, 1, 15, 15, 0, 0), 'hours', 3),
+    (MON_JAN15, SAT_JAN20, 'days', 5),
+]
+
+# 범위 확인 기준 (2024-01-15 ~ 2024-01-20)
+RANGE_START = MON_JAN15
+RANGE_END = SAT_JAN20
+OUTSIDE_RANGE_DATES = [datetime(2024, 1, 10), datetime(2024, 1, 25)]
+
+# ValueError 가 발생해야 하는 잘못된 입력 (함수, 인자)
+EXPECTED_VALUE_ERRORS = [
+    pytest.param(parse_datetime, ("invalid-date-string",), id="invalid-format"),
+    pytest.param(get_date_range, (MON_JAN15, THU_JAN18, 'invalid'), id="invalid-interval"),
+    pytest.param(calculate_duration, (MON_JAN15, SAT_JAN20, 'invalid'), id="invalid-unit"),
+    pytest.param(datetime, (2023, 2, 29), id="non-leap-feb-29"),
+]
+
+
+@pytest.fixture(scope="module")
+def kst():
+    """한국 표준시 (UTC+9, 모듈 공유)"""
+    return KST
+
+
+@pytest.fixture(scope="module")
+def est():
+    """미국 동부 표준시 (고정 오프셋 UTC-5, 모듈 공유)"""
+    return timezone(timedelta(hours=-5))
+
 
 class TestBasicDatetimeFunctions:
     """기본 날짜/시간 함수 테스트"""
 
-    @freeze_time("2024-01-15 12:30:45")
-    def test_get_current_utc_datetime(self):
+    @pytest.fixture
+    def frozen_now(self, freeze_utc_now):
+        """대상 모듈의 datetime.now 만 고정 (전역 시계 패치 없이)"""
+        return freeze_utc_now(datetime(2024, 1, 15, 12, 30, 45, tzinfo=UTC))
+
+    def test_get_current_utc_datetime(self, frozen_now):
         """현재 UTC 시간 가져오기 테스트"""
         result = get_current_utc_datetime()
         
-        assert isinstance(result, datetime)
-        assert result.tzinfo == timezone.utc
-        assert result.year == 2024
-        assert result.month == 1
-        assert result.day == 15
-        assert result.hour == 12
-        assert result.minute == 30
-        assert result.second == 45
-
-    @freeze_time("2024-01-15 12:30:45")
-    def test_get_current_kst_datetime(self):
+        assert result.tzinfo == UTC
+        assert (
+            result.year, result.month, result.day,
+            result.hour, result.minute, result.second
+        ) == (2024, 1, 15, 12, 30, 45)
+
+    def test_get_current_kst_datetime(self, frozen_now):
         """현재 KST 시간 가져오기 테스트"""
         result = get_current_kst_datetime()
         
-        assert isinstance(result, datetime)
-        # KST는 UTC+9
-        assert result.hour == 21  # 12 + 9
-        assert result.minute == 30
-        assert result.second == 45
+        # KST는 UTC+9 (12 + 9 = 21시)
+        assert (result.hour, result.minute, result.second) == (21, 30, 45)
 
     def test_format_datetime_default(self):
         """기본 날짜 포맷팅 테스트"""
-        dt = datetime(2024, 1, 15, 12, 30, 45, tzinfo=timezone.utc)
+        dt = datetime(2024, 1, 15, 12, 30, 45, tzinfo=UTC)
         result = format_datetime(dt)
         
         assert result == "2024-01-15T12:30:45+00:00"
 
+    def test_format_datetime_same_instant_different_timezone(self, kst):
+        """같은 시각의 다른 시간대 datetime 포맷 테스트 (캐시 키 구분)"""
+        clear_format_datetime_cache()
+        utc_dt = datetime(2024, 1, 15, 12, 30, 45, tzinfo=UTC)
+        kst_dt = utc_dt.astimezone(kst)
+        
+        # 두 datetime 은 동등 비교되지만 포맷 결과는 시간대별로 달라야 함
+        assert utc_dt == kst_dt
+        assert format_datetime(utc_dt) == "2024-01-15T12:30:45+00:00"
+        assert format_datetime(kst_dt) == "2024-01-15T21:30:45+09:00"
+
     def test_format_datetime_custom_format(self):
         """커스텀 포맷 날짜 포맷팅 테스트"""
         dt = datetime(2024, 1, 15, 12, 30, 45)
@@ -87,46 +158,60 @@ class TestDatetimeParsing:
         dt_str = "2024-01-15T12:30:45+00:00"
         result = parse_datetime(dt_str)
         
-        assert isinstance(result, datetime)
-        assert result.year == 2024
-        assert result.month == 1
-        assert result.day == 15
-        assert result.hour == 12
-        assert result.minute == 30
-        assert result.second == 45
-        assert result.tzinfo == timezone.utc
+        assert (
+            result.year, result.month, result.day,
+            result.hour, result.minute, result.second
+        ) == (2024, 1, 15, 12, 30, 45)
+        assert result.tzinfo == UTC
+
+    def test_parse_datetime_zulu_suffix(self):
+        """'Z' 접미사 ISO 포맷 파싱 테스트"""
+        result = parse_datetime("2024-01-15T12:30:45Z")
+        
+        assert result == datetime(2024, 1, 15, 12, 30, 45, tzinfo=UTC)
+
+    @pytest.mark.parametrize("date_str, expected", [
+        pytest.param("2024-1-5 08:00:00", datetime(2024, 1, 5, 8, 0, 0), id="unpadded"),
+        pytest.param(
+            "2024-01-15  12:30:45", datetime(2024, 1, 15, 12, 30, 45), id="double-space"
+        ),
+        pytest.param(
+            "2024-1-5 8:00:00.5", datetime(2024, 1, 5, 8, 0, 0, 500000),
+            id="unpadded-fraction"
+        ),
+        pytest.param("2024-1-5T8:05:09", datetime(2024, 1, 5, 8, 5, 9), id="unpadded-t"),
+        pytest.param(
+            "2024-1-5T8:05:09.123", datetime(2024, 1, 5, 8, 5, 9, 123000),
+            id="unpadded-t-fraction"
+        ),
+        pytest.param("2024-1-5", datetime(2024, 1, 5), id="unpadded-date"),
+        pytest.param("2024-01- 5", datetime(2024, 1, 5), id="space-padded-day"),
+    ])
+    def test_parse_datetime_fallback_format(self, date_str, expected):
+        """ISO 파서가 거부하는 형식의 대체 파싱 테스트"""
+        assert parse_datetime(date_str) == expected
+
+    @pytest.mark.parametrize("date_str", ["2024-13-01", "2024-1-5 8:00", "2024/01/15"])
+    def test_parse_datetime_invalid(self, date_str):
+        """어떤 형식으로도 파싱할 수 없는 문자열 테스트"""
+        with pytest.raises(ValueError, match="파싱할 수 없습니다"):
+            parse_datetime(date_str)
 
     def test_parse_datetime_custom_format(self):
         """커스텀 포맷 파싱 테스트"""
         dt_str = "2024-01-15 12:30:45"
         result = parse_datetime(dt_str, format_str="%Y-%m-%d %H:%M:%S")
         
-        assert isinstance(result, datetime)
-        assert result.year == 2024
-        assert result.month == 1
-        assert result.day == 15
-        assert result.hour == 12
-        assert result.minute == 30
-        assert result.second == 45
-
-    def test_parse_datetime_invalid_format(self):
-        """잘못된 포맷 파싱 테스트"""
-        with pytest.raises(ValueError):
-            parse_datetime("invalid-date-string")
+        assert (
+            result.year, result.month, result.day,
+            result.hour, result.minute, result.second
+        ) == (2024, 1, 15, 12, 30, 45)
 
-    def test_parse_datetime_multiple_formats(self):
+    @pytest.mark.parametrize("dt_str, fmt", PARSE_FORMAT_CASES)
+    def test_parse_datetime_multiple_formats(self, dt_str, fmt):
         """여러 포맷 시도 테스트"""
-        test_cases = [
-            ("2024-01-15", "%Y-%m-%d"),
-            ("2024/01/15", "%Y/%m/%d"),
-            ("15-01-2024", "%d-%m-%Y"),
-        ]
-        
-        for dt_str, expected_fmt in test_cases:
-            result = parse_datetime(dt_str, format_str=expected_fmt)
-            assert result.year == 2024
-            assert result.month == 1
-            assert result.day == 15
+        result = parse_datetime(dt_str, format_str=fmt)
+        assert (result.year, result.month, result.day) == (2024, 1, 15)
 
 
 class TestTimestampConversion:
@@ -134,7 +219,7 @@ class TestTimestampConversion:
 
     def test_datetime_to_timestamp(self):
         """datetime을 타임스탬프로 변환 테스트"""
-        dt = datetime(2024, 1, 15, 12, 30, 45, tzinfo=timezone.utc)
+        dt = datetime(2024, 1, 15, 12, 30, 45, tzinfo=UTC)
         result = datetime_to_timestamp(dt)
         
         assert isinstance(result, float)
@@ -145,15 +230,12 @@ class TestTimestampConversion:
         timestamp = 1705320645.0  # 2024-01-15 12:30:45 UTC
         result = timestamp_to_datetime(timestamp)
         
-        assert isinstance(result, datetime)
-        assert result.tzinfo == timezone.utc
-        assert result.year == 2024
-        assert result.month == 1
-        assert result.day == 15
+        assert result.tzinfo == UTC
+        assert (result.year, result.month, result.day) == (2024, 1, 15)
 
     def test_timestamp_roundtrip(self):
         """타임스탬프 변환 왕복 테스트"""
-        original_dt = datetime(2024, 1, 15, 12, 30, 45, tzinfo=timezone.utc)
+        original_dt = datetime(2024, 1, 15, 12, 30, 45, tzinfo=UTC)
         
         # datetime -> timestamp -> datetime
         timestamp = datetime_to_timestamp(original_dt)
@@ -167,15 +249,14 @@ class TestDateRange:
 
     def test_get_date_range_days(self):
         """일 단위 날짜 범위 테스트"""
-        start_date = datetime(2024, 1, 15)
-        end_date = datetime(2024, 1, 18)
+        start_date = MON_JAN15
+        end_date = THU_JAN18
         
         result = get_date_range(start_date, end_date, 'days')
-        dates = list(result)
         
-        assert len(dates) == 4  # 15, 16, 17, 18
-        assert dates[0].day == 15
-        assert dates[-1].day == 18
+        assert len(result) == 4  # 15, 16, 17, 18
+        assert result[0].day == 15
+        assert result[-1].day == 18
 
     def test_get_date_range_hours(self):
         """시간 단위 날짜 범위 테스트"""
@@ -183,48 +264,49 @@ class TestDateRange:
         end_date = datetime(2024, 1, 15, 13)
         
         result = get_date_range(start_date, end_date, 'hours')
-        dates = list(result)
         
-        assert len(dates) == 4  # 10, 11, 12, 13
-        assert dates[0].hour == 10
-        assert dates[-1].hour == 13
+        assert len(result) == 4  # 10, 11, 12, 13
+        assert result[0].hour == 10
+        assert result[-1].hour == 13
 
-    def test_get_date_range_invalid_interval(self):
-        """잘못된 간격 테스트"""
-        start_date = datetime(2024, 1, 15)
-        end_date = datetime(2024, 1, 18)
+    def test_get_date_range_iteration(self):
+        """날짜 범위 순회/빈 범위 테스트"""
+        start_date = MON_JAN15
+        end_date = THU_JAN18
         
-        with pytest.raises(ValueError):
-            list(get_date_range(start_date, end_date, 'invalid'))
+        result = get_date_range(start_date, end_date, 'days')
+        
+        # 순회 결과는 인덱스 접근 결과와 일치
+        assert list(result) == [result[i] for i in range(len(result))]
+        # 종료 날짜가 시작 날짜보다 앞서면 빈 범위
+        assert len(get_date_range(end_date, start_date, 'days')) == 0
 
 
 class TestBusinessDays:
     """영업일 테스트"""
 
-    def test_is_business_day_weekday(self):
+    @pytest.mark.parametrize("weekday", WEEKDAYS)
+    def test_is_business_day_weekday(self, weekday):
         """평일 영업일 테스트"""
-        # 2024-01-15는 월요일
-        monday = datetime(2024, 1, 15)
-        assert is_business_day(monday) is True
-        
-        # 2024-01-16은 화요일
-        tuesday = datetime(2024, 1, 16)
-        assert is_business_day(tuesday) is True
+        assert is_business_day(weekday) is True
 
-    def test_is_business_day_weekend(self):
+    @pytest.mark.parametrize("weekend_day", WEEKEND_DAYS)
+    def test_is_business_day_weekend(self, weekend_day):
         """주말 영업일 테스트"""
-        # 2024-01-13은 토요일
-        saturday = datetime(2024, 1, 13)
-        assert is_business_day(saturday) is False
+        assert is_business_day(weekend_day) is False
+
+    def test_module_import_does_not_load_numpy(self):
+        """모듈 import 만으로는 NumPy 를 로드하지 않는지 테스트 (배열 함수에서 지연 import)"""
+        code = "import sys, src.utils.datetime; sys.exit('numpy' in sys.modules)"
+        
+        project_root = Path(__file__).resolve().parents[2]
         
-        # 2024-01-14는 일요일
-        sunday = datetime(2024, 1, 14)
-        assert is_business_day(sunday) is False
+        assert subprocess.run([sys.executable, "-c", code], cwd=project_root).returncode == 0
 
     def test_add_business_days_positive(self):
         """영업일 추가 테스트"""
         # 2024-01-15는 월요일
-        start_date = datetime(2024, 1, 15)
+        start_date = MON_JAN15
         result = add_business_days(start_date, 5)
         
         # 5 영업일 후는 2024-01-22 (월요일)
@@ -234,16 +316,35 @@ class TestBusinessDays:
     def test_add_business_days_negative(self):
         """영업일 빼기 테스트"""
         # 2024-01-19는 금요일
-        start_date = datetime(2024, 1, 19)
+        start_date = FRI_JAN19
         result = add_business_days(start_date, -5)
         
         # 5 영업일 전은 2024-01-12 (금요일)
         assert result.day == 12
         assert result.weekday() == 4  # 금요일
 
+    @pytest.mark.parametrize("days", [-7, -1, 0, 1, 5, 12])
+    def test_add_business_days_array(self, days):
+        """영업일 일괄 추가 결과가 단건 계산과 일치하는지 테스트"""
+        # 토요일(2024-01-13)부터 열흘, 시각 포함
+        start_dates = [datetime(2024, 1, 13, 7) + timedelta(days=i) for i in range(10)]
+        
+        result = add_business_days_array(start_dates, days)
+        
+        assert result.astype(datetime).tolist() == [
+            add_business_days(start_date, days) for start_date in start_dates
+        ]
+
+    def test_add_business_days_large_offset(self):
+        """큰 영업일 수 추가 테스트 (영업일 260일 = 52주)"""
+        result = add_business_days(MON_JAN15, 260)
+        
+        assert result == MON_JAN15 + timedelta(weeks=52)
+        assert add_business_days(result, -260) == MON_JAN15
+
     def test_add_business_days_zero(self):
         """영업일 0일 추가 테스트"""
-        start_date = datetime(2024, 1, 15)
+        start_date = MON_JAN15
         result = add_business_days(start_date, 0)
         
         assert result == start_date
@@ -254,33 +355,30 @@ class TestTimezoneOperations:
 
     def test_get_timezone_offset_utc(self):
         """UTC 시간대 오프셋 테스트"""
-        dt = datetime(2024, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+        dt = datetime(2024, 1, 15, 12, 0, 0, tzinfo=UTC)
         offset = get_timezone_offset(dt)
         
         assert offset == 0
 
-    def test_get_timezone_offset_kst(self):
+    def test_get_timezone_offset_kst(self, kst):
         """KST 시간대 오프셋 테스트"""
-        kst = timezone(timedelta(hours=9))
         dt = datetime(2024, 1, 15, 12, 0, 0, tzinfo=kst)
         offset = get_timezone_offset(dt)
         
         assert offset == 9
 
-    def test_convert_timezone(self):
+    def test_convert_timezone(self, kst):
         """시간대 변환 테스트"""
-        utc_dt = datetime(2024, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
-        kst = timezone(timedelta(hours=9))
+        utc_dt = datetime(2024, 1, 15, 12, 0, 0, tzinfo=UTC)
         
         result = convert_timezone(utc_dt, kst)
         
         assert result.hour == 21  # 12 + 9
         assert result.tzinfo == kst
 
-    def test_convert_timezone_naive_datetime(self):
+    def test_convert_timezone_naive_datetime(self, kst):
         """naive datetime 시간대 변환 테스트"""
         naive_dt = datetime(2024, 1, 15, 12, 0, 0)
-        kst = timezone(timedelta(hours=9))
         
         # naive datetime은 UTC로 가정
         result = convert_timezone(naive_dt, kst)
@@ -292,34 +390,37 @@ class TestTimezoneOperations:
 class TestRelativeTime:
     """상대 시간 테스트"""
 
-    @freeze_time("2024-01-15 12:00:00")
+    @pytest.fixture(scope="class", autouse=True)
+    def frozen_clock(self):
+        """클래스 단위로 한 번만 시간 고정"""
+        frozen_at = datetime(2024, 1, 15, 12, 0, 0, tzinfo=UTC)
+        with time_machine.travel(frozen_at, tick=False) as frozen:
+            yield frozen
+
     def test_get_relative_time_string_minutes(self):
         """분 단위 상대 시간 테스트"""
-        past_time = datetime(2024, 1, 15, 11, 45, 0, tzinfo=timezone.utc)
+        past_time = datetime(2024, 1, 15, 11, 45, 0, tzinfo=UTC)
         result = get_relative_time_string(past_time)
         
         assert "15분 전" in result
 
-    @freeze_time("2024-01-15 12:00:00")
     def test_get_relative_time_string_hours(self):
         """시간 단위 상대 시간 테스트"""
-        past_time = datetime(2024, 1, 15, 10, 0, 0, tzinfo=timezone.utc)
+        past_time = datetime(2024, 1, 15, 10, 0, 0, tzinfo=UTC)
         result = get_relative_time_string(past_time)
         
         assert "2시간 전" in result
 
-    @freeze_time("2024-01-15 12:00:00")
     def test_get_relative_time_string_days(self):
         """일 단위 상대 시간 테스트"""
-        past_time = datetime(2024, 1, 13, 12, 0, 0, tzinfo=timezone.utc)
+        past_time = datetime(2024, 1, 13, 12, 0, 0, tzinfo=UTC)
         result = get_relative_time_string(past_time)
         
         assert "2일 전" in result
 
-    @freeze_time("2024-01-15 12:00:00")
     def test_get_relative_time_string_future(self):
         """미래 시간 테스트"""
-        future_time = datetime(2024, 1, 15, 13, 0, 0, tzinfo=timezone.utc)
+        future_time = datetime(2024, 1, 15, 13, 0, 0, tzinfo=UTC)
         result = get_relative_time_string(future_time)
         
         assert "1시간 후" in result
@@ -330,8 +431,8 @@ class TestDatetimeValidation:
 
     def test_validate_datetime_range_valid(self):
         """유효한 날짜 범위 검증 테스트"""
-        start_date = datetime(2024, 1, 15)
-        end_date = datetime(2024, 1, 20)
+        start_date = MON_JAN15
+        end_date = SAT_JAN20
         
         is_valid, error = validate_datetime_range(start_date, end_date)
         
@@ -340,8 +441,8 @@ class TestDatetimeValidation:
 
     def test_validate_datetime_range_invalid_order(self):
         """잘못된 순서 날짜 범위 검증 테스트"""
-        start_date = datetime(2024, 1, 20)
-        end_date = datetime(2024, 1, 15)
+        start_date = SAT_JAN20
+        end_date = MON_JAN15
         
         is_valid, error = validate_datetime_range(start_date, end_date)
         
@@ -370,30 +471,23 @@ class TestDayBoundaries:
         dt = datetime(2024, 1, 15, 14, 30, 45)
         result = get_start_of_day(dt)
         
-        assert result.year == 2024
-        assert result.month == 1
-        assert result.day == 15
-        assert result.hour == 0
-        assert result.minute == 0
-        assert result.second == 0
-        assert result.microsecond == 0
+        assert (
+            result.year, result.month, result.day,
+            result.hour, result.minute, result.second, result.microsecond
+        ) == (2024, 1, 15, 0, 0, 0, 0)
 
     def test_get_end_of_day(self):
         """하루 끝 시간 테스트"""
         dt = datetime(2024, 1, 15, 14, 30, 45)
         result = get_end_of_day(dt)
         
-        assert result.year == 2024
-        assert result.month == 1
-        assert result.day == 15
-        assert result.hour == 23
-        assert result.minute == 59
-        assert result.second == 59
-        assert result.microsecond == 999999
+        assert (
+            result.year, result.month, result.day,
+            result.hour, result.minute, result.second, result.microsecond
+        ) == (2024, 1, 15, 23, 59, 59, 999999)
 
-    def test_get_start_of_day_with_timezone(self):
+    def test_get_start_of_day_with_timezone(self, kst):
         """시간대가 있는 하루 시작 시간 테스트"""
-        kst = timezone(timedelta(hours=9))
         dt = datetime(2024, 1, 15, 14, 30, 45, tzinfo=kst)
         result = get_start_of_day(dt)
         
@@ -407,7 +501,7 @@ class TestWeekAndMonthRanges:
     def test_get_week_range(self):
         """주 범위 테스트"""
         # 2024-01-15는 월요일
-        dt = datetime(2024, 1, 15)
+        dt = MON_JAN15
         start, end = get_week_range(dt)
         
         # 주의 시작은 월요일 (2024-01-15)
@@ -420,7 +514,7 @@ class TestWeekAndMonthRanges:
 
     def test_get_month_range(self):
         """월 범위 테스트"""
-        dt = datetime(2024, 1, 15)
+        dt = MON_JAN15
         start, end = get_month_range(dt)
         
         # 월의 시작은 1일
@@ -445,45 +539,11 @@ class TestWeekAndMonthRanges:
 class TestDurationCalculation:
     """기간 계산 테스트"""
 
-    def test_calculate_duration_seconds(self):
-        """초 단위 기간 계산 테스트"""
-        start = datetime(2024, 1, 15, 12, 0, 0)
-        end = datetime(2024, 1, 15, 12, 0, 30)
-        
-        result = calculate_duration(start, end, 'seconds')
-        assert result == 30
-
-    def test_calculate_duration_minutes(self):
-        """분 단위 기간 계산 테스트"""
-        start = datetime(2024, 1, 15, 12, 0, 0)
-        end = datetime(2024, 1, 15, 12, 30, 0)
-        
-        result = calculate_duration(start, end, 'minutes')
-        assert result == 30
-
-    def test_calculate_duration_hours(self):
-        """시간 단위 기간 계산 테스트"""
-        start = datetime(2024, 1, 15, 12, 0, 0)
-        end = datetime(2024, 1, 15, 15, 0, 0)
-        
-        result = calculate_duration(start, end, 'hours')
-        assert result == 3
-
-    def test_calculate_duration_days(self):
-        """일 단위 기간 계산 테스트"""
-        start = datetime(2024, 1, 15)
-        end = datetime(2024, 1, 20)
-        
-        result = calculate_duration(start, end, 'days')
-        assert result == 5
-
-    def test_calculate_duration_invalid_unit(self):
-        """잘못된 단위 기간 계산 테스트"""
-        start = datetime(2024, 1, 15)
-        end = datetime(2024, 1, 20)
-        
-        with pytest.raises(ValueError):
-            calculate_duration(start, end, 'invalid')
+    @pytest.mark.parametrize("start, end, unit, expected", DURATION_CASES)
+    def test_calculate_duration(self, start, end, unit, expected):
+        """단위별(초/분/시간/일) 기간 계산 테스트"""
+        result = calculate_duration(start, end, unit)
+        assert result == expected
 
 
 class TestDatetimeRangeCheck:
@@ -491,45 +551,29 @@ class TestDatetimeRangeCheck:
 
     def test_is_datetime_in_range_within(self):
         """범위 내 날짜 테스트"""
-        start = datetime(2024, 1, 15)
-        end = datetime(2024, 1, 20)
+        start = MON_JAN15
+        end = SAT_JAN20
         check_date = datetime(2024, 1, 17)
         
         result = is_datetime_in_range(check_date, start, end)
         assert result is True
 
-    def test_is_datetime_in_range_boundary(self):
-        """경계 날짜 테스트"""
-        start = datetime(2024, 1, 15)
-        end = datetime(2024, 1, 20)
-        
-        # 시작 날짜
-        result = is_datetime_in_range(start, start, end)
-        assert result is True
-        
-        # 종료 날짜
-        result = is_datetime_in_range(end, start, end)
+    @pytest.mark.parametrize("boundary", [RANGE_START, RANGE_END])
+    def test_is_datetime_in_range_boundary(self, boundary):
+        """경계(시작/종료) 날짜 테스트"""
+        result = is_datetime_in_range(boundary, RANGE_START, RANGE_END)
         assert result is True
 
-    def test_is_datetime_in_range_outside(self):
-        """범위 밖 날짜 테스트"""
-        start = datetime(2024, 1, 15)
-        end = datetime(2024, 1, 20)
-        
-        # 시작 전
-        before = datetime(2024, 1, 10)
-        result = is_datetime_in_range(before, start, end)
-        assert result is False
-        
-        # 종료 후
-        after = datetime(2024, 1, 25)
-        result = is_datetime_in_range(after, start, end)
+    @pytest.mark.parametrize("outside", OUTSIDE_RANGE_DATES)
+    def test_is_datetime_in_range_outside(self, outside):
+        """범위 밖(시작 전/종료 후) 날짜 테스트"""
+        result = is_datetime_in_range(outside, RANGE_START, RANGE_END)
         assert result is False
 
     def test_is_datetime_in_range_inclusive_exclusive(self):
         """포함/배타적 범위 테스트"""
-        start = datetime(2024, 1, 15)
-        end = datetime(2024, 1, 20)
+        start = MON_JAN15
+        end = SAT_JAN20
         
         # 시작 날짜 - 배타적
         result = is_datetime_in_range(start, start, end, start_inclusive=False)
@@ -545,20 +589,21 @@ class TestEdgeCases:
 
     def test_leap_year_handling(self):
         """윤년 처리 테스트"""
-        # 2024는 윤년
+        # 2024는 윤년 (2023년 2월 29일은 EXPECTED_VALUE_ERRORS 에서 확인)
         leap_day = datetime(2024, 2, 29)
         assert leap_day.day == 29
-        
-        # 2023은 평년
+
+    @pytest.mark.parametrize("fn, args", EXPECTED_VALUE_ERRORS)
+    def test_expected_exceptions(self, fn, args):
+        """잘못된 입력(포맷/간격/단위/평년 2월 29일)에 대한 ValueError 테스트"""
         with pytest.raises(ValueError):
-            datetime(2023, 2, 29)
+            fn(*args)
 
-    def test_daylight_saving_time(self):
+    def test_daylight_saving_time(self, est):
         """일광절약시간 처리 테스트"""
         # 이 테스트는 시간대 라이브러리가 있을 때 더 정확하게 구현 가능
         # 현재는 기본적인 시간대 변환만 테스트
-        utc_dt = datetime(2024, 3, 10, 12, 0, 0, tzinfo=timezone.utc)
-        est = timezone(timedelta(hours=-5))
+        utc_dt = datetime(2024, 3, 10, 12, 0, 0, tzinfo=UTC)
         
         result = convert_timezone(utc_dt, est)
         assert result.hour == 7  # 12 - 5
@@ -598,18 +643,18 @@ class TestIntegration:
         parsed = parse_datetime(formatted)
         # 시간대 정보가 없는 경우 UTC로 설정
         if parsed.tzinfo is None:
-            parsed = parsed.replace(tzinfo=timezone.utc)
-        assert abs((parsed - current_utc).total_seconds()) < 1
+            parsed = parsed.replace(tzinfo=UTC)
+        assert abs(parsed - current_utc) < timedelta(seconds=1)
         
         # 4. 타임스탬프 변환
         timestamp = datetime_to_timestamp(current_utc)
         converted_back = timestamp_to_datetime(timestamp)
-        assert abs((converted_back - current_utc).total_seconds()) < 1
+        assert abs(converted_back - current_utc) < timedelta(seconds=1)
 
     def test_business_day_calculation_workflow(self):
         """영업일 계산 워크플로우 테스트"""
         # 월요일부터 시작
-        start_date = datetime(2024, 1, 15)  # 월요일
+        start_date = MON_JAN15  # 월요일
         
         # 5 영업일 추가
         end_date = add_business_days(start_date, 5)
@@ -618,21 +663,27 @@ class TestIntegration:
         assert is_business_day(end_date) is True
         
         # 범위 내 영업일 계산
+        date_range = get_date_range(start_date, end_date, 'days')
         business_days_count = 0
-        for single_date in get_date_range(start_date, end_date, 'days'):
+        for single_date in date_range:
             if is_business_day(single_date):
                 business_days_count += 1
         
         assert business_days_count == 6  # 시작일 포함 6일
+        
+        # 배열 일괄 계산도 같은 결과
+        dates = np.fromiter(date_range, dtype='datetime64[us]', count=len(date_range))
+        assert is_business_day_array(dates).sum() == 6
+        assert is_business_day(dates).tolist() == [
+            is_business_day(single_date) for single_date in date_range
+        ]
 
-    def test_timezone_conversion_workflow(self):
+    def test_timezone_conversion_workflow(self, kst, est):
         """시간대 변환 워크플로우 테스트"""
         # UTC 시간 생성
-        utc_time = datetime(2024, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+        utc_time = datetime(2024, 1, 15, 12, 0, 0, tzinfo=UTC)
         
         # 다양한 시간대로 변환
-        kst = timezone(timedelta(hours=9))
-        est = timezone(timedelta(hours=-5))
         
         kst_time = convert_timezone(utc_time, kst)
         est_time = convert_timezone(utc_time, est)
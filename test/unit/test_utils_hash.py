@@ -3,12 +3,11 @@
 """
 
 import pytest
-import tempfile
 import hashlib
-from pathlib import Path
 from io import BytesIO
 
 from src.utils.hash import (
+    HASH_CHUNK_SIZE,
     hash_text,
     hash_file,
     hash_file_stream,
@@ -19,31 +18,80 @@ from src.utils.hash import (
     get_supported_algorithms
 )
 
+# (알고리즘, 16진수 해시 길이)
+HASH_ALGORITHMS = [("sha256", 64), ("sha1", 40), ("md5", 32)]
+
+# 기본 해싱 속성 확인용 텍스트 (빈 문자열, ASCII, 한글, 이모지)
+HASH_TEXT_SAMPLES = [
+    "",
+    "Hello, World!",
+    "Test consistency",
+    "안녕하세요, 세계!",
+    "Hello 👋 World 🌍",
+]
+
+# 파일 해싱 테스트용 페이로드 (세션 픽스처가 한 번만 파일로 기록)
+FILE_PAYLOADS = {
+    "basic": b"Hello, File World!",
+    "large": b"A" * 10240,  # 10KB (청크 단위 읽기 확인)
+    "algorithms": b"Algorithm test content",
+    "verification": b"File verification test",
+    "text_consistency": "Consistency test between file and text hashing".encode('utf-8'),
+    "stream_consistency": b"Stream and file hash consistency test",
+    "unicode": "안녕하세요, 세계! 👋".encode('utf-8'),
+}
+
+
+def assert_hex_digest(digest: str, bits: int) -> None:
+    """digest 가 bits 길이의 16진수 해시 문자열인지 확인 (bytes.fromhex 디코딩)"""
+    assert len(digest) * 4 == bits
+    assert len(bytes.fromhex(digest)) * 8 == bits
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _warm_hash_algorithms() -> None:
+    """모듈 시작 시 해시 알고리즘을 한 번씩 초기화 (OpenSSL 지연 로딩 비용 선지불)"""
+    for algorithm, _ in HASH_ALGORITHMS:
+        hashlib.new(algorithm, b"").hexdigest()
+
+
+@pytest.fixture(scope="module")
+def known_hashes():
+    """기대값 쪽 SHA-256 해시를 hashlib 으로 한 번만 계산한 표"""
+    texts = (
+        "Verification test",
+        "Security test",
+        "Original document content",
+        "Modified document content",
+    )
+    return {text: hashlib.sha256(text.encode('utf-8')).hexdigest() for text in texts}
+
+
+@pytest.fixture(scope="session")
+def payload_files(tmp_path_factory):
+    """FILE_PAYLOADS 를 세션당 한 번만 파일로 기록하고 경로를 반환"""
+    directory = tmp_path_factory.mktemp("hash_fixtures")
+    paths = {}
+    for name, content in FILE_PAYLOADS.items():
+        path = directory / f"{name}.bin"
+        path.write_bytes(content)
+        paths[name] = path
+    return paths
+
 
 class TestHashText:
     """텍스트 해싱 테스트"""
 
-    def test_hash_text_basic(self):
-        """기본 텍스트 해싱 테스트"""
-        text = "Hello, World!"
+    @pytest.mark.parametrize("text", HASH_TEXT_SAMPLES)
+    def test_hash_text_properties(self, text):
+        """기본 해싱 속성 테스트 (형식, 일관성, 기대값)"""
         result = hash_text(text)
         
-        # SHA-256 해시 길이 확인
-        assert len(result) == 64
+        # SHA-256 16진수 문자열이며 같은 텍스트는 항상 같은 해시를 생성해야 함
         assert isinstance(result, str)
-        
-        # 16진수 문자열인지 확인
-        int(result, 16)  # 예외가 발생하지 않으면 유효한 16진수
-
-    def test_hash_text_consistency(self):
-        """해싱 일관성 테스트"""
-        text = "Test consistency"
-        
-        # 같은 텍스트는 항상 같은 해시를 생성해야 함
-        hash1 = hash_text(text)
-        hash2 = hash_text(text)
-        
-        assert hash1 == hash2
+        assert_hex_digest(result, 256)
+        assert hash_text(text) == result
+        assert result == hashlib.sha256(text.encode('utf-8')).hexdigest()
 
     def test_hash_text_different_inputs(self):
         """다른 입력에 대한 해싱 테스트"""
@@ -56,24 +104,27 @@ class TestHashText:
         # 다른 텍스트는 다른 해시를 생성해야 함
         assert hash1 != hash2
 
-    def test_hash_text_algorithms(self):
+    @pytest.mark.parametrize("algorithm, expected_length", HASH_ALGORITHMS)
+    def test_hash_text_algorithms(self, algorithm, expected_length):
         """다양한 알고리즘 테스트"""
         text = "Test algorithms"
         
+        result = hash_text(text, algorithm)
+        
+        assert_hex_digest(result, expected_length * 4)
+        assert result == hashlib.new(algorithm, text.encode('utf-8')).hexdigest()
+
+    def test_hash_text_algorithms_distinct(self):
+        """알고리즘별 해시 구분 테스트"""
+        text = "Test algorithms"
+        
         # SHA-256 (기본값)
         sha256_hash = hash_text(text)
-        assert len(sha256_hash) == 64
-        
-        # MD5
         md5_hash = hash_text(text, "md5")
-        assert len(md5_hash) == 32
-        
-        # SHA-1
         sha1_hash = hash_text(text, "sha1")
-        assert len(sha1_hash) == 40
         
         # 모든 해시가 다른지 확인
-        assert sha256_hash != md5_hash != sha1_hash
+        assert len({sha256_hash, md5_hash, sha1_hash}) == 3
 
     def test_hash_text_invalid_algorithm(self):
         """유효하지 않은 알고리즘 테스트"""
@@ -84,99 +135,60 @@ class TestHashText:
 
     def test_hash_text_unicode(self):
         """유니코드 텍스트 해싱 테스트"""
-        korean_text = "안녕하세요, 세계!"
-        emoji_text = "Hello 👋 World 🌍"
-        
-        korean_hash = hash_text(korean_text)
-        emoji_hash = hash_text(emoji_text)
+        korean_hash = hash_text("안녕하세요, 세계!")
+        emoji_hash = hash_text("Hello 👋 World 🌍")
         
-        assert len(korean_hash) == 64
-        assert len(emoji_hash) == 64
         assert korean_hash != emoji_hash
 
-    def test_hash_text_empty_string(self):
-        """빈 문자열 해싱 테스트"""
-        empty_hash = hash_text("")
-        
-        assert len(empty_hash) == 64
-        assert isinstance(empty_hash, str)
-
 
+@pytest.mark.slow
 class TestHashFile:
     """파일 해싱 테스트"""
 
-    def test_hash_file_basic(self):
+    def test_hash_file_basic(self, payload_files):
         """기본 파일 해싱 테스트"""
-        content = b"Hello, File World!"
-        
-        with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-            tmp_file.write(content)
-            tmp_file.flush()
-            
-            result = hash_file(tmp_file.name)
-            
-            assert len(result) == 64
-            assert isinstance(result, str)
-            
-            # 수동으로 계산한 해시와 비교
-            expected = hashlib.sha256(content).hexdigest()
-            assert result == expected
-        
-        # 임시 파일 정리
-        Path(tmp_file.name).unlink()
-
-    def test_hash_file_consistency(self):
+        result = hash_file(payload_files["basic"])
+        
+        assert isinstance(result, str)
+        assert_hex_digest(result, 256)
+        
+        # 수동으로 계산한 해시와 비교
+        expected = hashlib.sha256(FILE_PAYLOADS["basic"]).hexdigest()
+        assert result == expected
+
+    def test_hash_file_consistency(self, tmp_path):
         """파일 해싱 일관성 테스트"""
-        content = b"Consistency test content"
+        file_path = tmp_path / "consistency.bin"
+        file_path.write_bytes(b"Consistency test content")
         
-        with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-            tmp_file.write(content)
-            tmp_file.flush()
-            
-            hash1 = hash_file(tmp_file.name)
-            hash2 = hash_file(tmp_file.name)
-            
-            assert hash1 == hash2
+        hash1 = hash_file(file_path)
+        hash2 = hash_file(str(file_path))
         
-        Path(tmp_file.name).unlink()
+        # 같은 파일은 경로 형식(Path/str)과 무관하게 같은 해시를 생성해야 함
+        assert hash1 == hash2
 
     def test_hash_file_not_found(self):
         """존재하지 않는 파일 테스트"""
         with pytest.raises(FileNotFoundError, match="파일을 찾을 수 없습니다"):
             hash_file("non_existent_file.txt")
 
-    def test_hash_file_large_file(self):
+    def test_hash_file_large_file(self, payload_files):
         """큰 파일 해싱 테스트 (청크 단위 읽기 확인)"""
-        # 10KB 파일 생성
-        content = b"A" * 10240
+        result = hash_file(payload_files["large"])
+        expected = hashlib.sha256(FILE_PAYLOADS["large"]).hexdigest()
         
-        with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-            tmp_file.write(content)
-            tmp_file.flush()
-            
-            result = hash_file(tmp_file.name)
-            expected = hashlib.sha256(content).hexdigest()
-            
-            assert result == expected
-        
-        Path(tmp_file.name).unlink()
+        assert result == expected
 
-    def test_hash_file_different_algorithms(self):
+    @pytest.mark.parametrize("algorithm, expected_length", HASH_ALGORITHMS)
+    def test_hash_file_different_algorithms(
+        self, payload_files, algorithm, expected_length
+    ):
         """다양한 알고리즘으로 파일 해싱 테스트"""
-        content = b"Algorithm test content"
+        result = hash_file(payload_files["algorithms"], algorithm)
         
-        with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-            tmp_file.write(content)
-            tmp_file.flush()
-            
-            sha256_hash = hash_file(tmp_file.name, "sha256")
-            md5_hash = hash_file(tmp_file.name, "md5")
-            
-            assert len(sha256_hash) == 64
-            assert len(md5_hash) == 32
-            assert sha256_hash != md5_hash
-        
-        Path(tmp_file.name).unlink()
+        assert len(result) == expected_length
+        expected = hashlib.new(algorithm, FILE_PAYLOADS["algorithms"]).hexdigest()
+        assert result == expected
 
 
 class TestHashFileStream:
@@ -207,6 +219,16 @@ class TestHashFileStream:
         # 원래 위치로 복원되었는지 확인
         assert stream.tell() == original_position
 
+    def test_hash_file_stream_multichunk(self):
+        """여러 청크에 걸친 스트림 해싱 테스트 (마지막 청크는 일부만 채움)"""
+        content = b"A" * (HASH_CHUNK_SIZE * 4 + 7)
+        stream = BytesIO(content)
+        
+        result = hash_file_stream(stream)
+        expected = hashlib.sha256(content).hexdigest()
+        
+        assert result == expected
+
     def test_hash_file_stream_empty(self):
         """빈 스트림 해싱 테스트"""
         stream = BytesIO(b"")
@@ -217,13 +239,28 @@ class TestHashFileStream:
         assert result == expected
 
 
+@pytest.mark.slow
+class TestHashThroughput:
+    """해싱 처리량 벤치마크 (pytest-benchmark 설치 시에만 실행)"""
+
+    def test_hash_file_stream_throughput(self, request):
+        """1MiB 스트림 청크 해싱 처리량 측정"""
+        pytest.importorskip("pytest_benchmark")
+        benchmark = request.getfixturevalue("benchmark")
+        content = b"\0" * (1 << 20)
+        
+        result = benchmark(hash_file_stream, BytesIO(content))
+        
+        assert result == hashlib.sha256(content).hexdigest()
+
+
 class TestVerifyHash:
     """해시 검증 테스트"""
 
-    def test_verify_hash_valid(self):
+    def test_verify_hash_valid(self, known_hashes):
         """유효한 해시 검증 테스트"""
         text = "Verification test"
-        expected_hash = hash_text(text)
+        expected_hash = known_hashes[text]
         
         assert verify_hash(text, expected_hash) is True
 
@@ -234,10 +271,10 @@ class TestVerifyHash:
         
         assert verify_hash(text, wrong_hash) is False
 
-    def test_verify_hash_timing_attack_safe(self):
+    def test_verify_hash_timing_attack_safe(self, known_hashes):
         """타이밍 공격 안전성 테스트 (hmac.compare_digest 사용)"""
         text = "Security test"
-        correct_hash = hash_text(text)
+        correct_hash = known_hashes[text]
         wrong_hash = "f" * 64
         
         # 두 검증 모두 안전하게 처리되어야 함
@@ -245,51 +282,43 @@ class TestVerifyHash:
         assert verify_hash(text, wrong_hash) is False
 
 
+@pytest.mark.slow
 class TestVerifyFileHash:
     """파일 해시 검증 테스트"""
 
-    def test_verify_file_hash_valid(self):
+    def test_verify_file_hash_valid(self, payload_files):
         """유효한 파일 해시 검증 테스트"""
-        content = b"File verification test"
-        
-        with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-            tmp_file.write(content)
-            tmp_file.flush()
-            
-            expected_hash = hash_file(tmp_file.name)
-            assert verify_file_hash(tmp_file.name, expected_hash) is True
-        
-        Path(tmp_file.name).unlink()
+        expected_hash = hash_file(payload_files["verification"])
+        assert verify_file_hash(payload_files["verification"], expected_hash) is True
 
-    def test_verify_file_hash_invalid(self):
+    def test_verify_file_hash_invalid(self, payload_files):
         """유효하지 않은 파일 해시 검증 테스트"""
-        content = b"File verification test"
-        
-        with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-            tmp_file.write(content)
-            tmp_file.flush()
-            
-            wrong_hash = "0" * 64
-            assert verify_file_hash(tmp_file.name, wrong_hash) is False
-        
-        Path(tmp_file.name).unlink()
+        wrong_hash = "0" * 64
+        assert verify_file_hash(payload_files["verification"], wrong_hash) is False
 
 
 class TestGenerateContentHash:
     """콘텐츠 해시 생성 테스트"""
 
-    def test_generate_content_hash_normalization(self):
+    @pytest.fixture(scope="class")
+    def canonical_hash(self):
+        """정규화 기준 문자열의 콘텐츠 해시 (클래스당 한 번 계산)"""
+        return generate_content_hash("Hello World")
+
+    @pytest.mark.parametrize("variant", [
+        "Hello World",
+        "Hello    World",
+        "  Hello   World  ",
+        "Hello\tWorld",
+        "Hello\nWorld",
+        "Hello\r\nWorld",
+        "Hello\u00a0World",  # NBSP
+        "\tHello \n World\n",
+    ])
+    def test_generate_content_hash_normalization(self, canonical_hash, variant):
         """공백 정규화 테스트"""
-        text1 = "Hello    World"
-        text2 = "Hello World"
-        text3 = "  Hello   World  "
-        
-        hash1 = generate_content_hash(text1)
-        hash2 = generate_content_hash(text2)
-        hash3 = generate_content_hash(text3)
-        
         # 공백이 정규화되어 같은 해시가 생성되어야 함
-        assert hash1 == hash2 == hash3
+        assert generate_content_hash(variant) == canonical_hash
 
     def test_generate_content_hash_different_content(self):
         """다른 콘텐츠 해시 테스트"""
@@ -357,52 +386,26 @@ class TestGetSupportedAlgorithms:
 class TestIntegration:
     """통합 테스트"""
 
-    def test_file_and_text_hash_consistency(self):
-        """파일과 텍스트 해시 일관성 테스트"""
-        text = "Consistency test between file and text hashing"
-        content = text.encode('utf-8')
-        
-        # 텍스트 해시
-        text_hash = hash_text(text)
-        
-        # 파일 해시
-        with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-            tmp_file.write(content)
-            tmp_file.flush()
-            
-            file_hash = hash_file(tmp_file.name)
-        
-        Path(tmp_file.name).unlink()
-        
-        # 같은 내용이므로 같은 해시가 생성되어야 함
-        assert text_hash == file_hash
-
-    def test_stream_and_file_hash_consistency(self):
-        """스트림과 파일 해시 일관성 테스트"""
-        content = b"Stream and file hash consistency test"
-        
-        # 파일 해시
-        with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-            tmp_file.write(content)
-            tmp_file.flush()
-            
-            file_hash = hash_file(tmp_file.name)
-        
-        Path(tmp_file.name).unlink()
-        
-        # 스트림 해시
-        stream = BytesIO(content)
-        stream_hash = hash_file_stream(stream)
+    @pytest.mark.slow
+    @pytest.mark.parametrize(
+        "payload_name", ["text_consistency", "stream_consistency", "unicode"]
+    )
+    def test_text_file_stream_hash_consistency(self, payload_files, payload_name):
+        """텍스트/파일/스트림 해시가 같은 바이트의 hashlib 해시와 일치하는지 테스트"""
+        content = FILE_PAYLOADS[payload_name]
+        expected = hashlib.sha256(content).hexdigest()
         
-        # 같은 내용이므로 같은 해시가 생성되어야 함
-        assert file_hash == stream_hash
+        assert hash_text(content.decode('utf-8')) == expected
+        assert hash_file(payload_files[payload_name]) == expected
+        assert hash_file_stream(BytesIO(content)) == expected
 
-    def test_hash_verification_workflow(self):
+    def test_hash_verification_workflow(self, known_hashes):
         """해시 검증 워크플로우 테스트"""
         original_text = "Original document content"
         
-        # 1. 원본 해시 생성
+        # 1. 원본 해시 생성 (실제 호출 결과가 기준값과 같은지 확인)
         original_hash = hash_text(original_text)
+        assert original_hash == known_hashes[original_text]
         
         # 2. 해시 검증 (성공)
         assert verify_hash(original_text, original_hash) is True
@@ -411,8 +414,8 @@ class TestIntegration:
         modified_text = "Modified document content"
         assert verify_hash(modified_text, original_hash) is False
         
-        # 4. 새로운 해시 생성
-        new_hash = hash_text(modified_text)
+        # 4. 새로운 해시로 검증 (성공)
+        new_hash = known_hashes[modified_text]
         assert verify_hash(modified_text, new_hash) is True
         
         # 5. 원본과 새 해시는 달라야 함